@@ -0,0 +1,64 @@
+# application/responses/bulk_enrollment_report.py
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from domain.exceptions.domain_exceptions import DomainError
+
+
+@dataclass(frozen=True, slots=True)
+class EnrollmentResult:
+    """Outcome of a single (student, course) pair in a bulk enrollment."""
+
+    student_id: str
+    course_code: str
+    error: Optional[DomainError] = None
+    # Bulk registration only: accepted onto the waitlist, not enrolled.
+    waitlisted: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BulkEnrollmentReport:
+    """
+    Use-case response for StudentManagementSystem.enroll_students_in_courses
+    and register_students_in_courses.
+
+    Holds one EnrollmentResult per input pair, in input order. Failed pairs
+    carry the specific EnrollmentError / EntityNotFoundError that was raised
+    for them; they never abort the rest of the batch.
+    """
+
+    results: List[EnrollmentResult] = field(default_factory=list)
+
+    def record(
+            self,
+            student_id: str,
+            course_code: str,
+            error: Optional[DomainError] = None,
+            waitlisted: bool = False,
+    ) -> None:
+        self.results.append(EnrollmentResult(student_id, course_code, error, waitlisted))
+
+    @property
+    def succeeded(self) -> Tuple[EnrollmentResult, ...]:
+        return tuple(r for r in self.results if r.error is None)
+
+    @property
+    def failed(self) -> Tuple[EnrollmentResult, ...]:
+        return tuple(r for r in self.results if r.error is not None)
+
+    @property
+    def waitlisted(self) -> Tuple[EnrollmentResult, ...]:
+        return tuple(r for r in self.results if r.waitlisted)
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for r in self.results if r.error is None)
+
+    @property
+    def failure_count(self) -> int:
+        return len(self.results) - self.success_count
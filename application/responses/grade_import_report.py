@@ -0,0 +1,35 @@
+# application/responses/grade_import_report.py
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# Rejection reasons, in the order they are checked.
+OUT_OF_RANGE = "out_of_range"
+UNKNOWN_STUDENT = "unknown_student"
+UNKNOWN_COURSE = "unknown_course"
+NOT_ENROLLED = "not_enrolled"
+
+
+@dataclass(slots=True)
+class GradeImportReport:
+    """
+    Use-case response for StudentManagementSystem.import_grades.
+
+    Kept compact for million-row uploads: accepted rows are only counted,
+    and rejected rows are stored as input row indices grouped by reason.
+    """
+
+    accepted_count: int = 0
+    rejected: Dict[str, List[int]] = field(default_factory=dict)
+
+    def reject(self, reason: str, row: int) -> None:
+        self.rejected.setdefault(reason, []).append(row)
+
+    @property
+    def rejected_count(self) -> int:
+        return sum(len(rows) for rows in self.rejected.values())
+
+    @property
+    def rejected_rows(self) -> List[int]:
+        """All rejected row indices, in input order."""
+        return sorted(row for rows in self.rejected.values() for row in rows)
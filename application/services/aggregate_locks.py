@@ -0,0 +1,80 @@
+# application/services/aggregate_locks.py
+
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Iterable, Iterator, List
+
+
+class AggregateLocks:
+    """
+    Striped per-aggregate locks for StudentManagementSystem's thread-safe mode.
+
+    Each course, student and teacher id hashes to one of ``stripes`` locks
+    of its kind, so the number of locks stays fixed however many entities
+    exist. hold() always acquires in one global order, courses first, then
+    students, then teachers, each kind by stripe number. Use cases that
+    only touch different aggregates (e.g. enrollments into different
+    courses) therefore run in parallel, and no two use cases can deadlock.
+
+    hold() may be nested to lock aggregates discovered under an outer lock
+    (e.g. a course's roster), provided the inner call only takes kinds that
+    come later in the order. hold_all() takes every lock, in the same
+    order, to quiesce all use cases (e.g. for a checkpoint). A thread
+    must not call hold_all() while it holds any lock; held() tells.
+    """
+
+    __slots__ = ("_stripes", "_courses", "_students", "_teachers", "_local")
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._stripes = stripes
+        self._courses = [threading.Lock() for _ in range(stripes)]
+        self._students = [threading.Lock() for _ in range(stripes)]
+        self._teachers = [threading.Lock() for _ in range(stripes)]
+        # How many hold()/hold_all() blocks the current thread is inside.
+        self._local = threading.local()
+
+    @contextmanager
+    def hold(
+            self,
+            courses: Iterable[str] = (),
+            students: Iterable[str] = (),
+            teachers: Iterable[str] = (),
+    ) -> Iterator[None]:
+        with ExitStack() as stack:
+            for lock in self._ordered(courses, students, teachers):
+                stack.enter_context(lock)
+            with self._holding():
+                yield
+
+    @contextmanager
+    def hold_all(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for lock in (*self._courses, *self._students, *self._teachers):
+                stack.enter_context(lock)
+            with self._holding():
+                yield
+
+    def held(self) -> bool:
+        """Whether the current thread is inside a hold() or hold_all() block."""
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def _holding(self) -> Iterator[None]:
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+
+    def _ordered(
+            self, courses: Iterable[str], students: Iterable[str], teachers: Iterable[str]
+    ) -> List[threading.Lock]:
+        locks: List[threading.Lock] = []
+        for stripes, keys in (
+                (self._courses, courses),
+                (self._students, students),
+                (self._teachers, teachers),
+        ):
+            for stripe in sorted({hash(key) % self._stripes for key in keys}):
+                locks.append(stripes[stripe])
+        return locks
@@ -0,0 +1,460 @@
+# application/services/async_student_management_system.py
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+from application.responses.bulk_enrollment_report import BulkEnrollmentReport
+from application.responses.grade_import_report import GradeImportReport
+from application.services import bulk_operations
+from application.services.grade_validation import check_grade_columns
+from application.services.transaction import Transaction
+from domain.exceptions.domain_exceptions import EntityNotFoundError
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.models.course import Course
+from domain.models.grade_stats import GradeSummary
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_teacher_repository import AsyncTeacherRepository
+from domain.repositories.async_course_repository import AsyncCourseRepository
+from domain.repositories.async_base_repository import AsyncBaseRepository
+from domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from domain.repositories.pagination import Page
+from domain.repositories.queries import CourseQuery, StudentQuery, TeacherQuery
+
+T = TypeVar("T")
+
+
+class AsyncStudentManagementSystem:
+    """
+    Asyncio counterpart of StudentManagementSystem: the same use cases,
+    rules and transaction semantics over the async repository ports.
+
+    - Independent lookups are awaited concurrently (asyncio.gather), e.g.
+      the student and course of an enrollment, or every distinct id of a
+      bulk operation.
+    - Domain operations run synchronously between awaits, so an aggregate
+      is never seen half-changed by another task.
+    - The open transaction is per task (a ContextVar); tasks spawned inside
+      a transaction block join it.
+    - The bulk and cleanup use cases share their domain steps with the
+      synchronous service (see bulk_operations).
+    """
+
+    def __init__(
+            self,
+            student_repo: AsyncStudentRepository,
+            teacher_repo: AsyncTeacherRepository,
+            course_repo: AsyncCourseRepository,
+            unit_of_work: Optional[AsyncUnitOfWork] = None,
+    ) -> None:
+        self.student_repo = student_repo
+        self.teacher_repo = teacher_repo
+        self.course_repo = course_repo
+        self.unit_of_work = unit_of_work
+        self._transaction: ContextVar[Optional[Transaction]] = ContextVar(
+            "async_sms_transaction", default=None
+        )
+
+    # ---------- Transactions ----------
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Run several use cases as one atomic unit:
+
+            async with sms.transaction():
+                await sms.add_student("S01", "Alice")
+                await sms.enroll_student_in_course("S01", "C01")
+
+        See StudentManagementSystem.transaction for the semantics.
+        """
+        if self._transaction.get() is not None:
+            yield
+            return
+
+        transaction = Transaction()
+        token = self._transaction.set(transaction)
+        if self.unit_of_work is not None:
+            await self.unit_of_work.begin()
+        try:
+            yield
+            for repo in (self.course_repo, self.student_repo, self.teacher_repo):
+                for entity in transaction.take_dirty(repo):
+                    await repo.update(entity)
+            if self.unit_of_work is not None:
+                await self.unit_of_work.commit()
+        except BaseException:
+            for undo in transaction.rollback_aggregates():
+                await undo()
+            if self.unit_of_work is not None:
+                await self.unit_of_work.rollback()
+            raise
+        finally:
+            self._transaction.reset(token)
+
+    # ---------- Create / Read ----------
+    async def add_student(self, student_id: str, name: str) -> Student:
+        student = Student(student_id, name)
+        await self._add(self.student_repo, student, student_id)
+        return student
+
+    async def add_teacher(self, teacher_id: str, name: str) -> Teacher:
+        teacher = Teacher(teacher_id, name)
+        await self._add(self.teacher_repo, teacher, teacher_id)
+        return teacher
+
+    async def add_course(
+            self, course_code: str, name: str, capacity: Optional[int] = None
+    ) -> Course:
+        course = Course(course_code, name, capacity)
+        await self._add(self.course_repo, course, course_code)
+        return course
+
+    async def get_student(self, student_id: str) -> Student:
+        return await self.student_repo.get(student_id)
+
+    async def get_teacher(self, teacher_id: str) -> Teacher:
+        return await self.teacher_repo.get(teacher_id)
+
+    async def get_course(self, code: str) -> Course:
+        return await self.course_repo.get(code)
+
+    async def list_students(self) -> Iterable[Student]:
+        return await self.student_repo.list_all()
+
+    async def list_teachers(self) -> Iterable[Teacher]:
+        return await self.teacher_repo.list_all()
+
+    async def list_courses(self) -> Iterable[Course]:
+        return await self.course_repo.list_all()
+
+    async def list_students_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        return await self.student_repo.list_page(limit, after_id)
+
+    async def list_teachers_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        return await self.teacher_repo.list_page(limit, after_id)
+
+    async def list_courses_page(self, limit: int, after_code: Optional[str] = None) -> Page[Course]:
+        return await self.course_repo.list_page(limit, after_code)
+
+    def stream_students(self, batch_size: int = 1000) -> AsyncIterator[Student]:
+        return self.student_repo.stream(batch_size)
+
+    def stream_teachers(self, batch_size: int = 1000) -> AsyncIterator[Teacher]:
+        return self.teacher_repo.stream(batch_size)
+
+    def stream_courses(self, batch_size: int = 1000) -> AsyncIterator[Course]:
+        return self.course_repo.stream(batch_size)
+
+    async def find_students(self, query: StudentQuery) -> Tuple[Student, ...]:
+        return await self.student_repo.find(query)
+
+    async def find_teachers(self, query: TeacherQuery) -> Tuple[Teacher, ...]:
+        return await self.teacher_repo.find(query)
+
+    async def find_courses(self, query: CourseQuery) -> Tuple[Course, ...]:
+        return await self.course_repo.find(query)
+
+    # ---------- Bulk import ----------
+    async def import_students(self, rows: Iterable[Sequence[str]]) -> int:
+        """
+        See StudentManagementSystem.import_students. The async ports have
+        no add_many: the students are added one by one in a transaction,
+        so a duplicate adds none of them.
+        """
+        students = bulk_operations.students_from_rows(rows)
+        await self._add_all(self.student_repo, students, [student.id for student in students])
+        return len(students)
+
+    async def import_teachers(self, rows: Iterable[Sequence[str]]) -> int:
+        """Add teachers from (teacher_id, name) rows; see import_students()."""
+        teachers = bulk_operations.teachers_from_rows(rows)
+        await self._add_all(self.teacher_repo, teachers, [teacher.id for teacher in teachers])
+        return len(teachers)
+
+    async def import_courses(self, rows: Iterable[Sequence]) -> int:
+        """
+        Add courses from (course_code, name[, capacity]) rows; see
+        import_students().
+        """
+        courses = bulk_operations.courses_from_rows(rows)
+        await self._add_all(self.course_repo, courses, [course.code for course in courses])
+        return len(courses)
+
+    async def import_enrollments(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        See StudentManagementSystem.import_enrollments. Every distinct id is
+        looked up concurrently before anything changes.
+        """
+        groups = bulk_operations.group_by_course(pairs)
+        students, courses = await asyncio.gather(
+            self._resolve_all(
+                self.student_repo, {s for student_ids in groups.values() for s in student_ids}
+            ),
+            self._resolve_all(self.course_repo, groups),
+        )
+        count = 0
+        for course, batch in bulk_operations.resolve_groups(
+                groups, _found(students), _found(courses)
+        ):
+            bulk_operations.enroll_group(course, batch, self._touch)
+            await self._write(self.course_repo, course)
+            count += len(batch)
+        return count
+
+    # ---------- Delete (with cleanup via aggregate root) ----------
+    async def remove_course(self, course_code: str) -> None:
+        """See StudentManagementSystem.remove_course."""
+        async with self.transaction():
+            course = await self.get_course(course_code)
+            self._touch(course, course.teacher, *course.students_view, *course.waitlist)
+            course.detach_all()
+            await self._remove(self.course_repo, course, course_code)
+
+    async def remove_student(self, student_id: str) -> None:
+        """See StudentManagementSystem.remove_student."""
+        async with self.transaction():
+            student = await self.get_student(student_id)
+            for course in bulk_operations.withdraw_student(student, self._touch):
+                self._save(self.course_repo, course)
+            await self._remove(self.student_repo, student, student_id)
+
+    async def remove_teacher(self, teacher_id: str) -> None:
+        """See StudentManagementSystem.remove_teacher."""
+        async with self.transaction():
+            teacher = await self.get_teacher(teacher_id)
+            for course in bulk_operations.unassign_teacher_everywhere(teacher, self._touch):
+                self._save(self.course_repo, course)
+            await self._remove(self.teacher_repo, teacher, teacher_id)
+
+    # ---------- Orchestration of domain operations ----------
+    async def assign_teacher_to_course(self, teacher_id: str, course_code: str) -> None:
+        teacher, course = await asyncio.gather(
+            self.get_teacher(teacher_id), self.get_course(course_code)
+        )
+        self._touch(course, teacher)
+        course.assign_teacher(teacher)
+        await self._write(self.course_repo, course)
+
+    async def unassign_teacher_from_course(self, course_code: str) -> None:
+        course = await self.get_course(course_code)
+        self._touch(course, course.teacher)
+        course.unassign_teacher()
+        await self._write(self.course_repo, course)
+
+    async def enroll_student_in_course(self, student_id: str, course_code: str) -> None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(course, student)
+        course.enroll(student)
+        await self._write(self.course_repo, course)
+
+    async def enroll_students_in_courses(
+            self, pairs: Iterable[Tuple[str, str]]
+    ) -> BulkEnrollmentReport:
+        """
+        See StudentManagementSystem.enroll_students_in_courses. All distinct
+        students and courses are looked up concurrently before enrolling.
+        """
+        pairs = list(pairs)
+        students, courses = await asyncio.gather(
+            self._resolve_all(self.student_repo, {s for s, _ in pairs}),
+            self._resolve_all(self.course_repo, {c for _, c in pairs}),
+        )
+        report, modified = bulk_operations.enroll_pairs(
+            pairs, students.__getitem__, courses.__getitem__, self._touch
+        )
+        await asyncio.gather(*(self._write(self.course_repo, c) for c in modified.values()))
+        return report
+
+    async def drop_student_from_course(self, student_id: str, course_code: str) -> None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(course, student, course.next_waitlisted)
+        course.drop(student)
+        await asyncio.gather(
+            self._write(self.course_repo, course),
+            self._write(self.student_repo, student),    # dropping also discards the grade
+        )
+
+    # ---------- Capacity and waitlists ----------
+    async def set_course_capacity(self, course_code: str, capacity: Optional[int]) -> None:
+        """See StudentManagementSystem.set_course_capacity."""
+        course = await self.get_course(course_code)
+        self._touch(course, *course.waitlist)
+        course.set_capacity(capacity)
+        await self._write(self.course_repo, course)
+
+    async def register_student_in_course(
+            self, student_id: str, course_code: str, priority: float = 0.0
+    ) -> bool:
+        """See StudentManagementSystem.register_student_in_course."""
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(course, student)
+        enrolled = course.register(student, priority)
+        await self._write(self.course_repo, course)
+        return enrolled
+
+    async def register_students_in_courses(
+            self, requests: Iterable[Tuple[str, str, float]]
+    ) -> BulkEnrollmentReport:
+        """
+        See StudentManagementSystem.register_students_in_courses. All
+        distinct students and courses are looked up concurrently first.
+        """
+        requests = list(requests)
+        students, courses = await asyncio.gather(
+            self._resolve_all(self.student_repo, {s for s, _, _ in requests}),
+            self._resolve_all(self.course_repo, {c for _, c, _ in requests}),
+        )
+        report, modified = bulk_operations.register_requests(
+            requests, students.__getitem__, courses.__getitem__, self._touch
+        )
+        await asyncio.gather(*(self._write(self.course_repo, c) for c in modified.values()))
+        return report
+
+    async def leave_waitlist(self, student_id: str, course_code: str) -> None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(course, student)
+        course.leave_waitlist(student)
+        await self._write(self.course_repo, course)
+
+    async def clear_waitlists(self, course_codes: Iterable[str]) -> int:
+        """See StudentManagementSystem.clear_waitlists."""
+        removed = 0
+        async with self.transaction():
+            courses = await asyncio.gather(
+                *(self.get_course(course_code) for course_code in dict.fromkeys(course_codes))
+            )
+            for course in courses:
+                cleared = bulk_operations.clear_waitlist(course, self._touch)
+                if cleared:
+                    removed += cleared
+                    self._save(self.course_repo, course)
+        return removed
+
+    # ---------- Grades ----------
+    async def assign_grade_to_student(
+            self, student_id: str, course_code: str, value: float
+    ) -> None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(student)
+        student.assign_grade(course, value)
+        await self._write(self.student_repo, student)
+
+    async def import_grades(
+            self,
+            student_ids: Sequence[str],
+            course_codes: Sequence[str],
+            values: Sequence[float],
+    ) -> GradeImportReport:
+        """
+        See StudentManagementSystem.import_grades. All distinct students and
+        courses are looked up concurrently before any grade is written.
+        """
+        check_grade_columns(student_ids, course_codes, values)
+        students, courses = await asyncio.gather(
+            self._resolve_all(self.student_repo, set(student_ids)),
+            self._resolve_all(self.course_repo, set(course_codes)),
+        )
+        report, modified = bulk_operations.assign_grade_rows(
+            student_ids, course_codes, values,
+            students.__getitem__, courses.__getitem__, self._touch,
+        )
+        await asyncio.gather(*(self._write(self.student_repo, s) for s in modified.values()))
+        return report
+
+    async def remove_grade_from_student(self, student_id: str, course_code: str) -> None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        self._touch(student)
+        student.remove_grade(course)
+        await self._write(self.student_repo, student)
+
+    async def get_student_grade(self, student_id: str, course_code: str) -> float | None:
+        student, course = await asyncio.gather(
+            self.get_student(student_id), self.get_course(course_code)
+        )
+        return student.get_grade(course)
+
+    async def get_student_gpa(self, student_id: str) -> float | None:
+        return (await self.get_student(student_id)).gpa
+
+    async def get_course_grade_summary(self, course_code: str) -> GradeSummary:
+        return (await self.get_course(course_code)).grade_summary
+
+    # ---------- Internal helpers ----------
+    def _touch(self, *entities) -> None:
+        transaction = self._transaction.get()
+        if transaction is not None:
+            for entity in entities:
+                if entity is not None:
+                    transaction.touch(entity)
+
+    def _save(self, repo: AsyncBaseRepository, entity) -> None:
+        """Buffer a write-back; only valid inside a transaction."""
+        self._transaction.get().mark_dirty(repo, entity)
+
+    async def _write(self, repo: AsyncBaseRepository, entity) -> None:
+        """Write ``entity`` back now, or once at commit inside a transaction."""
+        transaction = self._transaction.get()
+        if transaction is None:
+            await repo.update(entity)
+        else:
+            transaction.mark_dirty(repo, entity)
+
+    async def _add(self, repo: AsyncBaseRepository, entity, key: str) -> None:
+        await repo.add(entity)
+        transaction = self._transaction.get()
+        if transaction is not None:
+            transaction.on_rollback(lambda: repo.remove(key))
+
+    async def _add_all(self, repo: AsyncBaseRepository, entities: Sequence, keys: List[str]) -> None:
+        # One at a time: a duplicate within the batch must fail the same way
+        # as one already stored, and roll back the entities before it.
+        async with self.transaction():
+            for entity, key in zip(entities, keys):
+                await self._add(repo, entity, key)
+
+    async def _remove(self, repo: AsyncBaseRepository, entity, key: str) -> None:
+        await repo.remove(key)
+        transaction = self._transaction.get()
+        if transaction is not None:
+            transaction.forget(repo, entity)
+            transaction.on_rollback(lambda: repo.add(entity))
+
+    @staticmethod
+    async def _resolve_all(
+            repo: AsyncBaseRepository[T, str], keys: Iterable[str]
+    ) -> Dict[str, T | EntityNotFoundError]:
+        """
+        Look up every key concurrently. Misses are returned as the
+        EntityNotFoundError instead of being raised.
+        """
+        keys = list(keys)
+        results = await asyncio.gather(*(repo.get(key) for key in keys), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, EntityNotFoundError):
+                raise result
+        return dict(zip(keys, results))
+
+
+def _found(resolved: Dict[str, T | EntityNotFoundError]) -> Callable[[str], T]:
+    """Lookup over _resolve_all() results that raises a miss instead."""
+    def find(key: str) -> T:
+        entity = resolved[key]
+        if isinstance(entity, EntityNotFoundError):
+            raise entity
+        return entity
+    return find
@@ -0,0 +1,311 @@
+# application/services/bulk_operations.py
+"""
+The storage-independent steps of the bulk and cleanup use cases, shared
+by StudentManagementSystem and AsyncStudentManagementSystem so both apply
+the same rules and produce the same reports and events; each service only
+adds its own lookups, locking and write-backs around them.
+
+The steps work on entities the caller has already looked up:
+
+- ``student_of`` / ``course_of`` map an id to its entity. In the report
+  producing batches an unknown id maps to its EntityNotFoundError
+  (returned, not raised), so it is reported and the batch carries on.
+- ``touch`` is called with entities before they change (transaction
+  capture); ``record``, if given, with the domain events of each change
+  (journal). Without it no events are built.
+
+The caller writes back what a step changed; steps that decide what
+changes return those entities.
+"""
+
+import gc
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+from application.responses.bulk_enrollment_report import BulkEnrollmentReport
+from application.responses.grade_import_report import (
+    GradeImportReport,
+    OUT_OF_RANGE,
+    UNKNOWN_STUDENT,
+    UNKNOWN_COURSE,
+    NOT_ENROLLED,
+)
+from application.services.grade_validation import out_of_range_rows
+from domain.events.domain_events import (
+    CapacitySet,
+    CourseAdded,
+    DomainEvent,
+    Enrolled,
+    GradeAssigned,
+    StudentAdded,
+    TeacherAdded,
+    WaitlistCleared,
+    Waitlisted,
+)
+from domain.exceptions.domain_exceptions import EnrollmentError, EntityNotFoundError
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+
+T = TypeVar("T")
+
+Lookup = Callable[[str], T | EntityNotFoundError]
+Touch = Callable[..., None]
+Record = Callable[..., None]
+
+
+# ---------- Batches reported per row ----------
+def enroll_pairs(
+        pairs: Iterable[Tuple[str, str]],
+        student_of: Lookup[Student],
+        course_of: Lookup[Course],
+        touch: Touch,
+        record: Optional[Record] = None,
+) -> Tuple[BulkEnrollmentReport, Dict[str, Course]]:
+    """Course.enroll every (student_id, course_code) pair; see enroll_students_in_courses."""
+    report = BulkEnrollmentReport()
+    modified: Dict[str, Course] = {}
+    for student_id, course_code in pairs:
+        student = student_of(student_id)
+        if isinstance(student, EntityNotFoundError):
+            report.record(student_id, course_code, student)
+            continue
+        course = course_of(course_code)
+        if isinstance(course, EntityNotFoundError):
+            report.record(student_id, course_code, course)
+            continue
+
+        try:
+            touch(course, student)
+            course.enroll(student)
+        except EnrollmentError as error:
+            report.record(student_id, course_code, error)
+        else:
+            if record is not None:
+                record(Enrolled(student_id, course_code))
+            report.record(student_id, course_code)
+            modified[course_code] = course
+    return report, modified
+
+
+def register_requests(
+        requests: Iterable[Tuple[str, str, float]],
+        student_of: Lookup[Student],
+        course_of: Lookup[Course],
+        touch: Touch,
+        record: Optional[Record] = None,
+) -> Tuple[BulkEnrollmentReport, Dict[str, Course]]:
+    """Course.register every (student_id, course_code, priority) request."""
+    report = BulkEnrollmentReport()
+    modified: Dict[str, Course] = {}
+    for student_id, course_code, priority in requests:
+        student = student_of(student_id)
+        if isinstance(student, EntityNotFoundError):
+            report.record(student_id, course_code, student)
+            continue
+        course = course_of(course_code)
+        if isinstance(course, EntityNotFoundError):
+            report.record(student_id, course_code, course)
+            continue
+
+        try:
+            touch(course, student)
+            enrolled = course.register(student, priority)
+        except EnrollmentError as error:
+            report.record(student_id, course_code, error)
+        else:
+            if record is not None:
+                record(Enrolled(student_id, course_code) if enrolled
+                       else Waitlisted(student_id, course_code, priority))
+            report.record(student_id, course_code, waitlisted=not enrolled)
+            modified[course_code] = course
+    return report, modified
+
+
+def assign_grade_rows(
+        student_ids: Sequence[str],
+        course_codes: Sequence[str],
+        values: Sequence[float],
+        student_of: Lookup[Student],
+        course_of: Lookup[Course],
+        touch: Touch,
+        record: Optional[Record] = None,
+) -> Tuple[GradeImportReport, Dict[str, Student]]:
+    """
+    Student.assign_grade for every valid row of a columnar upload; see
+    import_grades. The grade range is checked for the whole batch first.
+    """
+    report = GradeImportReport()
+    out_of_range = out_of_range_rows(values)
+    for row in out_of_range:
+        report.reject(OUT_OF_RANGE, row)
+    skip = set(out_of_range)
+
+    modified: Dict[str, Student] = {}
+    for row, (student_id, course_code) in enumerate(zip(student_ids, course_codes)):
+        if row in skip:
+            continue
+        student = student_of(student_id)
+        if isinstance(student, EntityNotFoundError):
+            report.reject(UNKNOWN_STUDENT, row)
+            continue
+        course = course_of(course_code)
+        if isinstance(course, EntityNotFoundError):
+            report.reject(UNKNOWN_COURSE, row)
+            continue
+        if course not in student.courses_view:
+            report.reject(NOT_ENROLLED, row)
+            continue
+
+        touch(student)
+        value = float(values[row])
+        student.assign_grade(course, value)
+        if record is not None:
+            record(GradeAssigned(student_id, course_code, value))
+        report.accepted_count += 1
+        modified[student_id] = student
+    return report, modified
+
+
+# ---------- Bulk import (all or nothing per batch) ----------
+def students_from_rows(rows: Iterable[Sequence[str]]) -> List[Student]:
+    """Students built from (student_id, name) rows."""
+    with gc_paused():
+        return [Student(student_id, name) for student_id, name in rows]
+
+
+def teachers_from_rows(rows: Iterable[Sequence[str]]) -> List[Teacher]:
+    """Teachers built from (teacher_id, name) rows."""
+    with gc_paused():
+        return [Teacher(teacher_id, name) for teacher_id, name in rows]
+
+
+def courses_from_rows(rows: Iterable[Sequence]) -> List[Course]:
+    """
+    Courses built from (course_code, name) or (course_code, name, capacity)
+    rows; an empty or None capacity means unlimited.
+    """
+    with gc_paused():
+        return [
+            Course(row[0], row[1], _capacity(row[2]) if len(row) > 2 else None)
+            for row in rows
+        ]
+
+
+def added_events(entities: Sequence) -> List[DomainEvent]:
+    """The events of adding ``entities`` (all students, teachers or courses)."""
+    events: List[DomainEvent] = []
+    for entity in entities:
+        if isinstance(entity, Student):
+            events.append(StudentAdded(entity.id, entity.name))
+        elif isinstance(entity, Teacher):
+            events.append(TeacherAdded(entity.id, entity.name))
+        else:
+            events.append(CourseAdded(entity.code, entity.name))
+            if entity.capacity is not None:
+                events.append(CapacitySet(entity.code, entity.capacity))
+    return events
+
+
+def group_by_course(pairs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Student ids per course code, in first-seen course order."""
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for student_id, course_code in pairs:
+        groups[course_code].append(student_id)
+    return groups
+
+
+def resolve_groups(
+        groups: Dict[str, List[str]],
+        student_of: Callable[[str], Student],
+        course_of: Callable[[str], Course],
+) -> List[Tuple[Course, List[Student]]]:
+    """
+    Each course of ``groups`` with its students, every id looked up once;
+    an unknown one raises EntityNotFoundError before anything changes.
+    """
+    students: Dict[str, Student] = {}
+    resolved: List[Tuple[Course, List[Student]]] = []
+    for course_code, student_ids in groups.items():
+        batch: List[Student] = []
+        for student_id in student_ids:
+            student = students.get(student_id)
+            if student is None:
+                student = students[student_id] = student_of(student_id)
+            batch.append(student)
+        resolved.append((course_of(course_code), batch))
+    return resolved
+
+
+def enroll_group(
+        course: Course, students: List[Student], touch: Touch, record: Optional[Record] = None
+) -> None:
+    """Course.enroll_all one group of resolve_groups(); see import_enrollments."""
+    touch(course, *students)
+    course.enroll_all(students)
+    if record is not None:
+        code = course.code
+        record(*(Enrolled(student.id, code) for student in students))
+
+
+# ---------- Waitlists ----------
+def clear_waitlist(course: Course, touch: Touch, record: Optional[Record] = None) -> int:
+    """Empty ``course``'s waitlist; returns how many entries were removed."""
+    waitlist = course.waitlist
+    if not waitlist:
+        return 0
+    touch(course, *waitlist)
+    removed = len(course.clear_waitlist())
+    if record is not None:
+        record(WaitlistCleared(course.code))
+    return removed
+
+
+# ---------- Cleanup before a removal ----------
+def withdraw_student(student: Student, touch: Touch) -> List[Course]:
+    """
+    Take ``student`` off every waitlist and drop them from every course
+    (each freed seat goes to the next waitlisted student). Returns the
+    courses changed.
+    """
+    courses = student.courses
+    waitlisted = student.waitlisted_courses
+    touch(student, *courses, *waitlisted, *(course.next_waitlisted for course in courses))
+    for course in waitlisted:
+        course.leave_waitlist(student)
+    for course in courses:
+        course.drop(student)
+    return [*waitlisted, *courses]
+
+
+def unassign_teacher_everywhere(teacher: Teacher, touch: Touch) -> List[Course]:
+    """Unassign ``teacher`` from each of their courses; returns the courses changed."""
+    courses = [course for course in teacher.courses if course.teacher is teacher]
+    touch(teacher, *courses)
+    for course in courses:
+        course.unassign_teacher()
+    return courses
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Pause cyclic garbage collection while a bulk import allocates millions
+    of objects; otherwise their allocation keeps triggering collections
+    that have nothing to free.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _capacity(value: object) -> Optional[int]:
+    """Capacity column of an imported course row (blank = unlimited)."""
+    return None if value is None or value == "" else int(value)
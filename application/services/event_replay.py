@@ -0,0 +1,239 @@
+# application/services/event_replay.py
+
+from typing import Callable, Dict, Iterable
+
+from domain.events.domain_events import (
+    CapacityRemoved,
+    CapacitySet,
+    CourseAdded,
+    CourseRemoved,
+    DomainEvent,
+    Dropped,
+    Enrolled,
+    GradeAssigned,
+    GradeRemoved,
+    StudentAdded,
+    StudentRemoved,
+    TeacherAdded,
+    TeacherAssigned,
+    TeacherRemoved,
+    TeacherUnassigned,
+    WaitlistCleared,
+    WaitlistLeft,
+    Waitlisted,
+)
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.event_journal import EventJournal
+from domain.repositories.snapshot_store import SnapshotStore
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+
+
+def replay_events(
+        events: Iterable[DomainEvent],
+        student_repo: StudentRepository,
+        teacher_repo: TeacherRepository,
+        course_repo: CourseRepository,
+) -> int:
+    """
+    Re-apply journaled events, in order, to the given repositories and
+    return how many were applied. Replaying a journal into empty
+    repositories rebuilds the state that produced it.
+
+    Events go straight to the domain model instead of through
+    StudentManagementSystem: they describe changes that already succeeded,
+    so there is no locking, no transaction bookkeeping and no journaling.
+    Entities are looked up once and written back once each at the end
+    (``update``), however many events touch them. Wrap the call in the
+    repositories' UnitOfWork to make the rebuild atomic in storage.
+    """
+    return _Replay(student_repo, teacher_repo, course_repo).run(events)
+
+
+def recover(
+        snapshots: SnapshotStore,
+        journal: EventJournal,
+        student_repo: StudentRepository,
+        teacher_repo: TeacherRepository,
+        course_repo: CourseRepository,
+) -> int:
+    """
+    Rebuild the state at the end of ``journal`` in empty repositories:
+    load the latest snapshot, if any, then replay only the events
+    journaled after it. Returns the number of events replayed.
+    """
+    position = snapshots.load(student_repo, teacher_repo, course_repo)
+    return replay_events(journal.replay(after=position), student_repo, teacher_repo, course_repo)
+
+
+class _Replay:
+    """State of one replay_events() call."""
+
+    def __init__(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+    ) -> None:
+        self.student_repo = student_repo
+        self.teacher_repo = teacher_repo
+        self.course_repo = course_repo
+        self.students: Dict[str, Student] = {}
+        self.teachers: Dict[str, Teacher] = {}
+        self.courses: Dict[str, Course] = {}
+        # Pending write-backs, flushed in the service's order: courses first.
+        self.dirty_courses: Dict[str, Course] = {}
+        self.dirty_students: Dict[str, Student] = {}
+        self.handlers: Dict[type, Callable] = {
+            StudentAdded: self.student_added,
+            TeacherAdded: self.teacher_added,
+            CourseAdded: self.course_added,
+            StudentRemoved: self.student_removed,
+            TeacherRemoved: self.teacher_removed,
+            CourseRemoved: self.course_removed,
+            TeacherAssigned: self.teacher_assigned,
+            TeacherUnassigned: self.teacher_unassigned,
+            Enrolled: self.enrolled,
+            Dropped: self.dropped,
+            GradeAssigned: self.grade_assigned,
+            GradeRemoved: self.grade_removed,
+            CapacitySet: self.capacity_set,
+            CapacityRemoved: self.capacity_removed,
+            Waitlisted: self.waitlisted,
+            WaitlistLeft: self.waitlist_left,
+            WaitlistCleared: self.waitlist_cleared,
+        }
+
+    def run(self, events: Iterable[DomainEvent]) -> int:
+        handlers = self.handlers
+        count = 0
+        for event in events:
+            handlers[type(event)](event)
+            count += 1
+        for course in self.dirty_courses.values():
+            self.course_repo.update(course)
+        for student in self.dirty_students.values():
+            self.student_repo.update(student)
+        return count
+
+    # ---------- Lookups (cached for the whole replay) ----------
+    def student(self, student_id: str) -> Student:
+        student = self.students.get(student_id)
+        if student is None:
+            student = self.students[student_id] = self.student_repo.get(student_id)
+        return student
+
+    def teacher(self, teacher_id: str) -> Teacher:
+        teacher = self.teachers.get(teacher_id)
+        if teacher is None:
+            teacher = self.teachers[teacher_id] = self.teacher_repo.get(teacher_id)
+        return teacher
+
+    def course(self, course_code: str) -> Course:
+        course = self.courses.get(course_code)
+        if course is None:
+            course = self.courses[course_code] = self.course_repo.get(course_code)
+        return course
+
+    # ---------- Handlers ----------
+    def student_added(self, event: StudentAdded) -> None:
+        student = Student(event.student_id, event.name)
+        self.student_repo.add(student)
+        self.students[event.student_id] = student
+
+    def teacher_added(self, event: TeacherAdded) -> None:
+        teacher = Teacher(event.teacher_id, event.name)
+        self.teacher_repo.add(teacher)
+        self.teachers[event.teacher_id] = teacher
+
+    def course_added(self, event: CourseAdded) -> None:
+        course = Course(event.course_code, event.name)
+        self.course_repo.add(course)
+        self.courses[event.course_code] = course
+
+    def student_removed(self, event: StudentRemoved) -> None:
+        student = self.student(event.student_id)
+        for course in student.waitlisted_courses:
+            course.leave_waitlist(student)
+            self.dirty_courses[course.code] = course
+        for course in student.courses:
+            course.drop(student)
+            self.dirty_courses[course.code] = course
+        self.student_repo.remove(event.student_id)
+        del self.students[event.student_id]
+        self.dirty_students.pop(event.student_id, None)
+
+    def teacher_removed(self, event: TeacherRemoved) -> None:
+        teacher = self.teacher(event.teacher_id)
+        for course in teacher.courses:
+            course.unassign_teacher()
+            self.dirty_courses[course.code] = course
+        self.teacher_repo.remove(event.teacher_id)
+        del self.teachers[event.teacher_id]
+
+    def course_removed(self, event: CourseRemoved) -> None:
+        course = self.course(event.course_code)
+        course.detach_all()
+        self.course_repo.remove(event.course_code)
+        del self.courses[event.course_code]
+        self.dirty_courses.pop(event.course_code, None)
+
+    def teacher_assigned(self, event: TeacherAssigned) -> None:
+        course = self.course(event.course_code)
+        course.assign_teacher(self.teacher(event.teacher_id))
+        self.dirty_courses[event.course_code] = course
+
+    def teacher_unassigned(self, event: TeacherUnassigned) -> None:
+        course = self.course(event.course_code)
+        course.unassign_teacher()
+        self.dirty_courses[event.course_code] = course
+
+    def enrolled(self, event: Enrolled) -> None:
+        course = self.course(event.course_code)
+        course.enroll(self.student(event.student_id))
+        self.dirty_courses[event.course_code] = course
+
+    def dropped(self, event: Dropped) -> None:
+        course = self.course(event.course_code)
+        student = self.student(event.student_id)
+        course.drop(student)    # also promotes from the waitlist, as the original did
+        self.dirty_courses[event.course_code] = course
+        self.dirty_students[event.student_id] = student
+
+    def capacity_set(self, event: CapacitySet) -> None:
+        course = self.course(event.course_code)
+        course.set_capacity(event.capacity)    # promotes like the original did
+        self.dirty_courses[event.course_code] = course
+
+    def capacity_removed(self, event: CapacityRemoved) -> None:
+        course = self.course(event.course_code)
+        course.set_capacity(None)
+        self.dirty_courses[event.course_code] = course
+
+    def waitlisted(self, event: Waitlisted) -> None:
+        course = self.course(event.course_code)
+        course.join_waitlist(self.student(event.student_id), event.priority)
+        self.dirty_courses[event.course_code] = course
+
+    def waitlist_left(self, event: WaitlistLeft) -> None:
+        course = self.course(event.course_code)
+        course.leave_waitlist(self.student(event.student_id))
+        self.dirty_courses[event.course_code] = course
+
+    def waitlist_cleared(self, event: WaitlistCleared) -> None:
+        course = self.course(event.course_code)
+        course.clear_waitlist()
+        self.dirty_courses[event.course_code] = course
+
+    def grade_assigned(self, event: GradeAssigned) -> None:
+        student = self.student(event.student_id)
+        student.assign_grade(self.course(event.course_code), event.value)
+        self.dirty_students[event.student_id] = student
+
+    def grade_removed(self, event: GradeRemoved) -> None:
+        student = self.student(event.student_id)
+        student.remove_grade(self.course(event.course_code))
+        self.dirty_students[event.student_id] = student
@@ -0,0 +1,31 @@
+# application/services/grade_validation.py
+"""
+Whole-batch checks of columnar grade uploads, shared by the synchronous
+and asyncio services' import_grades.
+"""
+
+from collections.abc import Sequence
+from typing import List
+
+try:  # Optional: vectorized validation for large grade uploads.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+from domain.models.student import MAX_GRADE, MIN_GRADE
+
+
+def check_grade_columns(
+        student_ids: Sequence[str], course_codes: Sequence[str], values: Sequence[float]
+) -> None:
+    """Raise ValueError unless the three columns have the same length."""
+    if not len(student_ids) == len(course_codes) == len(values):
+        raise ValueError("student_ids, course_codes and values must have equal length.")
+
+
+def out_of_range_rows(values: Sequence[float]) -> List[int]:
+    """Row indices whose grade lies outside [MIN_GRADE, MAX_GRADE] (NaN included)."""
+    if np is not None:
+        array = np.asarray(values, dtype=np.float64)
+        return np.flatnonzero(~((array >= MIN_GRADE) & (array <= MAX_GRADE))).tolist()
+    return [row for row, value in enumerate(values) if not (MIN_GRADE <= value <= MAX_GRADE)]
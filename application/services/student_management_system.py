@@ -1,13 +1,52 @@
 # application/services/student_management_system.py
 
-from collections.abc import Iterable
-
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+from application.responses.bulk_enrollment_report import BulkEnrollmentReport
+from application.responses.grade_import_report import GradeImportReport
+from application.services import bulk_operations
+from application.services.aggregate_locks import AggregateLocks
+from application.services.grade_validation import check_grade_columns
+from application.services.transaction import Transaction
+from domain.events.domain_events import (
+    CapacityRemoved,
+    CapacitySet,
+    CourseAdded,
+    CourseRemoved,
+    DomainEvent,
+    Dropped,
+    Enrolled,
+    GradeAssigned,
+    GradeRemoved,
+    StudentAdded,
+    StudentRemoved,
+    TeacherAdded,
+    TeacherAssigned,
+    TeacherRemoved,
+    TeacherUnassigned,
+    WaitlistLeft,
+    Waitlisted,
+)
+from domain.exceptions.domain_exceptions import EntityNotFoundError
 from domain.models.student import Student
 from domain.models.teacher import Teacher
 from domain.models.course import Course
+from domain.models.grade_stats import GradeSummary
 from domain.repositories.student_repository import StudentRepository
 from domain.repositories.teacher_repository import TeacherRepository
 from domain.repositories.course_repository import CourseRepository
+from domain.repositories.base_repository import BaseRepository
+from domain.repositories.event_journal import EventJournal
+from domain.repositories.pagination import Page
+from domain.repositories.queries import CourseQuery, StudentQuery, TeacherQuery
+from domain.repositories.snapshot_store import SnapshotStore
+from domain.repositories.unit_of_work import UnitOfWork
+
+T = TypeVar("T")
+
 
 class StudentManagementSystem:
     """
@@ -18,6 +57,10 @@ class StudentManagementSystem:
     - Delegate all invariants to the domain model (Course/Student/Teacher).
     - Depend on repository *interfaces* rather than concrete storage.
       (Dependency Inversion: application ➜ domain abstractions).
+    - Group use cases into atomic transactions (see transaction()).
+    - Optionally serialize concurrent use cases per aggregate (thread_safe).
+    - Optionally record every state change in an event journal, and
+      checkpoint the repositories to a snapshot (see checkpoint()).
     """
 
     def __init__(
@@ -25,11 +68,122 @@ class StudentManagementSystem:
             student_repo: StudentRepository,
             teacher_repo: TeacherRepository,
             course_repo: CourseRepository,
+            unit_of_work: Optional[UnitOfWork] = None,
+            thread_safe: bool = False,
+            journal: Optional[EventJournal] = None,
     ) -> None:
+        """
+        With ``thread_safe=True`` the service may be shared by threads (with
+        repositories that are themselves thread-safe, such as the in-memory
+        ones): every use case locks the aggregates it changes, courses before
+        students and teachers (see AggregateLocks). Each use case is isolated
+        from the others; an explicit transaction() block is atomic on
+        failure but not isolated across its use cases.
+
+        With a ``journal``, every successful change is appended to it as a
+        domain event (a transaction's events only once it commits), so the
+        repositories can be rebuilt with event_replay.replay_events().
+        """
         # Injected repository dependencies (ports)
         self.student_repo = student_repo
         self.teacher_repo = teacher_repo
         self.course_repo = course_repo
+        # Optional storage transaction boundary shared by the repositories
+        self.unit_of_work = unit_of_work
+        self.journal = journal
+        # Journaled events since the last checkpoint (approximate under threads).
+        self._events_since_checkpoint = 0
+        self._locks = AggregateLocks() if thread_safe else None
+        # The open transaction is per thread.
+        self._local = threading.local()
+
+    @property
+    def _transaction(self) -> Optional[Transaction]:
+        return getattr(self._local, "transaction", None)
+
+    @_transaction.setter
+    def _transaction(self, transaction: Optional[Transaction]) -> None:
+        self._local.transaction = transaction
+
+    # ---------- Transactions ----------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run several use cases as one atomic unit:
+
+            with sms.transaction():
+                sms.add_student("S01", "Alice")
+                sms.enroll_student_in_course("S01", "C01")
+
+        - Repository write-backs are buffered and flushed once per modified
+          entity on exit, inside a single storage transaction.
+        - If the block raises, every aggregate touched in it is restored to
+          its prior state, added/removed entities are put back, the storage
+          transaction is rolled back, and the exception propagates.
+        - The block's domain events are appended to the journal together,
+          just before the storage commit; a rolled-back block leaves none.
+        - Nested blocks join the outermost transaction.
+
+        In thread-safe mode the commit (write-backs, journal append and
+        storage commit) and a rollback of a block opened outside any use
+        case run while every aggregate lock is held, so no other use case
+        runs halfway through them, and a change
+        another thread makes to an entity the block added is journaled
+        after it. The block's use cases are not isolated, though: if other
+        threads change the same aggregates while it is open, their events
+        are journaled before the block's, and replay may not reproduce the
+        final state.
+        """
+        if self._transaction is not None:
+            yield
+            return
+
+        transaction = self._transaction = Transaction()
+        if self.unit_of_work is not None:
+            self.unit_of_work.begin()
+        try:
+            yield
+            with self._locked_for_commit():
+                transaction.flush((self.course_repo, self.student_repo, self.teacher_repo))
+                if self.journal is not None and transaction.events:
+                    self.journal.append(transaction.events)
+                    self._events_since_checkpoint += len(transaction.events)
+                if self.unit_of_work is not None:
+                    self.unit_of_work.commit()
+        except BaseException:
+            # A failed commit has released the locks by now.
+            with self._locked_for_commit():
+                transaction.rollback()
+                if self.unit_of_work is not None:
+                    self.unit_of_work.rollback()
+            raise
+        finally:
+            self._transaction = None
+
+    # ---------- Checkpoints ----------
+    def checkpoint(self, snapshots: SnapshotStore, min_events: int = 0) -> bool:
+        """
+        Save the repositories to ``snapshots``, tagged with the journal's
+        current position, so a restart only has to load the snapshot and
+        replay the journal from there (see event_replay.recover()).
+
+        Meant to be called periodically: nothing is written, and False is
+        returned, while fewer than ``min_events`` events have been journaled
+        since the last checkpoint. In thread-safe mode every use case is
+        paused while the snapshot is written. An explicit transaction()
+        block open in another thread must not span the call, because its
+        changes would be saved before its events are journaled.
+        """
+        if self._events_since_checkpoint < min_events:
+            return False
+        with self._locked_all():
+            position = 0
+            if self.journal is not None:
+                self.journal.sync()
+                position = self.journal.position()
+            snapshots.save(self.student_repo, self.teacher_repo, self.course_repo, position)
+            self._events_since_checkpoint = 0
+        return True
 
     # ---------- Create / Read ----------
 
@@ -41,7 +195,11 @@ class StudentManagementSystem:
         it should raise DuplicateEntityError if the ID already exists.
         """
         student = Student(student_id, name)
-        self.student_repo.add(student)
+        # Locked until journaled: a use case on the new id must not record
+        # its event (e.g. Enrolled) before StudentAdded.
+        with self._locked(students=(student_id,)):
+            self._add(self.student_repo, student, student_id)
+            self._record(StudentAdded(student_id, name))
         return student
 
     def add_teacher(self, teacher_id: str, name: str) -> Teacher:
@@ -49,15 +207,29 @@ class StudentManagementSystem:
         Create a new Teacher and persist it via the TeacherRepository.
         """
         teacher = Teacher(teacher_id, name)
-        self.teacher_repo.add(teacher)
+        # Locked until journaled, as in add_student().
+        with self._locked(teachers=(teacher_id,)):
+            self._add(self.teacher_repo, teacher, teacher_id)
+            self._record(TeacherAdded(teacher_id, name))
         return teacher
 
-    def add_course(self, course_code: str, name: str) -> Course:
+    def add_course(
+            self, course_code: str, name: str, capacity: Optional[int] = None
+    ) -> Course:
         """
         Create a new Course (aggregate root) and persist it via the CourseRepository.
-        """
-        course = Course(course_code, name)
-        self.course_repo.add(course)
+
+        ``capacity`` limits its seats (None = unlimited); see
+        register_student_in_course() for the waitlist of a full course.
+        """
+        course = Course(course_code, name, capacity)
+        # Locked until journaled, as in add_student().
+        with self._locked(courses=(course_code,)):
+            self._add(self.course_repo, course, course_code)
+            if capacity is None:
+                self._record(CourseAdded(course_code, name))
+            else:
+                self._record(CourseAdded(course_code, name), CapacitySet(course_code, capacity))
         return course
 
     def get_student(self, student_id: str) -> Student:
@@ -95,6 +267,111 @@ class StudentManagementSystem:
         """Return all courses as provided by the repository."""
         return self.course_repo.list_all()
 
+    # Paged / streaming queries (ordered by id, constant memory per page)
+
+    def list_students_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        """Return up to ``limit`` students with IDs after ``after_id``."""
+        return self.student_repo.list_page(limit, after_id)
+
+    def list_teachers_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        """Return up to ``limit`` teachers with IDs after ``after_id``."""
+        return self.teacher_repo.list_page(limit, after_id)
+
+    def list_courses_page(self, limit: int, after_code: Optional[str] = None) -> Page[Course]:
+        """Return up to ``limit`` courses with codes after ``after_code``."""
+        return self.course_repo.list_page(limit, after_code)
+
+    def stream_students(self, batch_size: int = 1000) -> Iterator[Student]:
+        """Lazily iterate over all students in ID order."""
+        return self.student_repo.stream(batch_size)
+
+    def stream_teachers(self, batch_size: int = 1000) -> Iterator[Teacher]:
+        """Lazily iterate over all teachers in ID order."""
+        return self.teacher_repo.stream(batch_size)
+
+    def stream_courses(self, batch_size: int = 1000) -> Iterator[Course]:
+        """Lazily iterate over all courses in code order."""
+        return self.course_repo.stream(batch_size)
+
+    # Declarative queries (served from secondary indexes where available)
+
+    def find_students(self, query: StudentQuery) -> Tuple[Student, ...]:
+        """Return the students matching ``query``, ordered by ID."""
+        return self.student_repo.find(query)
+
+    def find_teachers(self, query: TeacherQuery) -> Tuple[Teacher, ...]:
+        """Return the teachers matching ``query``, ordered by ID."""
+        return self.teacher_repo.find(query)
+
+    def find_courses(self, query: CourseQuery) -> Tuple[Course, ...]:
+        """
+        Return the courses matching ``query``, ordered by code, e.g.
+        ``CourseQuery(has_teacher=False)`` or ``CourseQuery(min_students=31)``.
+        """
+        return self.course_repo.find(query)
+
+    # ---------- Bulk import (bootstrapping large datasets) ----------
+    def import_students(self, rows: Iterable[Sequence[str]]) -> int:
+        """
+        Add students from (student_id, name) rows and return how many were
+        added. ``rows`` may be any iterable, e.g. row_readers.read_csv() or
+        read_jsonl() over a file.
+
+        Meant for loading millions of rows: entities are built in one pass
+        and stored with the repository's add_many(), which rejects
+        duplicates (within the rows or with stored students) up front,
+        raising DuplicateEntityError, instead of one add per row.
+
+        In thread-safe mode every other use case waits until the students
+        are added and journaled.
+        """
+        students = bulk_operations.students_from_rows(rows)
+        self._add_many(self.student_repo, students, [student.id for student in students])
+        return len(students)
+
+    def import_teachers(self, rows: Iterable[Sequence[str]]) -> int:
+        """Add teachers from (teacher_id, name) rows; see import_students()."""
+        teachers = bulk_operations.teachers_from_rows(rows)
+        self._add_many(self.teacher_repo, teachers, [teacher.id for teacher in teachers])
+        return len(teachers)
+
+    def import_courses(self, rows: Iterable[Sequence]) -> int:
+        """
+        Add courses from (course_code, name) or (course_code, name, capacity)
+        rows; an empty or None capacity means unlimited. See import_students().
+        """
+        courses = bulk_operations.courses_from_rows(rows)
+        self._add_many(self.course_repo, courses, [course.code for course in courses])
+        return len(courses)
+
+    def import_enrollments(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Enroll (student_id, course_code) pairs in bulk and return how many
+        were enrolled.
+
+        - Pairs are grouped by course, so each course takes its whole batch
+          through Course.enroll_all (duplicates checked with one set
+          operation) and is written back once.
+        - Every id is resolved once, before anything changes: an unknown
+          id raises EntityNotFoundError with nothing enrolled.
+        - A rule violation (duplicate, full course) raises EnrollmentError
+          and leaves earlier courses enrolled; run the import inside
+          transaction() to make it all-or-nothing.
+        - A student's courses end up in the order the courses first appear.
+
+        In thread-safe mode every other use case waits for the import.
+        """
+        with bulk_operations.gc_paused(), self._locked_all():
+            groups = bulk_operations.resolve_groups(
+                bulk_operations.group_by_course(pairs), self.student_repo.get, self.get_course
+            )
+            count = 0
+            for course, students in groups:
+                bulk_operations.enroll_group(course, students, self._touch, self._recorder())
+                self._save(self.course_repo, course)
+                count += len(students)
+        return count
+
     # ---------- Delete (with cleanup via aggregate root) ----------
     def remove_course(self, course_code: str) -> None:
         """
@@ -103,37 +380,66 @@ class StudentManagementSystem:
         Cleanup rules (same as pre-refactor):
         - If the course has a teacher, unassign the teacher.
         - Drop all enrolled students from the course.
+        - Clear its waitlist.
 
         Relationship cleanup is done through the Course aggregate, not by
-        mutating Student/Teacher directly.
-        """
-        course = self.get_course(course_code)
+        mutating Student/Teacher directly. Persisted enrollments and grades
+        for the course are deleted by the repository along with it.
 
-        # Unassign teacher if present
-        if course.teacher is not None:
-            course.unassign_teacher()
+        Runs as a transaction, so the cleanup is never partially applied.
+        """
+        with self._locked(courses=(course_code,)):
+            course = self.get_course(course_code)
+            # The roster, waitlist and teacher cannot change while the
+            # course is locked.
+            waitlist = course.waitlist
+            with self._locked(
+                    students=[student.id for student in course.students_view] + _ids(*waitlist),
+                    teachers=_ids(course.teacher),
+            ), self.transaction():
+                self._touch(course, course.teacher, *course.students_view, *waitlist)
 
-        # Drop all enrolled students (iterate over a snapshot to avoid mutating while iterating)
-        for student in tuple(course.students):
-            course.drop(student)
+                # Unassign the teacher (if any) and drop every student in one pass
+                course.detach_all()
 
-        # Finally remove from repository
-        self.course_repo.remove(course_code)
+                # Finally remove from repository
+                self._remove(self.course_repo, course, course_code)
+                self._record(CourseRemoved(course_code))
 
     def remove_student(self, student_id: str) -> None:
         """
         Remove a student from the system.
 
         Cleanup rules:
-        - Drop the student from all courses they are enrolled in via Course.drop.
-        """
-        student = self.get_student(student_id)
-
-        # Drop this student from all their courses via Course (aggregate root)
-        for course in tuple(student.courses):
-            course.drop(student)
-
-        self.student_repo.remove(student_id)
+        - Drop the student from all courses they are enrolled in via Course.drop;
+          each freed seat goes to the course's next waitlisted student.
+        - Take the student off every waitlist they are on.
+
+        Runs as a transaction, so the cleanup is never partially applied.
+        """
+        while True:
+            # Courses must be locked before students: lock the courses seen
+            # now and retry if the student joined another one meanwhile.
+            student = self.get_student(student_id)
+            codes = {course.code for course in student.courses}
+            codes.update(course.code for course in student.waitlisted_courses)
+            with self._locked(courses=codes):
+                student = self.get_student(student_id)
+                courses = student.courses
+                waitlisted = student.waitlisted_courses
+                # Waitlists of locked courses are stable: these students
+                # take the seats the drops free.
+                promoted = [course.next_waitlisted for course in courses]
+                with self._locked(students=[student_id, *_ids(*promoted)]), self.transaction():
+                    if (student.courses != courses or student.waitlisted_courses != waitlisted
+                            or not {course.code for course in courses + waitlisted} <= codes):
+                        continue
+                    for course in bulk_operations.withdraw_student(student, self._touch):
+                        self._save(self.course_repo, course)
+
+                    self._remove(self.student_repo, student, student_id)
+                    self._record(StudentRemoved(student_id))
+                    return
 
     def remove_teacher(self, teacher_id: str) -> None:
         """
@@ -141,15 +447,23 @@ class StudentManagementSystem:
 
         Cleanup rules:
         - For each course where the teacher is assigned, unassign them via Course.
-        """
-        teacher = self.get_teacher(teacher_id)
 
-        # Unassign from all courses where this teacher is assigned
-        for course in tuple(teacher.courses):
-            if course.teacher is teacher:
-                course.unassign_teacher()
+        Runs as a transaction, so the cleanup is never partially applied.
+        """
+        while True:
+            # Same locking scheme as remove_student.
+            codes = [course.code for course in self.get_teacher(teacher_id).courses]
+            with self._locked(courses=codes, teachers=(teacher_id,)), self.transaction():
+                teacher = self.get_teacher(teacher_id)
+                courses = teacher.courses
+                if not {course.code for course in courses} <= set(codes):
+                    continue
+                for course in bulk_operations.unassign_teacher_everywhere(teacher, self._touch):
+                    self._save(self.course_repo, course)
 
-        self.teacher_repo.remove(teacher_id)
+                self._remove(self.teacher_repo, teacher, teacher_id)
+                self._record(TeacherRemoved(teacher_id))
+                return
 
     # ---------- Orchestration of domain operations ----------
 
@@ -161,16 +475,25 @@ class StudentManagementSystem:
         - Look up Teacher and Course via repositories.
         - Delegate invariants (e.g., "course already has a teacher") to Course.
         """
-        teacher = self.get_teacher(teacher_id)
-        course = self.get_course(course_code)
-        course.assign_teacher(teacher)
+        with self._locked(courses=(course_code,), teachers=(teacher_id,)):
+            teacher = self.get_teacher(teacher_id)
+            course = self.get_course(course_code)
+            self._touch(course, teacher)
+            course.assign_teacher(teacher)
+            self._save(self.course_repo, course)
+            self._record(TeacherAssigned(teacher_id, course_code))
 
     def unassign_teacher_from_course(self, course_code: str) -> None:
         """
         Unassign the teacher from a course (if it is assigned).
         """
-        course = self.get_course(course_code)
-        course.unassign_teacher()
+        with self._locked(courses=(course_code,)):
+            course = self.get_course(course_code)
+            with self._locked(teachers=_ids(course.teacher)):
+                self._touch(course, course.teacher)
+                course.unassign_teacher()
+                self._save(self.course_repo, course)
+                self._record(TeacherUnassigned(course_code))
 
     def enroll_student_in_course(self, student_id: str, course_code: str) -> None:
         """
@@ -178,18 +501,152 @@ class StudentManagementSystem:
 
         Delegates enrollment rules (duplicate checks, etc.) to Course.
         """
-        student = self.get_student(student_id)
-        course = self.get_course(course_code)
-        course.enroll(student)
+        with self._locked(courses=(course_code,), students=(student_id,)):
+            student = self.get_student(student_id)
+            course = self.get_course(course_code)
+            self._touch(course, student)
+            course.enroll(student)
+            self._save(self.course_repo, course)
+            self._record(Enrolled(student_id, course_code))
+
+    def enroll_students_in_courses(
+            self, pairs: Iterable[Tuple[str, str]]
+    ) -> BulkEnrollmentReport:
+        """
+        Enroll many (student_id, course_code) pairs in a single pass.
+
+        - Each distinct student/course id is looked up at most once; unknown
+          ids are remembered so repeated pairs do not hit the repository again.
+        - Enrollment rules are still enforced by Course.enroll for every pair.
+        - Failures (EntityNotFoundError, EnrollmentError) are recorded in the
+          returned report instead of aborting the remaining pairs.
+        - Each modified course is written back to its repository once, after
+          all pairs have been applied.
+        - In thread-safe mode the batch holds every aggregate lock until it
+          is written back, as import_enrollments() does.
+        """
+        # The resolved entities are reused for the whole batch, so no other
+        # use case may remove (or change) them until it is saved.
+        with self._locked_all():
+            report, modified = bulk_operations.enroll_pairs(
+                pairs, self._resolver(self.student_repo), self._resolver(self.course_repo),
+                self._touch, self._recorder(),
+            )
+            for course in modified.values():
+                self._save(self.course_repo, course)
+        return report
 
     def drop_student_from_course(self, student_id: str, course_code: str) -> None:
         """
         Drop a student from a course.
-        Delegates to Course.drop, which guarantees bidirectional cleanup.
-        """
-        student = self.get_student(student_id)
-        course = self.get_course(course_code)
-        course.drop(student)
+        Delegates to Course.drop, which guarantees bidirectional cleanup and
+        gives the freed seat to the next waitlisted student, if any.
+        """
+        with self._locked(courses=(course_code,)):
+            course = self.get_course(course_code)
+            promoted = course.next_waitlisted
+            with self._locked(students=[student_id, *_ids(promoted)]):
+                student = self.get_student(student_id)
+                self._touch(course, student, promoted)
+                course.drop(student)
+                self._save(self.course_repo, course)
+                self._save(self.student_repo, student)    # dropping also discards the grade
+                self._record(Dropped(student_id, course_code))
+
+    # ---------- Capacity and waitlists ----------
+    def set_course_capacity(self, course_code: str, capacity: Optional[int]) -> None:
+        """
+        Limit a course to ``capacity`` seats, or lift the limit with None.
+        Raising the limit enrolls waitlisted students, in waitlist order, into
+        the new seats; it cannot be lowered below the current enrollment.
+        """
+        with self._locked(courses=(course_code,)):
+            course = self.get_course(course_code)
+            waitlist = course.waitlist
+            with self._locked(students=_ids(*waitlist)):
+                self._touch(course, *waitlist)
+                course.set_capacity(capacity)
+                self._save(self.course_repo, course)
+                if capacity is None:
+                    self._record(CapacityRemoved(course_code))
+                else:
+                    self._record(CapacitySet(course_code, capacity))
+
+    def register_student_in_course(
+            self, student_id: str, course_code: str, priority: float = 0.0
+    ) -> bool:
+        """
+        Enroll a student if the course has a free seat, otherwise put them
+        on its waitlist. Returns True if the student was enrolled.
+
+        Waitlisted students are served by ascending ``priority`` (ties in
+        registration order, so a timestamp may be passed), each time a seat
+        is freed by a drop or a capacity increase.
+        """
+        with self._locked(courses=(course_code,), students=(student_id,)):
+            student = self.get_student(student_id)
+            course = self.get_course(course_code)
+            self._touch(course, student)
+            enrolled = course.register(student, priority)
+            self._save(self.course_repo, course)
+            if enrolled:
+                self._record(Enrolled(student_id, course_code))
+            else:
+                self._record(Waitlisted(student_id, course_code, priority))
+            return enrolled
+
+    def register_students_in_courses(
+            self, requests: Iterable[Tuple[str, str, float]]
+    ) -> BulkEnrollmentReport:
+        """
+        Register many (student_id, course_code, priority) requests in a
+        single pass, as enroll_students_in_courses() does for enrollments:
+        ids are resolved once, failures are reported rather than raised,
+        and each modified course is written back once at the end. The
+        report marks which accepted requests were waitlisted.
+        """
+        # Locked for the whole batch, as in enroll_students_in_courses().
+        with self._locked_all():
+            report, modified = bulk_operations.register_requests(
+                requests, self._resolver(self.student_repo), self._resolver(self.course_repo),
+                self._touch, self._recorder(),
+            )
+            for course in modified.values():
+                self._save(self.course_repo, course)
+        return report
+
+    def leave_waitlist(self, student_id: str, course_code: str) -> None:
+        """Take a student off a course's waitlist."""
+        with self._locked(courses=(course_code,), students=(student_id,)):
+            student = self.get_student(student_id)
+            course = self.get_course(course_code)
+            self._touch(course, student)
+            course.leave_waitlist(student)
+            self._save(self.course_repo, course)
+            self._record(WaitlistLeft(student_id, course_code))
+
+    def clear_waitlists(self, course_codes: Iterable[str]) -> int:
+        """
+        Empty the waitlists of many courses at once, e.g. when registration
+        closes, and return how many waitlist entries were removed.
+
+        Each waitlist is discarded whole (O(n) per course, no per-student
+        heap operations). Unknown course codes raise EntityNotFoundError;
+        runs as a transaction, so either every waitlist is cleared or none.
+        """
+        removed = 0
+        with self.transaction():
+            for course_code in dict.fromkeys(course_codes):
+                with self._locked(courses=(course_code,)):
+                    course = self.get_course(course_code)
+                    if not course.waitlist:
+                        continue
+                    with self._locked(students=_ids(*course.waitlist)):
+                        removed += bulk_operations.clear_waitlist(
+                            course, self._touch, self._recorder()
+                        )
+                        self._save(self.course_repo, course)
+        return removed
 
     # ---------- Grades (owned by Student, validated by enrollment) ----------
     def assign_grade_to_student(
@@ -202,9 +659,48 @@ class StudentManagementSystem:
         - Student must be enrolled in the course.
         - Grade must be within allowed range.
         """
-        student = self.get_student(student_id)
-        course = self.get_course(course_code)
-        student.assign_grade(course, value)
+        # The course is locked too: grades feed its running aggregates.
+        with self._locked(courses=(course_code,), students=(student_id,)):
+            student = self.get_student(student_id)
+            course = self.get_course(course_code)
+            self._touch(student)
+            student.assign_grade(course, value)
+            self._save(self.student_repo, student)
+            self._record(GradeAssigned(student_id, course_code, value))
+
+    def import_grades(
+            self,
+            student_ids: Sequence[str],
+            course_codes: Sequence[str],
+            values: Sequence[float],
+    ) -> GradeImportReport:
+        """
+        Bulk-assign grades from columnar input (row i = student_ids[i],
+        course_codes[i], values[i]). ``values`` may be a list, an
+        ``array('d')`` or a NumPy array.
+
+        - The grade range is checked for the whole batch up front
+          (vectorized when NumPy is available).
+        - Each distinct student/course id is resolved once.
+        - Remaining rows are checked for enrollment and written in one pass
+          through Student.assign_grade; each modified student is then written
+          back to the repository once.
+        - Invalid rows are reported by index and reason; they never abort
+          the import.
+        - In thread-safe mode the batch holds every aggregate lock until it
+          is written back.
+        """
+        check_grade_columns(student_ids, course_codes, values)
+        # Locked for the whole batch, as in enroll_students_in_courses().
+        with self._locked_all():
+            report, modified = bulk_operations.assign_grade_rows(
+                student_ids, course_codes, values,
+                self._resolver(self.student_repo), self._resolver(self.course_repo),
+                self._touch, self._recorder(),
+            )
+            for student in modified.values():
+                self._save(self.student_repo, student)
+        return report
 
     def remove_grade_from_student(
             self, student_id: str, course_code: str
@@ -212,9 +708,13 @@ class StudentManagementSystem:
         """
         Remove an existing grade for a student in a course.
         """
-        student = self.get_student(student_id)
-        course = self.get_course(course_code)
-        student.remove_grade(course)
+        with self._locked(courses=(course_code,), students=(student_id,)):
+            student = self.get_student(student_id)
+            course = self.get_course(course_code)
+            self._touch(student)
+            student.remove_grade(course)
+            self._save(self.student_repo, student)
+            self._record(GradeRemoved(student_id, course_code))
 
     def get_student_grade(
             self, student_id: str, course_code: str
@@ -225,3 +725,127 @@ class StudentManagementSystem:
         student = self.get_student(student_id)
         course = self.get_course(course_code)
         return student.get_grade(course)
+
+    # ---------- Grade aggregates (maintained incrementally, O(1) reads) ----------
+    def get_student_gpa(self, student_id: str) -> float | None:
+        """
+        Return the student's unweighted grade average, or None if they have
+        no grades yet.
+        """
+        with self._locked(students=(student_id,)):
+            return self.get_student(student_id).gpa
+
+    def get_course_grade_summary(self, course_code: str) -> GradeSummary:
+        """
+        Return count, mean, variance, min and max of the grades given in a
+        course.
+        """
+        with self._locked(courses=(course_code,)):
+            course = self.get_course(course_code)
+            with self._locked(students=[student.id for student in course.students_view]):
+                return course.grade_summary
+
+    # ---------- Internal helpers ----------
+    def _locked(
+            self,
+            courses: Iterable[str] = (),
+            students: Iterable[str] = (),
+            teachers: Iterable[str] = (),
+    ) -> AbstractContextManager:
+        """Hold the given aggregates' locks in thread-safe mode; no-op otherwise."""
+        if self._locks is None:
+            return nullcontext()
+        return self._locks.hold(courses, students, teachers)
+
+    def _locked_all(self) -> AbstractContextManager:
+        """Hold every aggregate lock in thread-safe mode; no-op otherwise."""
+        if self._locks is None:
+            return nullcontext()
+        return self._locks.hold_all()
+
+    def _locked_for_commit(self) -> AbstractContextManager:
+        """
+        Hold every aggregate lock for a transaction's commit or rollback in
+        thread-safe mode, unless this thread already holds locks: a use
+        case running as a transaction has locked what it changed.
+        """
+        if self._locks is None or self._locks.held():
+            return nullcontext()
+        return self._locks.hold_all()
+
+    def _touch(self, *entities) -> None:
+        """Inside a transaction, capture entities' state before they change."""
+        if self._transaction is not None:
+            for entity in entities:
+                if entity is not None:
+                    self._transaction.touch(entity)
+
+    def _save(self, repo: BaseRepository, entity) -> None:
+        """Write ``entity`` back now, or once at commit inside a transaction."""
+        if self._transaction is None:
+            repo.update(entity)
+        else:
+            self._transaction.mark_dirty(repo, entity)
+
+    def _record(self, *events: DomainEvent) -> None:
+        """Journal ``events`` now, or with the rest of the open transaction."""
+        if self.journal is None:
+            return
+        if self._transaction is None:
+            self.journal.append(events)
+            self._events_since_checkpoint += len(events)
+        else:
+            self._transaction.events.extend(events)
+
+    def _add(self, repo: BaseRepository, entity, key: str) -> None:
+        repo.add(entity)
+        if self._transaction is not None:
+            self._transaction.on_rollback(lambda: repo.remove(key))
+
+    def _add_many(self, repo: BaseRepository, entities: Sequence, keys: List[str]) -> None:
+        """Add and journal imported entities; see add_student() for the locking."""
+        with self._locked_all():
+            repo.add_many(entities)
+            if self._transaction is not None:
+                self._transaction.on_rollback(lambda: _remove_all(repo, keys))
+            if self.journal is not None:
+                self._record(*bulk_operations.added_events(entities))
+
+    def _remove(self, repo: BaseRepository, entity, key: str) -> None:
+        repo.remove(key)
+        if self._transaction is not None:
+            self._transaction.forget(repo, entity)
+            self._transaction.on_rollback(lambda: repo.add(entity))
+
+    def _recorder(self) -> Optional[Callable[..., None]]:
+        """_record for the bulk_operations steps; None (build no events) without a journal."""
+        return None if self.journal is None else self._record
+
+    @staticmethod
+    def _resolver(repo: BaseRepository[T, str]) -> Callable[[str], T | EntityNotFoundError]:
+        """
+        Look up keys through ``repo`` once each, memoizing both hits and
+        misses for the duration of a batch operation. A miss is returned
+        (not raised) so callers can record it and carry on.
+        """
+        resolved: Dict[str, T | EntityNotFoundError] = {}
+
+        def resolve(key: str) -> T | EntityNotFoundError:
+            entity = resolved.get(key)
+            if entity is None:
+                try:
+                    entity = repo.get(key)
+                except EntityNotFoundError as error:
+                    entity = error
+                resolved[key] = entity
+            return entity
+        return resolve
+
+
+def _ids(*entities) -> List[str]:
+    return [entity.id for entity in entities if entity is not None]
+
+
+def _remove_all(repo: BaseRepository, keys: Iterable[str]) -> None:
+    for key in keys:
+        repo.remove(key)
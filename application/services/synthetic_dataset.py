@@ -0,0 +1,260 @@
+# application/services/synthetic_dataset.py
+"""
+Seeded, deterministic synthetic datasets for load and scale testing:
+
+    dataset = SyntheticDataset(DatasetSpec(students=1_000_000, courses=5_000, seed=7))
+    dataset.load(sms)    # any repositories, through the bulk import use cases
+
+The same spec always produces the same rows, so benchmarks and soak
+tests on different backends run on identical data. Rows are produced by
+generators, each stream drawing from its own seeded random generator:
+enrollment_rows() can be replayed (e.g. by grade_rows()) without
+holding 5M pairs in memory, and consuming one stream never shifts
+another.
+
+Shape of the data:
+- Course popularity follows a Zipf law: the course of popularity rank k
+  is chosen with weight 1 / k ** zipf_exponent (ranks are shuffled over
+  the course codes).
+- Each student takes between ``min_courses`` and ``max_courses``
+  distinct courses; with a ``capacity``, full courses are skipped.
+- ``teacher_ratio`` of the courses get a teacher, ``courses_per_teacher``
+  each.
+- ``graded_fraction`` of the enrollments are graded. A grade is normal
+  around ``grade_mean``, shifted per course (difficulty) and per student
+  (ability), clamped to the grade range and rounded to ``grade_step``.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from bisect import bisect
+from dataclasses import dataclass
+from itertools import accumulate, islice
+from typing import Iterator, List, Optional, Tuple
+
+from application.services.student_management_system import StudentManagementSystem
+from domain.models.student import MAX_GRADE, MIN_GRADE
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+
+_FIRST_NAMES = (
+    "Ada", "Alan", "Amara", "Bea", "Carlos", "Chen", "Dara", "Elif", "Emil", "Fatima",
+    "Grace", "Hiro", "Ines", "Ivan", "Jonas", "Kofi", "Lena", "Malik", "Nia", "Omar",
+    "Priya", "Quinn", "Rosa", "Sanjay", "Tariq", "Uma", "Vera", "Wei", "Yara", "Zoe",
+)
+_LAST_NAMES = (
+    "Adeyemi", "Berg", "Costa", "Dubois", "Eriksen", "Fischer", "Garcia", "Hughes",
+    "Ito", "Jensen", "Kowalski", "Lopez", "Moreau", "Nakamura", "Okafor", "Petrov",
+    "Quispe", "Rossi", "Silva", "Tanaka", "Usman", "Varga", "Weber", "Yilmaz", "Zhang",
+)
+_SUBJECTS = (
+    "Mathematics", "Physics", "Chemistry", "Biology", "History", "Philosophy",
+    "Economics", "Literature", "Computer Science", "Statistics", "Linguistics",
+    "Psychology", "Sociology", "Music", "Art History", "Engineering",
+)
+
+# Rows per import_grades() call: bounds the columns held at once.
+_GRADE_BATCH = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSpec:
+    """Size and shape of a synthetic dataset; see the module docstring."""
+
+    students: int = 10_000
+    courses: int = 200
+    teacher_ratio: float = 0.8
+    courses_per_teacher: int = 2
+    min_courses: int = 3
+    max_courses: int = 6
+    zipf_exponent: float = 1.0
+    capacity: Optional[int] = None
+    graded_fraction: float = 0.8
+    grade_mean: float = 7.0
+    grade_sd: float = 1.5
+    course_sd: float = 0.8
+    student_sd: float = 1.0
+    grade_step: float = 0.5
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.students < 0 or self.courses < 0:
+            raise ValueError("students and courses must not be negative.")
+        if not 0.0 <= self.teacher_ratio <= 1.0 or not 0.0 <= self.graded_fraction <= 1.0:
+            raise ValueError("teacher_ratio and graded_fraction must be between 0 and 1.")
+        if self.courses_per_teacher < 1:
+            raise ValueError("courses_per_teacher must be at least 1.")
+        if not 0 <= self.min_courses <= self.max_courses:
+            raise ValueError("Need 0 <= min_courses <= max_courses.")
+        if self.capacity is not None and self.capacity < 0:
+            raise ValueError("capacity must not be negative.")
+        if self.grade_step <= 0:
+            raise ValueError("grade_step must be positive.")
+
+    @property
+    def teachers(self) -> int:
+        return math.ceil(self.courses * self.teacher_ratio / self.courses_per_teacher)
+
+
+class SyntheticDataset:
+    """Row streams (and a loader) for one DatasetSpec."""
+
+    def __init__(self, spec: DatasetSpec = DatasetSpec()) -> None:
+        self.spec = spec
+        self.student_ids = _Ids("S", spec.students)
+        self.teacher_ids = _Ids("T", spec.teachers)
+        self.course_codes = _Ids("C", spec.courses)
+
+    def _random(self, stream: str) -> random.Random:
+        # str seeds are hashed deterministically (not with PYTHONHASHSEED).
+        return random.Random(f"{self.spec.seed}:{stream}")
+
+    # ---------- Row streams ----------
+    def student_rows(self) -> Iterator[Tuple[str, str]]:
+        """(student_id, name) per student."""
+        rng = self._random("students")
+        for student_id in self.student_ids:
+            yield student_id, f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+
+    def teacher_rows(self) -> Iterator[Tuple[str, str]]:
+        """(teacher_id, name) per teacher."""
+        rng = self._random("teachers")
+        for teacher_id in self.teacher_ids:
+            yield teacher_id, f"Dr. {rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+
+    def course_rows(self) -> Iterator[Tuple[str, str, Optional[int]]]:
+        """(course_code, name, capacity) per course."""
+        for index, code in enumerate(self.course_codes):
+            subject = _SUBJECTS[index % len(_SUBJECTS)]
+            yield code, f"{subject} {101 + index // len(_SUBJECTS)}", self.spec.capacity
+
+    def assignment_rows(self) -> Iterator[Tuple[str, str]]:
+        """(teacher_id, course_code) for the courses that get a teacher."""
+        rng = self._random("assignments")
+        codes = list(self.course_codes)
+        rng.shuffle(codes)
+        per_teacher = self.spec.courses_per_teacher
+        assigned = round(len(codes) * self.spec.teacher_ratio)
+        for index, code in enumerate(codes[:assigned]):
+            yield self.teacher_ids[index // per_teacher], code
+
+    def enrollment_rows(self) -> Iterator[Tuple[str, str]]:
+        """(student_id, course_code) per enrollment, grouped by student."""
+        spec = self.spec
+        if not spec.courses:
+            return
+        rng = self._random("enrollments")
+        popularity = self.popularity()
+        cum_weights = list(accumulate(popularity))
+        total = cum_weights[-1]
+        capacity = spec.capacity
+        seats = array("l", [0]) * spec.courses if capacity is not None else None
+        codes = self.course_codes
+        for student_id in self.student_ids:
+            wanted = min(rng.randint(spec.min_courses, spec.max_courses), spec.courses)
+            chosen = set()
+            # Zipf draws repeat the popular courses; give up on a student's
+            # remaining picks once draws keep failing (e.g. all seats taken).
+            attempts = 0
+            while len(chosen) < wanted and attempts < 20 * wanted:
+                attempts += 1
+                index = bisect(cum_weights, rng.random() * total)
+                if index in chosen or (seats is not None and seats[index] >= capacity):
+                    continue
+                chosen.add(index)
+                if seats is not None:
+                    seats[index] += 1
+            for index in sorted(chosen):
+                yield student_id, codes[index]
+
+    def grade_rows(self) -> Iterator[Tuple[str, str, float]]:
+        """(student_id, course_code, grade) for the graded enrollments."""
+        spec = self.spec
+        rng = self._random("grades")
+        difficulty = self._course_offsets()
+        course_index = {code: index for index, code in enumerate(self.course_codes)}
+        step = spec.grade_step
+        ability = 0.0
+        current = None
+        for student_id, code in self.enrollment_rows():
+            if student_id != current:
+                current = student_id
+                ability = rng.gauss(0.0, spec.student_sd)
+            if rng.random() >= spec.graded_fraction:
+                continue
+            value = rng.gauss(spec.grade_mean + ability + difficulty[course_index[code]],
+                              spec.grade_sd)
+            value = round(value / step) * step
+            yield student_id, code, min(MAX_GRADE, max(MIN_GRADE, value))
+
+    def popularity(self) -> List[float]:
+        """Relative popularity (Zipf weight) of each course, by course index."""
+        rng = self._random("popularity")
+        ranks = list(range(1, self.spec.courses + 1))
+        rng.shuffle(ranks)
+        exponent = self.spec.zipf_exponent
+        return [1.0 / rank ** exponent for rank in ranks]
+
+    def _course_offsets(self) -> List[float]:
+        rng = self._random("difficulty")
+        return [rng.gauss(0.0, self.spec.course_sd) for _ in range(self.spec.courses)]
+
+    # ---------- Loading ----------
+    def load(self, sms: StudentManagementSystem) -> None:
+        """
+        Load the dataset through ``sms``'s bulk import use cases, so it
+        goes into whatever repositories the system was built with (and
+        is journaled if it has a journal).
+        """
+        sms.import_students(self.student_rows())
+        sms.import_teachers(self.teacher_rows())
+        sms.import_courses(self.course_rows())
+        for teacher_id, code in self.assignment_rows():
+            sms.assign_teacher_to_course(teacher_id, code)
+        sms.import_enrollments(self.enrollment_rows())
+        grades = self.grade_rows()
+        while True:
+            batch = list(islice(grades, _GRADE_BATCH))
+            if not batch:
+                return
+            student_ids, codes, values = zip(*batch)
+            sms.import_grades(student_ids, codes, array("d", values))
+
+    def load_repositories(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+    ) -> None:
+        """Load the dataset straight into repositories; see load()."""
+        self.load(StudentManagementSystem(student_repo, teacher_repo, course_repo))
+
+
+class _Ids:
+    """
+    ``prefix`` + zero-padded index, e.g. S0000042 for index 42 of 1M
+    students: fixed width, so ids sort in creation order.
+    """
+
+    __slots__ = ("_prefix", "_count", "_width")
+
+    def __init__(self, prefix: str, count: int) -> None:
+        self._prefix = prefix
+        self._count = count
+        self._width = max(2, len(str(count - 1)))
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return f"{self._prefix}{index:0{self._width}d}"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        prefix, width = self._prefix, self._width
+        return (f"{prefix}{index:0{width}d}" for index in range(self._count))
@@ -0,0 +1,72 @@
+# application/services/transaction.py
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from domain.events.domain_events import DomainEvent
+from domain.repositories.base_repository import BaseRepository
+
+
+class Transaction:
+    """
+    In-flight state of one StudentManagementSystem.transaction() block.
+
+    - Before an entity is first mutated, its memento is captured, so a
+      rollback can put every touched aggregate back exactly as it was.
+    - Repository write-backs (``update``) are buffered per entity and issued
+      once each on flush, instead of once per use case.
+    - Repository adds/removes are applied immediately (so lookups and
+      duplicate checks see them) and recorded as undo steps.
+    - Domain events are collected and only journaled on commit.
+    """
+
+    def __init__(self) -> None:
+        self._mementos: Dict[int, Tuple[object, tuple]] = {}
+        self._dirty: Dict[int, Dict[int, object]] = {}
+        self._undo: List[Callable[[], None]] = []
+        self.events: List[DomainEvent] = []
+
+    def touch(self, entity) -> None:
+        """Remember ``entity``'s state before its first change in this transaction."""
+        key = id(entity)
+        if key not in self._mementos:
+            self._mementos[key] = (entity, entity.memento())
+
+    def mark_dirty(self, repo: BaseRepository, entity) -> None:
+        self._dirty.setdefault(id(repo), {})[id(entity)] = entity
+
+    def forget(self, repo: BaseRepository, entity) -> None:
+        """Drop a pending write-back, e.g. because the entity was removed."""
+        self._dirty.get(id(repo), {}).pop(id(entity), None)
+
+    def on_rollback(self, undo: Callable) -> None:
+        self._undo.append(undo)
+
+    def flush(self, repos: Sequence[BaseRepository]) -> None:
+        """Write back every dirty entity once, repository by repository."""
+        for repo in repos:
+            for entity in self.take_dirty(repo):
+                repo.update(entity)
+
+    def take_dirty(self, repo) -> List[object]:
+        """Remove and return ``repo``'s pending write-backs (for custom flushes)."""
+        return list(self._dirty.pop(id(repo), {}).values())
+
+    def rollback(self) -> None:
+        """Restore all touched aggregates, then undo repository adds/removes."""
+        for undo in self.rollback_aggregates():
+            undo()
+
+    def rollback_aggregates(self) -> List[Callable]:
+        """
+        Restore all touched aggregates and discard pending write-backs.
+        Returns the undo steps for repository adds/removes, newest first,
+        for the caller to run (they may be coroutine functions).
+        """
+        for entity, memento in self._mementos.values():
+            entity.restore(memento)
+        undo = list(reversed(self._undo))
+        self._mementos.clear()
+        self._dirty.clear()
+        self._undo.clear()
+        self.events.clear()
+        return undo
@@ -0,0 +1,94 @@
+# benchmarks/bench_bulk_import.py
+"""
+Bulk import: students, courses and enrollments loaded in one call each.
+
+Imports ``--students`` students and ``--courses`` courses through
+StudentManagementSystem.import_students/import_courses, then
+``--per-student`` enrollments per student (Zipf-distributed over the
+courses, from SyntheticDataset) through
+import_enrollments, and reports rows per second for each phase. For
+comparison, the first ``--compare`` enrollments are also timed through
+the per-row enroll_student_in_course() path on a fresh system.
+
+Run with:
+    python -m benchmarks.bench_bulk_import [--students 1000000] [--per-student 5]
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from application.services.student_management_system import StudentManagementSystem
+from application.services.synthetic_dataset import DatasetSpec, SyntheticDataset
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+
+
+def _sms() -> StudentManagementSystem:
+    return StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+
+
+def _rows(students: int, courses: int, per_student: int, seed: int):
+    dataset = SyntheticDataset(DatasetSpec(
+        students=students, courses=courses,
+        min_courses=per_student, max_courses=per_student, seed=seed,
+    ))
+    return (
+        list(dataset.student_rows()), list(dataset.course_rows()),
+        list(dataset.enrollment_rows()),
+    )
+
+
+def measure(students: int, courses: int, per_student: int, compare: int,
+            seed: int = 1) -> Dict[str, float]:
+    student_rows, course_rows, pairs = _rows(students, courses, per_student, seed)
+
+    sms = _sms()
+    start = time.perf_counter()
+    sms.import_students(student_rows)
+    students_s = time.perf_counter() - start
+    sms.import_courses(course_rows)
+    start = time.perf_counter()
+    sms.import_enrollments(pairs)
+    enrollments_s = time.perf_counter() - start
+
+    sms = _sms()
+    sms.import_students(student_rows)
+    sms.import_courses(course_rows)
+    sample = pairs[:compare]
+    start = time.perf_counter()
+    for student_id, code in sample:
+        sms.enroll_student_in_course(student_id, code)
+    per_row_s = time.perf_counter() - start
+
+    return {
+        "students_s": students_s,
+        "enrollments_s": enrollments_s,
+        "enrollments": len(pairs),
+        "bulk_us": enrollments_s / len(pairs) * 1e6,
+        "per_row_us": per_row_s / len(sample) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=1_000_000)
+    parser.add_argument("--courses", type=int, default=2_000)
+    parser.add_argument("--per-student", type=int, default=5)
+    parser.add_argument("--compare", type=int, default=100_000)
+    args = parser.parse_args()
+
+    result = measure(args.students, args.courses, args.per_student, args.compare)
+    print(f"{args.students:,} students, {args.courses:,} courses, "
+          f"{result['enrollments']:,} enrollments")
+    print(f"import_students        {result['students_s']:>10.2f} s")
+    print(f"import_enrollments     {result['enrollments_s']:>10.2f} s"
+          f"  ({result['bulk_us']:.2f} us/row)")
+    print(f"enroll per row         {result['per_row_us']:>10.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_dataset_export.py
+"""
+Dataset export: streaming students, courses and enrollments to files.
+
+Loads a SyntheticDataset of ``--students`` students with
+``--per-student`` enrollments each (most of them graded), then times
+export_dataset() for each format/compression pair and reports rows per
+second. A second, traced
+CSV export reports the peak memory allocated while exporting, which
+should stay flat as the dataset grows.
+
+Run with:
+    python -m benchmarks.bench_dataset_export [--students 200000] [--per-student 5]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+from application.services.student_management_system import StudentManagementSystem
+from application.services.synthetic_dataset import DatasetSpec, SyntheticDataset
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.interchange.dataset_export import export_dataset
+
+
+def _populated(students: int, courses: int, per_student: int, seed: int) -> StudentManagementSystem:
+    sms = StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+    SyntheticDataset(DatasetSpec(
+        students=students, courses=courses,
+        min_courses=per_student, max_courses=per_student, seed=seed,
+    )).load(sms)
+    return sms
+
+
+def _export(sms: StudentManagementSystem, fmt: str, compression: Optional[str]) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        counts = export_dataset(
+            directory, sms.student_repo, sms.teacher_repo, sms.course_repo, fmt, compression
+        )
+    return sum(counts.values())
+
+
+def measure(students: int, courses: int, per_student: int, seed: int = 1) -> Dict[str, float]:
+    sms = _populated(students, courses, per_student, seed)
+    result: Dict[str, float] = {}
+    for fmt in ("csv", "jsonl"):
+        for compression in (None, "gz"):
+            start = time.perf_counter()
+            rows = _export(sms, fmt, compression)
+            result[f"{fmt}+{compression or 'plain'}"] = rows / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    _export(sms, "csv", None)
+    result["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=200_000)
+    parser.add_argument("--courses", type=int, default=2_000)
+    parser.add_argument("--per-student", type=int, default=5)
+    args = parser.parse_args()
+
+    result = measure(args.students, args.courses, args.per_student)
+    print(f"{args.students:,} students, {args.students * args.per_student:,} enrollments")
+    for name, rate in result.items():
+        if name != "peak_mib":
+            print(f"{name:<22} {rate:>12,.0f} rows/s")
+    print(f"peak export memory     {result['peak_mib']:>12.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
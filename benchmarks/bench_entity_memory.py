@@ -0,0 +1,84 @@
+# benchmarks/bench_entity_memory.py
+"""
+Resident memory per domain entity, slot-based vs. dict-based layout.
+
+Builds a population of students spread across courses (each student is
+enrolled in ``--enrollments`` courses) twice: once with the real, slotted
+domain classes and once with equivalent classes that carry a per-instance
+__dict__ (the pre-slots layout). Allocations are measured with tracemalloc
+and reported as bytes per student/course.
+
+Run with:
+    python -m benchmarks.bench_entity_memory [--students 1000000] [--courses 10000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict, Type
+
+from domain.models.course import Course
+from domain.models.student import Student
+
+
+def dict_based(cls: Type) -> Type:
+    """
+    Return a copy of ``cls`` without __slots__, i.e. with a per-instance
+    __dict__, so the old layout can be measured with the current behavior.
+    """
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in getattr(cls, "__slots__", ()) and name not in ("__slots__", "__dict__")
+    }
+    return type(f"DictBased{cls.__name__}", cls.__bases__, namespace)
+
+
+def measure(
+        student_cls: Type, course_cls: Type, students: int, courses: int, enrollments: int
+) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+
+    course_objs = [course_cls(f"C{i:05d}", f"Course {i}") for i in range(courses)]
+    course_bytes = tracemalloc.get_traced_memory()[0]
+
+    student_objs = []
+    for i in range(students):
+        student = student_cls(f"S{i:07d}", f"Student {i}")
+        for k in range(enrollments):
+            course_objs[(i + k * 7919) % courses].enroll(student)
+        student_objs.append(student)
+    total_bytes = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    return {
+        "bytes_per_course_empty": course_bytes / courses,
+        "bytes_per_student_enrolled": (total_bytes - course_bytes) / students,
+        "total_mib": total_bytes / 2 ** 20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=1_000_000)
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--enrollments", type=int, default=1)
+    args = parser.parse_args()
+
+    layouts = {
+        "dict-based (before)": (dict_based(Student), dict_based(Course)),
+        "slot-based (after)": (Student, Course),
+    }
+    print(f"{args.students} students, {args.courses} courses, {args.enrollments} enrollment(s) each")
+    print(f"{'layout':<22} {'B/course':>10} {'B/student':>10} {'total MiB':>10}")
+    for label, (student_cls, course_cls) in layouts.items():
+        row = measure(student_cls, course_cls, args.students, args.courses, args.enrollments)
+        print(
+            f"{label:<22} {row['bytes_per_course_empty']:>10.0f} "
+            f"{row['bytes_per_student_enrolled']:>10.0f} {row['total_mib']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
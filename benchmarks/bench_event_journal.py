@@ -0,0 +1,109 @@
+# benchmarks/bench_event_journal.py
+"""
+Event journal: journaling overhead, replay speed and snapshot startup.
+
+Runs a seeded workload (adds, enrollments, grades) through a journaling
+StudentManagementSystem, then rebuilds fresh in-memory repositories from
+the journal with replay_events, and again from a checkpoint snapshot
+(BinarySnapshotStore). Reports use cases per second with and without the
+journal, the journal size, events replayed per second, and the snapshot
+size and load time.
+
+Run with:
+    python -m benchmarks.bench_event_journal [--students 100000] [--sync-every 256]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict, Optional
+
+from application.services.event_replay import replay_events
+from application.services.student_management_system import StudentManagementSystem
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.journal.binary_event_journal import BinaryEventJournal
+from infrastructure.journal.binary_snapshot_store import BinarySnapshotStore
+
+
+def _repos():
+    return InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+
+
+def _workload(sms: StudentManagementSystem, students: int, courses: int, seed: int) -> int:
+    rng = random.Random(seed)
+    for i in range(courses):
+        sms.add_course(f"C{i:04d}", "Course")
+    use_cases = courses
+    for i in range(students):
+        student_id = f"S{i:07d}"
+        sms.add_student(student_id, "Student")
+        for code in rng.sample(range(courses), 3):
+            sms.enroll_student_in_course(student_id, f"C{code:04d}")
+            sms.assign_grade_to_student(student_id, f"C{code:04d}", rng.uniform(0, 10))
+        use_cases += 7
+    return use_cases
+
+
+def measure(
+        students: int, courses: int, sync_every: int, directory: Optional[str]
+) -> Dict[str, float]:
+    if directory is None:
+        start = time.perf_counter()
+        use_cases = _workload(StudentManagementSystem(*_repos()), students, courses, seed=1)
+        return {"use_cases_per_s": use_cases / (time.perf_counter() - start)}
+
+    path = os.path.join(directory, "events.journal")
+    snapshots = BinarySnapshotStore(os.path.join(directory, "state.snapshot"))
+    with BinaryEventJournal(path, sync_every=sync_every) as journal:
+        sms = StudentManagementSystem(*_repos(), journal=journal)
+        start = time.perf_counter()
+        use_cases = _workload(sms, students, courses, seed=1)
+        journal.sync()
+        write_s = time.perf_counter() - start
+        sms.checkpoint(snapshots)
+
+        start = time.perf_counter()
+        events = replay_events(journal.replay(), *_repos())
+        replay_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshots.load(*_repos())
+    load_s = time.perf_counter() - start
+
+    return {
+        "use_cases_per_s": use_cases / write_s,
+        "journal_mb": os.path.getsize(path) / 2 ** 20,
+        "events_per_s": events / replay_s,
+        "replay_s": replay_s,
+        "snapshot_mb": os.path.getsize(snapshots.path) / 2 ** 20,
+        "snapshot_load_s": load_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=100_000)
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--sync-every", type=int, default=256)
+    args = parser.parse_args()
+
+    plain = measure(args.students, args.courses, args.sync_every, None)
+    with tempfile.TemporaryDirectory() as directory:
+        journaled = measure(args.students, args.courses, args.sync_every, directory)
+
+    print(f"{args.students} students, {args.courses} courses, sync every {args.sync_every}")
+    print(f"without journal  {plain['use_cases_per_s']:>12,.0f} use cases/s")
+    print(f"with journal     {journaled['use_cases_per_s']:>12,.0f} use cases/s"
+          f"  ({journaled['journal_mb']:.1f} MiB)")
+    print(f"replay           {journaled['events_per_s']:>12,.0f} events/s"
+          f"  ({journaled['replay_s']:.2f} s)")
+    print(f"snapshot load    {journaled['snapshot_load_s']:>12.2f} s"
+          f"  ({journaled['snapshot_mb']:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_grade_store.py
+"""
+Grade storage: per-student dicts vs. ColumnarGradeStore.
+
+Grades ``--students`` students in ``--grades`` courses each and reports,
+for both layouts, the memory allocated for the grades (tracemalloc) and
+the time to collect every grade of one course (walking the roster and
+calling Student.get_grade, vs. ColumnarGradeStore.course_values).
+
+Run with:
+    python -m benchmarks.bench_grade_store [--students 200000] [--grades 5]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from domain.models.course import Course
+from domain.models.student import Student
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+
+
+def _population(students: int, courses: int, per_student: int):
+    course_objs = [Course(f"C{i:04d}", "Course") for i in range(courses)]
+    student_objs = []
+    for i in range(students):
+        student = Student(f"S{i:07d}", "Student")
+        for k in range(per_student):
+            course_objs[(i + k) % courses].enroll(student)
+        student_objs.append(student)
+    return course_objs, student_objs
+
+
+def measure(
+        students: int, courses: int, per_student: int, store: Optional[ColumnarGradeStore]
+) -> Dict[str, float]:
+    course_objs, student_objs = _population(students, courses, per_student)
+    gc.collect()
+    tracemalloc.start()
+    for i, student in enumerate(student_objs):
+        if store is not None:
+            student.attach_grades(store.grades_for(student.id))
+        for course in student.courses_view:
+            student.assign_grade(course, float((i * 7) % 11))
+    grade_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    course = course_objs[0]
+    start = time.perf_counter()
+    if store is None:
+        values: List[float] = [
+            grade for grade in (s.get_grade(course) for s in course.students_view)
+            if grade is not None
+        ]
+    else:
+        values = store.course_values(course.code)
+    scan_s = time.perf_counter() - start
+
+    return {
+        "bytes_per_grade": grade_bytes / (students * per_student),
+        "course_scan_ms": scan_s * 1000,
+        "course_size": len(values),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=200_000)
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--grades", type=int, default=5, help="grades per student")
+    args = parser.parse_args()
+
+    print(f"{args.students} students x {args.grades} grades over {args.courses} courses")
+    print(f"{'layout':<12} {'B/grade':>8} {'course scan (ms)':>17}")
+    for label, store in (("dict", None), ("columnar", ColumnarGradeStore())):
+        row = measure(args.students, args.courses, args.grades, store)
+        print(f"{label:<12} {row['bytes_per_grade']:>8.0f} {row['course_scan_ms']:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_remove_course.py
+"""
+Wall time of StudentManagementSystem.remove_course for a large course.
+
+Enrolls ``--seats`` students (50k by default) in one graded course and
+removes it, once with the in-memory repositories and once with SQLite
+(remove_course includes capturing every student's rollback memento).
+The domain-level cleanup is also timed on its own: Course.detach_all
+against the per-student course.drop loop remove_course used before it.
+Every figure should grow linearly with the number of seats.
+
+Run with:
+    python -m benchmarks.bench_remove_course [--seats 50000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, Dict
+
+from application.services.student_management_system import StudentManagementSystem
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.in_memory.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.repositories.sqlite_course_repository import SqliteCourseRepository
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_student_repository import SqliteStudentRepository
+from infrastructure.repositories.sqlite_teacher_repository import SqliteTeacherRepository
+from infrastructure.repositories.sqlite_unit_of_work import SqliteUnitOfWork
+
+
+def _populate(sms: StudentManagementSystem, seats: int) -> None:
+    sms.add_course("C0", "Large lecture")
+    sms.add_teacher("T0", "Lecturer")
+    sms.assign_teacher_to_course("T0", "C0")
+    student_ids = [f"S{i:06d}" for i in range(seats)]
+    with sms.transaction():
+        for student_id in student_ids:
+            sms.add_student(student_id, "Student")
+        sms.enroll_students_in_courses((student_id, "C0") for student_id in student_ids)
+        sms.import_grades(student_ids, ["C0"] * seats, [float(i % 11) for i in range(seats)])
+
+
+def _time_removal(sms: StudentManagementSystem) -> float:
+    start = time.perf_counter()
+    sms.remove_course("C0")
+    return time.perf_counter() - start
+
+
+def _time_detach_all(sms: StudentManagementSystem) -> float:
+    course = sms.get_course("C0")
+    start = time.perf_counter()
+    course.detach_all()
+    return time.perf_counter() - start
+
+
+def _time_per_student_drops(sms: StudentManagementSystem) -> float:
+    """The cleanup loop remove_course used before Course.detach_all."""
+    course = sms.get_course("C0")
+    start = time.perf_counter()
+    course.unassign_teacher()
+    for student in tuple(course.students):
+        course.drop(student)
+    return time.perf_counter() - start
+
+
+def _in_memory_sms() -> StudentManagementSystem:
+    return StudentManagementSystem(
+        student_repo=InMemoryStudentRepository(),
+        teacher_repo=InMemoryTeacherRepository(),
+        course_repo=InMemoryCourseRepository(),
+        unit_of_work=InMemoryUnitOfWork(),
+    )
+
+
+def _time_in_memory(seats: int, operation: Callable[[StudentManagementSystem], float]) -> float:
+    sms = _in_memory_sms()
+    _populate(sms, seats)
+    return operation(sms)
+
+
+def _time_sqlite_removal(seats: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        with SqliteDatabase(os.path.join(directory, "bench.sqlite3")) as database:
+            sms = StudentManagementSystem(
+                student_repo=SqliteStudentRepository(database),
+                teacher_repo=SqliteTeacherRepository(database),
+                course_repo=SqliteCourseRepository(database),
+                unit_of_work=SqliteUnitOfWork(database),
+            )
+            _populate(sms, seats)
+            database.identity_map.clear()    # start from a cold session
+            return _time_removal(sms)
+
+
+def measure(seats: int) -> Dict[str, float]:
+    """Seconds for each way of tearing down a course with ``seats`` graded students."""
+    return {
+        "seats": seats,
+        "remove_course_in_memory_s": _time_in_memory(seats, _time_removal),
+        "remove_course_sqlite_s": _time_sqlite_removal(seats),
+        "detach_all_s": _time_in_memory(seats, _time_detach_all),
+        "per_student_drops_s": _time_in_memory(seats, _time_per_student_drops),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seats", type=int, default=50_000)
+    args = parser.parse_args()
+
+    results = measure(args.seats)
+    print(f"seats: {results.pop('seats')}")
+    for name, seconds in results.items():
+        print(f"{name:>28} {seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_term_archive.py
+"""
+Archived term: memory-mapped archive vs. rebuilt in-memory object graph.
+
+Archives a synthetic term of ``--students`` students (``--courses`` each,
+graded), then compares opening it as a TermArchive with loading the same
+file into in-memory repositories: time to open, memory allocated while
+opening (tracemalloc) and the time of ``--lookups`` random grade lookups.
+
+Run with:
+    python -m benchmarks.bench_term_archive [--students 200000] [--lookups 10000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Dict
+
+from application.services.student_management_system import StudentManagementSystem
+from infrastructure.archive.archive_course_repository import ArchiveCourseRepository
+from infrastructure.archive.archive_student_repository import ArchiveStudentRepository
+from infrastructure.archive.archive_teacher_repository import ArchiveTeacherRepository
+from infrastructure.archive.term_archive import TermArchive
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.journal.binary_snapshot_store import BinarySnapshotStore
+
+
+def _repos():
+    return InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+
+
+def _write_term(path: str, students: int, per_student: int, courses: int) -> None:
+    sms = StudentManagementSystem(*_repos())
+    rng = random.Random(1)
+    for i in range(courses):
+        sms.add_course(f"C{i:04d}", "Course")
+    for i in range(students):
+        student_id = f"S{i:07d}"
+        sms.add_student(student_id, "Student")
+        for code in rng.sample(range(courses), per_student):
+            sms.enroll_student_in_course(student_id, f"C{code:04d}")
+            sms.assign_grade_to_student(student_id, f"C{code:04d}", rng.uniform(0, 10))
+    TermArchive.write(path, sms.student_repo, sms.teacher_repo, sms.course_repo)
+
+
+def measure(path: str, backend: str, students: int, lookups: int) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    if backend == "archive":
+        archive = TermArchive(path)
+        sms = StudentManagementSystem(
+            ArchiveStudentRepository(archive),
+            ArchiveTeacherRepository(archive),
+            ArchiveCourseRepository(archive),
+        )
+    else:
+        repos = _repos()
+        BinarySnapshotStore(path).load(*repos)
+        sms = StudentManagementSystem(*repos)
+    open_s = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rng = random.Random(2)
+    start = time.perf_counter()
+    for _ in range(lookups):
+        student = sms.get_student(f"S{rng.randrange(students):07d}")
+        sum(student.grades_view.values())
+    lookup_s = time.perf_counter() - start
+    return {"open_ms": open_s * 1000, "mib": allocated / 2 ** 20, "lookup_us": lookup_s / lookups * 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=200_000)
+    parser.add_argument("--courses", type=int, default=4, help="courses per student")
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "term.archive")
+        _write_term(path, args.students, args.courses, courses=500)
+        print(f"{args.students} students, archive {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        print(f"{'backend':<10} {'open (ms)':>10} {'MiB':>8} {'lookup (us)':>12}")
+        for backend in ("archive", "in_memory"):
+            row = measure(path, backend, args.students, args.lookups)
+            print(f"{backend:<10} {row['open_ms']:>10.1f} {row['mib']:>8.1f} {row['lookup_us']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_transcripts.py
+"""
+Per-operation cost of Student transcript operations as transcripts grow.
+
+Measures enrollment side effects (Course.enroll / Course.drop, which call
+Student._add_course / Student._remove_course) and Student.assign_grade for
+students enrolled in an increasing number of courses. With id-indexed
+course maps the cost per operation should stay flat across sizes.
+
+Run with:
+    python -m benchmarks.bench_transcripts [--sizes 10 100 1000 10000]
+"""
+
+import argparse
+import time
+from typing import Dict, List, Sequence
+
+from domain.models.course import Course
+from domain.models.student import Student
+
+
+def _build_transcript(size: int) -> tuple[Student, List[Course]]:
+    student = Student("S0", "Benchmark")
+    courses = [Course(f"C{i}", f"Course {i}") for i in range(size)]
+    for course in courses:
+        course.enroll(student)
+    return student, courses
+
+
+def measure(size: int, repeats: int = 1000) -> Dict[str, float]:
+    """Return the mean cost in nanoseconds per operation for one transcript size."""
+    student, courses = _build_transcript(size)
+    last = courses[-1]
+
+    start = time.perf_counter_ns()
+    for i in range(repeats):
+        student.assign_grade(last, float(i % 11))
+    assign_grade_ns = (time.perf_counter_ns() - start) / repeats
+
+    start = time.perf_counter_ns()
+    for _ in range(repeats):
+        last.drop(student)
+        last.enroll(student)
+    drop_enroll_ns = (time.perf_counter_ns() - start) / repeats
+
+    return {
+        "transcript_size": size,
+        "assign_grade_ns": assign_grade_ns,
+        "drop_and_enroll_ns": drop_enroll_ns,
+    }
+
+
+def run(sizes: Sequence[int], repeats: int = 1000) -> List[Dict[str, float]]:
+    return [measure(size, repeats) for size in sizes]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--repeats", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'courses':>10} {'assign_grade (ns)':>20} {'drop+enroll (ns)':>20}")
+    for row in run(args.sizes, args.repeats):
+        print(
+            f"{row['transcript_size']:>10} "
+            f"{row['assign_grade_ns']:>20.0f} "
+            f"{row['drop_and_enroll_ns']:>20.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
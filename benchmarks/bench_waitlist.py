@@ -0,0 +1,88 @@
+# benchmarks/bench_waitlist.py
+"""
+Waitlists: registration into a full course and drop-driven promotion.
+
+Fills one course to capacity, waitlists ``--waitlisted`` students with
+random priorities through StudentManagementSystem, then drops enrolled
+students one at a time so each drop promotes the head of the waitlist.
+Per-operation times should stay flat as the waitlist grows (O(log n)
+heap operations). Also times clearing the waitlists of many courses with
+a single clear_waitlists() call.
+
+Run with:
+    python -m benchmarks.bench_waitlist [--waitlisted 100000] [--drops 10000]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict
+
+from application.services.student_management_system import StudentManagementSystem
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+
+
+def _sms() -> StudentManagementSystem:
+    return StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+
+
+def measure(waitlisted: int, drops: int, courses: int, seed: int = 1) -> Dict[str, float]:
+    rng = random.Random(seed)
+    sms = _sms()
+    sms.add_course("C0000", "Course", capacity=drops)
+    for i in range(drops + waitlisted):
+        sms.add_student(f"S{i:07d}", "Student")
+
+    for i in range(drops):
+        sms.register_student_in_course(f"S{i:07d}", "C0000")
+    start = time.perf_counter()
+    for i in range(drops, drops + waitlisted):
+        sms.register_student_in_course(f"S{i:07d}", "C0000", rng.random())
+    register_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(drops):
+        sms.drop_student_from_course(f"S{i:07d}", "C0000")
+    drop_s = time.perf_counter() - start
+
+    # Many small waitlists, cleared in one call.
+    codes = [f"C{i:04d}" for i in range(1, courses + 1)]
+    per_course = max(1, waitlisted // courses)
+    for code in codes:
+        sms.add_course(code, "Course", capacity=0)
+    for index, code in enumerate(codes):
+        for j in range(per_course):
+            sms.register_student_in_course(f"S{(index + j) % waitlisted + drops:07d}", code)
+    start = time.perf_counter()
+    cleared = sms.clear_waitlists(codes)
+    clear_s = time.perf_counter() - start
+
+    return {
+        "register_us": register_s / waitlisted * 1e6,
+        "drop_promote_us": drop_s / drops * 1e6,
+        "cleared": cleared,
+        "clear_s": clear_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--waitlisted", type=int, default=100_000)
+    parser.add_argument("--drops", type=int, default=10_000)
+    parser.add_argument("--courses", type=int, default=1_000)
+    args = parser.parse_args()
+
+    result = measure(args.waitlisted, args.drops, args.courses)
+    print(f"{args.waitlisted} waitlisted, {args.drops} drops, {args.courses} courses cleared")
+    print(f"register (waitlisted)  {result['register_us']:>10.2f} us/op")
+    print(f"drop + promote         {result['drop_promote_us']:>10.2f} us/op")
+    print(f"clear_waitlists        {result['clear_s']:>10.3f} s"
+          f"  ({result['cleared']:,} entries)")
+
+
+if __name__ == "__main__":
+    main()
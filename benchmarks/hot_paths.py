@@ -0,0 +1,268 @@
+# benchmarks/hot_paths.py
+"""
+Regression suite for the domain and service hot paths.
+
+Times Course.enroll, Course.drop, Student.assign_grade,
+StudentManagementSystem.remove_course and repository list_all (in-memory
+and SQLite) at each ``--sizes`` number of students, taking the best of
+``--repeat`` runs on freshly built data. Results are printed as a table
+and, with ``--output``, written as JSON. With ``--baseline`` (a JSON file
+written earlier by ``--output``), every case that got more than
+``--threshold`` slower per operation is flagged and the exit status is 1,
+so the suite can gate CI:
+
+    python -m benchmarks.hot_paths --output baseline.json
+    ...change...
+    python -m benchmarks.hot_paths --baseline baseline.json
+
+Run with:
+    python -m benchmarks.hot_paths [--sizes 1000 100000 1000000] [--cases course_enroll ...]
+
+The same cases run under pytest-benchmark through
+benchmarks/pytest_hot_paths.py.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from application.services.student_management_system import StudentManagementSystem
+from domain.models.course import Course
+from domain.models.student import Student
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.in_memory.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_student_repository import SqliteStudentRepository
+
+SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_SIZES = (1_000, 100_000)
+FORMAT_VERSION = 1
+
+# A prepared case: a callable doing the timed work, and how many
+# operations it performs.
+Prepared = Tuple[Callable[[], object], int]
+
+
+# ---------- Cases ----------
+def _students(size: int) -> List[Student]:
+    return [Student(f"S{i:07d}", "Student") for i in range(size)]
+
+
+def _courses(count: int) -> List[Course]:
+    return [Course(f"C{i:05d}", "Course") for i in range(count)]
+
+
+def _course_count(size: int) -> int:
+    # Roughly a university's ratio: one course per 50 students.
+    return max(1, size // 50)
+
+
+def _pairs(size: int, enrolled: bool = False) -> List[Tuple[Course, Student]]:
+    """(course, student) for every student, spread over the courses."""
+    courses = _courses(_course_count(size))
+    pairs = [(courses[i % len(courses)], student) for i, student in enumerate(_students(size))]
+    if enrolled:
+        for course, student in pairs:
+            course.enroll(student)
+    return pairs
+
+
+def prepare_course_enroll(size: int) -> Prepared:
+    """Enroll every student in one of the courses, one enroll() each."""
+    pairs = _pairs(size)
+
+    def run() -> None:
+        for course, student in pairs:
+            course.enroll(student)
+    return run, size
+
+
+def prepare_course_drop(size: int) -> Prepared:
+    """Drop every enrolled student again, one drop() each."""
+    pairs = _pairs(size, enrolled=True)
+
+    def run() -> None:
+        for course, student in pairs:
+            course.drop(student)
+    return run, size
+
+
+def prepare_student_assign_grade(size: int) -> Prepared:
+    """Grade every enrolled student, one assign_grade() each."""
+    pairs = _pairs(size, enrolled=True)
+
+    def run() -> None:
+        for index, (course, student) in enumerate(pairs):
+            student.assign_grade(course, float(index % 11))
+    return run, size
+
+
+def prepare_sms_remove_course(size: int) -> Prepared:
+    """Remove one course every student is enrolled in and graded for (1 op)."""
+    sms = StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository(),
+        unit_of_work=InMemoryUnitOfWork(),
+    )
+    student_ids = [f"S{i:07d}" for i in range(size)]
+    sms.import_students((student_id, "Student") for student_id in student_ids)
+    sms.import_courses([("C0", "Large lecture")])
+    sms.import_enrollments((student_id, "C0") for student_id in student_ids)
+    sms.import_grades(student_ids, ["C0"] * size, [float(i % 11) for i in range(size)])
+    return lambda: sms.remove_course("C0"), 1
+
+
+def prepare_in_memory_list_all(size: int) -> Prepared:
+    """InMemoryStudentRepository.list_all() over every student (1 op)."""
+    repo = InMemoryStudentRepository()
+    repo.add_many(_students(size))
+    return repo.list_all, 1
+
+
+def prepare_sqlite_list_all(size: int) -> Prepared:
+    """SqliteStudentRepository.list_all() from a cold identity map (1 op)."""
+    database = SqliteDatabase()
+    repo = SqliteStudentRepository(database)
+    repo.add_many(_students(size))
+
+    def run() -> None:
+        database.identity_map.clear()
+        repo.list_all()
+    return run, 1
+
+
+CASES: Dict[str, Callable[[int], Prepared]] = {
+    "course_enroll": prepare_course_enroll,
+    "course_drop": prepare_course_drop,
+    "student_assign_grade": prepare_student_assign_grade,
+    "sms_remove_course": prepare_sms_remove_course,
+    "in_memory_list_all": prepare_in_memory_list_all,
+    "sqlite_list_all": prepare_sqlite_list_all,
+}
+
+
+# ---------- Running ----------
+@dataclass(frozen=True)
+class Result:
+    case: str
+    size: int
+    ops: int
+    best_s: float       # fastest of the repeats
+    median_s: float
+    repeat: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}[{self.size}]"
+
+    @property
+    def per_op_us(self) -> float:
+        return self.best_s / self.ops * 1e6
+
+
+def run_case(case: str, size: int, repeat: int) -> Result:
+    """Time ``case`` on ``repeat`` freshly prepared datasets of ``size``."""
+    timings: List[float] = []
+    ops = 0
+    for _ in range(repeat):
+        run, ops = CASES[case](size)
+        gc.collect()
+        # Collections triggered by the setup's garbage would otherwise
+        # land in the timed region at random.
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del run
+    timings.sort()
+    return Result(case, size, ops, timings[0], timings[len(timings) // 2], repeat)
+
+
+def to_json(results: Sequence[Result]) -> dict:
+    return {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": {
+            result.key: {**asdict(result), "per_op_us": result.per_op_us} for result in results
+        },
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us if self.baseline_us else float("inf")
+
+
+def compare(results: Sequence[Result], baseline: dict, threshold: float) -> List[Comparison]:
+    """
+    The cases more than ``threshold`` (0.25 = 25%) slower per operation
+    than in ``baseline`` (as produced by to_json). Cases missing from the
+    baseline are not compared.
+    """
+    previous = baseline.get("results", {})
+    regressions = []
+    for result in results:
+        entry = previous.get(result.key)
+        if entry is None:
+            continue
+        comparison = Comparison(result.key, entry["per_op_us"], result.per_op_us)
+        if comparison.ratio > 1.0 + threshold:
+            regressions.append(comparison)
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help=f"numbers of students (suite sizes: {SIZES})")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="flag cases this much slower than the baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        for case in args.cases:
+            result = run_case(case, size, args.repeat)
+            results.append(result)
+            print(f"{result.key:<32} {result.per_op_us:>14.3f} us/op"
+                  f"  (best {result.best_s:.4f} s, median {result.median_s:.4f} s)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(to_json(results), file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.key}: {regression.baseline_us:.3f} -> "
+                  f"{regression.current_us:.3f} us/op ({regression.ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# benchmarks/pytest_hot_paths.py
+"""
+The hot_paths cases under pytest-benchmark (not installed by default, and
+not collected by the test suite: pass the file explicitly).
+
+    python -m pytest benchmarks/pytest_hot_paths.py --benchmark-json=out.json
+    python -m pytest benchmarks/pytest_hot_paths.py --benchmark-autosave
+    python -m pytest benchmarks/pytest_hot_paths.py --benchmark-compare \
+        --benchmark-compare-fail=min:25%
+
+Sizes default to 1k and 100k students; set HOT_PATH_SIZES (e.g.
+"1000,100000,1000000") to change them. Every round runs on freshly
+prepared data, as in hot_paths.run_case().
+"""
+
+import os
+
+import pytest
+
+from benchmarks.hot_paths import CASES, DEFAULT_SIZES
+
+pytest.importorskip("pytest_benchmark")
+
+_SIZES = [
+    int(size) for size in os.environ.get(
+        "HOT_PATH_SIZES", ",".join(map(str, DEFAULT_SIZES))
+    ).split(",")
+]
+
+
+@pytest.mark.parametrize("size", _SIZES)
+@pytest.mark.parametrize("case", list(CASES))
+def test_hot_path(benchmark, case, size):
+    def setup():
+        run, _ = CASES[case](size)
+        return (run,), {}
+
+    benchmark.group = case
+    benchmark.extra_info["size"] = size
+    benchmark.pedantic(lambda run: run(), setup=setup, rounds=5)
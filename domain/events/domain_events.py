@@ -0,0 +1,128 @@
+# domain/events/domain_events.py
+"""
+Domain events: one immutable record per successful state change.
+
+StudentManagementSystem emits them for every use case that changes state,
+in the order the changes were applied. Replaying them in that order (see
+application/services/event_replay.py) reproduces the same state. Cleanup
+implied by a removal (drops, unassignments) is part of the removal event
+rather than separate events, and so is a waitlisted student's promotion
+into the seat a drop or a capacity change freed.
+"""
+from dataclasses import dataclass
+from typing import Union
+
+
+# -------------- Entities added / removed -------------------
+
+@dataclass(frozen=True, slots=True)
+class StudentAdded:
+    student_id: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class TeacherAdded:
+    teacher_id: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class CourseAdded:
+    course_code: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class StudentRemoved:
+    student_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class TeacherRemoved:
+    teacher_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class CourseRemoved:
+    course_code: str
+
+
+# -------------- Relationships -------------------
+
+@dataclass(frozen=True, slots=True)
+class TeacherAssigned:
+    teacher_id: str
+    course_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class TeacherUnassigned:
+    course_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class Enrolled:
+    student_id: str
+    course_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class Dropped:
+    student_id: str
+    course_code: str
+
+
+# -------------- Capacity and waitlists -------------------
+
+@dataclass(frozen=True, slots=True)
+class CapacitySet:
+    course_code: str
+    capacity: int
+
+
+@dataclass(frozen=True, slots=True)
+class CapacityRemoved:
+    course_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class Waitlisted:
+    student_id: str
+    course_code: str
+    priority: float
+
+
+@dataclass(frozen=True, slots=True)
+class WaitlistLeft:
+    student_id: str
+    course_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class WaitlistCleared:
+    course_code: str
+
+
+# -------------- Grades -------------------
+
+@dataclass(frozen=True, slots=True)
+class GradeAssigned:
+    student_id: str
+    course_code: str
+    value: float
+
+
+@dataclass(frozen=True, slots=True)
+class GradeRemoved:
+    student_id: str
+    course_code: str
+
+
+DomainEvent = Union[
+    StudentAdded, TeacherAdded, CourseAdded,
+    StudentRemoved, TeacherRemoved, CourseRemoved,
+    TeacherAssigned, TeacherUnassigned, Enrolled, Dropped,
+    GradeAssigned, GradeRemoved,
+    CapacitySet, CapacityRemoved, Waitlisted, WaitlistLeft, WaitlistCleared,
+]
@@ -19,6 +19,10 @@ class DuplicateEntityError(EntityError):
     """Raised when attempting to create an entity that already exists."""
     pass
 
+class ReadOnlyError(EntityError):
+    """Raised when attempting to change entities held in read-only storage (e.g. an archived term)."""
+    pass
+
 # -------------- Relationship Errors ----------------------
 
 class RelationshipError(DomainError):
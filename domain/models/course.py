@@ -3,8 +3,12 @@ from domain.exceptions.domain_exceptions import (
     EnrollmentError,
     TeacherAssignmentError,
 )
+from domain.models.grade_stats import GradeStats, GradeSummary
+from domain.models.views import EntityView
+from domain.models.waitlist import Waitlist
 
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from operator import attrgetter
+from typing import Callable, Optional, Dict, Iterator, MutableMapping, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.models.student import Student
@@ -12,11 +16,87 @@ if TYPE_CHECKING:
 
 
 class Course:
-    def __init__(self, code: str, name: str):
+    # Slots keep per-instance overhead low for large in-memory datasets;
+    # __weakref__ lets identity maps and caches hold courses weakly.
+    __slots__ = (
+        "_code", "_name", "_students", "_teacher", "_grade_stats",
+        "_capacity", "_waitlist", "_observer", "__weakref__",
+    )
+
+    def __init__(self, code: str, name: str, capacity: Optional[int] = None):
+        _check_capacity(code, capacity)
         self._code = code
         self._name = name
-        self._students: List[Student] = []
+        # Roster indexed by student id. Dicts preserve insertion order, so
+        # this gives O(1) membership/drop while keeping enrollment order.
+        self._students: Dict[str, "Student"] = {}
         self._teacher: Optional[Teacher] = None
+        # Running aggregates of the grades given in this course; built on
+        # first read, then kept in step by Student's grade operations.
+        self._grade_stats: Optional[GradeStats] = None
+        # Seat limit (None = unlimited) and the queue for a full course;
+        # the queue is only created once someone joins it. Invariant: a
+        # non-empty waitlist means the course is full.
+        self._capacity = capacity
+        self._waitlist: Optional[Waitlist] = None
+        # Called after every teacher or roster change (see observe()).
+        self._observer: Optional[Callable[["Course"], None]] = None
+
+    @classmethod
+    def reconstitute(
+            cls,
+            code: str,
+            name: str,
+            teacher: Optional["Teacher"],
+            students: MutableMapping[str, "Student"],
+            capacity: Optional[int] = None,
+            waitlist: Optional[Waitlist] = None,
+    ) -> "Course":
+        """
+        Rebuild a stored Course without re-running enrollment rules.
+
+        For repository implementations only. ``students`` is the roster keyed
+        by student id in enrollment order; it may be a lazily loaded mapping.
+        The caller is responsible for the other side of each relationship
+        (including each waitlisted student's waitlisted courses).
+        """
+        course = cls.__new__(cls)
+        course._code = code
+        course._name = name
+        course._students = students
+        course._teacher = teacher
+        course._grade_stats = None
+        course._capacity = capacity
+        course._waitlist = waitlist or None
+        course._observer = None
+        return course
+
+    def attach_roster(self, students: MutableMapping[str, "Student"]) -> None:
+        """
+        Move this course's roster into ``students`` and keep it there from
+        now on (e.g. a mapping that records changes for its repository).
+
+        For repository implementations only.
+        """
+        current = list(self._students.items())
+        students.clear()
+        students.update(current)
+        self._students = students
+
+    def observe(self, observer: Optional[Callable[["Course"], None]]) -> None:
+        """
+        Call ``observer`` with this course after each change of its teacher
+        or roster (None stops it), e.g. to keep a repository's indexes in
+        step with changes made through the course itself. A course has one
+        observer at a time.
+
+        For repository implementations only.
+        """
+        self._observer = observer
+
+    def _changed(self) -> None:
+        if self._observer is not None:
+            self._observer(self)
 
     # --------- Teacher Management ----------
     def assign_teacher(self, teacher: "Teacher") -> None:
@@ -27,6 +107,7 @@ class Course:
 
         self._teacher = teacher
         teacher._add_course(self)    # protected internal mutation
+        self._changed()
 
     def unassign_teacher(self) -> None:
         if self._teacher is None:
@@ -37,25 +118,226 @@ class Course:
         teacher = self._teacher
         self._teacher = None
         teacher._remove_course(self)    # protected internal mutation
+        self._changed()
 
     # ---------- Student Enrollment -----------
     def enroll(self, student: "Student") -> None:
-        if student in self._students:
+        if student.id in self._students:
             raise EnrollmentError(
                 f"Student '{student.id}' is already enrolled in '{self.code}'."
             )
+        if self.is_full:
+            raise EnrollmentError(
+                f"Course '{self._code}' is full ({self._capacity} seats)."
+            )
 
-        self._students.append(student)
+        self._students[student.id] = student
         student._add_course(self)    # protected internal mutation
+        self._changed()
+
+    def enroll_all(self, students: Sequence["Student"]) -> None:
+        """
+        Enroll many students at once, e.g. when bootstrapping from stored
+        data. The same rules as enroll() are checked for the whole batch up
+        front (one set operation for duplicates), so either every student
+        is enrolled or none is.
+        """
+        batch = {student.id: student for student in students}
+        if len(batch) != len(students):
+            raise EnrollmentError(
+                f"The batch for '{self._code}' lists a student more than once."
+            )
+        if not self._students.keys().isdisjoint(batch):
+            enrolled = [student_id for student_id in batch if student_id in self._students]
+            raise EnrollmentError(
+                f"Students {enrolled[:5]} are already enrolled in '{self._code}'."
+            )
+        if self._capacity is not None and len(self._students) + len(batch) > self._capacity:
+            raise EnrollmentError(
+                f"Course '{self._code}' has {self._capacity - len(self._students)} free "
+                f"seats; cannot enroll {len(batch)} students."
+            )
+
+        self._students.update(batch)
+        # Student._add_course's own duplicate check is implied by the roster
+        # check above, so the student side is written directly.
+        code = self._code
+        for student in students:
+            student._courses[code] = self    # protected internal mutation
+        self._changed()
 
-    def drop(self, student: "Student") -> None:
-        if student not in self._students:
+    def drop(self, student: "Student") -> Optional["Student"]:
+        """
+        Drop ``student`` and give the freed seat to the next waitlisted
+        student, who is returned (None if nobody was waiting).
+        """
+        if self._students.get(student.id) is not student:
             raise EnrollmentError(
                 f"Student '{student.id}' is not enrolled in '{self._code}'."
             )
 
-        self._students.remove(student)
+        del self._students[student.id]
         student._remove_course(self)    # protected internal mutation
+        promoted = self._fill_from_waitlist()
+        self._changed()
+        return promoted[0] if promoted else None
+
+    def drop_all(self) -> Tuple["Student", ...]:
+        """
+        Drop every enrolled student in one pass and return them in
+        enrollment order. Each student's side (course entry and grade) is
+        cleaned up as in drop(), without re-checking the roster per student.
+        The waitlist is cleared too rather than promoted into the empty
+        course.
+        """
+        self.clear_waitlist()
+        students = tuple(self._students.values())
+        self._students.clear()
+        for student in students:
+            student._remove_course(self)    # protected internal mutation
+        self._changed()
+        return students
+
+    def detach_all(self) -> Tuple["Student", ...]:
+        """
+        Release every relationship of this course (teacher, roster and
+        waitlist), e.g. before it is deleted. Returns the dropped students.
+        """
+        if self._teacher is not None:
+            self.unassign_teacher()
+        return self.drop_all()
+
+    # ---------- Capacity and waitlist ----------
+    def set_capacity(self, capacity: Optional[int]) -> Tuple["Student", ...]:
+        """
+        Change the seat limit (None = unlimited). Seats added this way go to
+        waitlisted students, in waitlist order; they are returned.
+        """
+        _check_capacity(self._code, capacity)
+        if capacity is not None and capacity < len(self._students):
+            raise EnrollmentError(
+                f"Course '{self._code}' already has {len(self._students)} "
+                f"students; cannot lower its capacity to {capacity}."
+            )
+
+        self._capacity = capacity
+        promoted = self._fill_from_waitlist()
+        if promoted:
+            self._changed()
+        return promoted
+
+    def register(self, student: "Student", priority: float = 0.0) -> bool:
+        """
+        Enroll ``student`` if a seat is free, otherwise put them on the
+        waitlist with ``priority`` (lower is served first; ties by arrival,
+        so a timestamp works). Returns True if the student was enrolled.
+        """
+        if not self.is_full:
+            self.enroll(student)
+            return True
+        self.join_waitlist(student, priority)
+        return False
+
+    def join_waitlist(self, student: "Student", priority: float = 0.0) -> None:
+        if student.id in self._students:
+            raise EnrollmentError(
+                f"Student '{student.id}' is already enrolled in '{self._code}'."
+            )
+        if self._waitlist is not None and student.id in self._waitlist:
+            raise EnrollmentError(
+                f"Student '{student.id}' is already waitlisted for '{self._code}'."
+            )
+        if not self.is_full:
+            raise EnrollmentError(
+                f"Course '{self._code}' has free seats; enroll instead."
+            )
+
+        if self._waitlist is None:
+            self._waitlist = Waitlist()
+        self._waitlist.push(student, priority)
+        student._add_waitlist(self)    # protected internal mutation
+
+    def leave_waitlist(self, student: "Student") -> None:
+        if self._waitlist is None or self._waitlist.discard(student.id) is None:
+            raise EnrollmentError(
+                f"Student '{student.id}' is not waitlisted for '{self._code}'."
+            )
+
+        student._remove_waitlist(self)    # protected internal mutation
+
+    def clear_waitlist(self) -> Tuple["Student", ...]:
+        """Remove everyone from the waitlist; returns them in waitlist order."""
+        if not self._waitlist:
+            return ()
+        students = self._waitlist.clear()
+        for student in students:
+            student._remove_waitlist(self)    # protected internal mutation
+        return students
+
+    def _fill_from_waitlist(self) -> Tuple["Student", ...]:
+        waitlist = self._waitlist
+        if not waitlist:
+            return ()
+        promoted = []
+        while waitlist and not self.is_full:
+            student = waitlist.pop()
+            student._remove_waitlist(self)    # protected internal mutation
+            self._students[student.id] = student
+            student._add_course(self)    # protected internal mutation
+            promoted.append(student)
+        return tuple(promoted)
+
+    # ---------- Memento (transaction rollback) ----------
+    def memento(self) -> tuple:
+        """
+        Capture the course's state (name, teacher, roster, capacity and
+        waitlist) so it can later be put back with restore(). Rolling back a
+        relationship change requires restoring the mementos of every entity
+        involved, taken together.
+        """
+        waitlist = self._waitlist.copy() if self._waitlist else None
+        return (self._name, self._teacher, dict(self._students), self._capacity, waitlist)
+
+    def restore(self, memento: tuple) -> None:
+        self._name, self._teacher, students, self._capacity, waitlist = memento
+        # Restore in place: live views (students_view) wrap this mapping.
+        self._students.clear()
+        self._students.update(students)
+        self._waitlist = waitlist.copy() if waitlist else None
+        self._grade_stats = None
+        self._changed()
+
+    # ---------- Grade aggregates ----------
+    def _grade_changed(self, old: Optional[float], new: Optional[float]) -> None:
+        if self._grade_stats is not None:
+            self._grade_stats.replace(old, new)
+
+    def _invalidate_grade_stats(self) -> None:
+        self._grade_stats = None
+
+    def _grade_values(self) -> Iterator[float]:
+        for student in self._students.values():
+            grade = student.get_grade(self)
+            if grade is not None:
+                yield grade
+
+    def _current_grade_stats(self) -> GradeStats:
+        stats = self._grade_stats
+        if stats is None:
+            stats = self._grade_stats = GradeStats.of(self._grade_values())
+        elif stats.extremes_stale:
+            stats.refresh_extremes(self._grade_values())
+        return stats
+
+    @property
+    def average_grade(self) -> Optional[float]:
+        """Mean of the grades given in this course, or None without grades."""
+        return self._current_grade_stats().mean
+
+    @property
+    def grade_summary(self) -> GradeSummary:
+        """Count, mean, variance, min and max of the grades in this course."""
+        return self._current_grade_stats().summary()
 
     # ---------- Read-only properties ----------
     @property
@@ -72,5 +354,52 @@ class Course:
 
     @property
     def students(self) -> Tuple["Student", ...]:
-        return tuple(self._students)
+        """Snapshot of the roster; use students_view to avoid the copy."""
+        return tuple(self._students.values())
+
+    @property
+    def students_view(self) -> EntityView["Student"]:
+        """Live read-only view of the roster (no copy)."""
+        return EntityView(self._students, _student_id)
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Seat limit, or None if unlimited."""
+        return self._capacity
+
+    @property
+    def is_full(self) -> bool:
+        return self._capacity is not None and len(self._students) >= self._capacity
+
+    @property
+    def waitlist(self) -> Tuple["Student", ...]:
+        """Waitlisted students in the order they will be served."""
+        return tuple(self._waitlist) if self._waitlist else ()
+
+    @property
+    def waitlist_entries(self) -> Tuple[Tuple["Student", float, int], ...]:
+        """(student, priority, arrival seq) per waitlisted student, in order."""
+        return tuple(self._waitlist.entries()) if self._waitlist else ()
+
+    @property
+    def waitlist_length(self) -> int:
+        return len(self._waitlist) if self._waitlist is not None else 0
+
+    @property
+    def next_waitlisted(self) -> Optional["Student"]:
+        """The student a freed seat would go to, or None."""
+        return self._waitlist.peek() if self._waitlist else None
+
+    def is_waitlisted(self, student: "Student") -> bool:
+        return self._waitlist is not None and student.id in self._waitlist
+
+
+def _check_capacity(code: str, capacity: Optional[int]) -> None:
+    if capacity is not None and capacity < 0:
+        raise EnrollmentError(
+            f"Capacity of course '{code}' cannot be negative."
+        )
+
+
+_student_id = attrgetter("id")
 
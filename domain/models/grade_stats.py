@@ -0,0 +1,101 @@
+# domain/models/grade_stats.py
+from dataclasses import dataclass
+from math import sqrt
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class GradeSummary:
+    """Point-in-time statistics over a set of grades (population variance)."""
+
+    count: int
+    mean: Optional[float]
+    variance: Optional[float]
+    minimum: Optional[float]
+    maximum: Optional[float]
+
+    @property
+    def stddev(self) -> Optional[float]:
+        return None if self.variance is None else sqrt(self.variance)
+
+
+class GradeStats:
+    """
+    Running count / sum / sum of squares / min / max over a set of grades,
+    maintained by Course and Student as grades are assigned and removed.
+
+    Everything is O(1) to update and read, except that removing the
+    current minimum or maximum marks the extremes stale; the owner then
+    rescans its grades once on the next read (see refresh_extremes).
+    """
+
+    __slots__ = ("count", "total", "total_sq", "_minimum", "_maximum", "extremes_stale")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._minimum: Optional[float] = None
+        self._maximum: Optional[float] = None
+        self.extremes_stale = False
+
+    @classmethod
+    def of(cls, values: Iterable[float]) -> "GradeStats":
+        stats = cls()
+        for value in values:
+            stats.add(value)
+        return stats
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if not self.extremes_stale:
+            if self._minimum is None or value < self._minimum:
+                self._minimum = value
+            if self._maximum is None or value > self._maximum:
+                self._maximum = value
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if self.count == 0:
+            # Start from exact zeros again rather than accumulated rounding.
+            self.total = self.total_sq = 0.0
+            self._minimum = self._maximum = None
+            self.extremes_stale = False
+            return
+        self.total -= value
+        self.total_sq -= value * value
+        if value == self._minimum or value == self._maximum:
+            self.extremes_stale = True
+
+    def replace(self, old: Optional[float], new: Optional[float]) -> None:
+        """Apply one grade changing from ``old`` to ``new`` (None = absent)."""
+        if old is not None:
+            self.remove(old)
+        if new is not None:
+            self.add(new)
+
+    def refresh_extremes(self, values: Iterable[float]) -> None:
+        """Recompute min/max from the owner's current grades."""
+        values = list(values)
+        self._minimum = min(values, default=None)
+        self._maximum = max(values, default=None)
+        self.extremes_stale = False
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        # Clamp tiny negative results caused by floating-point cancellation.
+        return max(self.total_sq / self.count - mean * mean, 0.0)
+
+    def summary(self) -> GradeSummary:
+        if self.extremes_stale:
+            raise RuntimeError("refresh_extremes() must be called before summary().")
+        return GradeSummary(self.count, self.mean, self.variance, self._minimum, self._maximum)
@@ -3,52 +3,128 @@ from domain.exceptions.domain_exceptions import (
     GradeError,
     EntityError
 )
+from domain.models.grade_stats import GradeStats, GradeSummary
+from domain.models.views import EntityView
 
-from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Mapping, MutableMapping, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.models.course import Course
 
+# Inclusive bounds for a valid grade.
+MIN_GRADE = 0.0
+MAX_GRADE = 10.0
+
 
 class Student:
+    # Millions of historical students may be resident at once, so no
+    # per-instance __dict__ (see Course.__slots__).
+    __slots__ = (
+        "_id", "_name", "_courses", "_grades", "_grade_stats", "_waitlists", "__weakref__",
+    )
+
     def __init__(self, student_id: str, name: str):
         self._id = student_id
         self._name = name
-        self._courses: List[Course] = []
+        # Enrolled courses indexed by course code (insertion-ordered).
+        self._courses: Dict[str, "Course"] = {}
         self._grades: Dict[Course, float] = {}
+        # Running grade aggregates; built on first read, then kept in step.
+        self._grade_stats: Optional[GradeStats] = None
+        # Courses this student is waitlisted for, by code; most students
+        # never are, so the dict is only created on first use.
+        self._waitlists: Optional[MutableMapping[str, "Course"]] = None
+
+    @classmethod
+    def reconstitute(
+            cls,
+            student_id: str,
+            name: str,
+            courses: MutableMapping[str, "Course"],
+            grades: MutableMapping["Course", float],
+            waitlists: Optional[MutableMapping[str, "Course"]] = None,
+    ) -> "Student":
+        """
+        Rebuild a stored Student without re-running enrollment/grade rules.
+
+        For repository implementations only; the collections may be lazily
+        loaded mappings and must agree with the courses' rosters and
+        waitlists.
+        """
+        student = cls.__new__(cls)
+        student._id = student_id
+        student._name = name
+        student._courses = courses
+        student._grades = grades
+        student._grade_stats = None
+        student._waitlists = waitlists
+        return student
+
+    def attach_grades(self, grades: MutableMapping["Course", float]) -> None:
+        """
+        Move this student's grades into ``grades`` and keep them there from
+        now on (e.g. a columnar grade store shared by many students).
+
+        For repository implementations only.
+        """
+        current = list(self._grades.items())
+        grades.clear()
+        grades.update(current)
+        self._grades = grades
 
     # ----------- Protected internal access (only Course should call these) ----------
     def _add_course(self, course: "Course") -> None:
-        if course in self._courses:
+        if course.code in self._courses:
             raise EnrollmentError(
                 f"Student '{self._id}' is already enrolled in '{course.code}'."
             )
 
-        self._courses.append(course)
+        self._courses[course.code] = course
 
     def _remove_course(self, course: "Course") -> None:
-        if course not in self._courses:
+        if not self._is_enrolled_in(course):
             raise EnrollmentError(
                 f"Student '{self._id}' is not enrolled in '{course.code}'"
             )
 
-        self._courses.remove(course)
-        self._grades.pop(course, None)    # remove grade if existed
+        del self._courses[course.code]
+        old = self._grades.pop(course, None)    # remove grade if existed
+        if old is not None:
+            self._grade_changed(course, old, None)
+
+    def _is_enrolled_in(self, course: "Course") -> bool:
+        return self._courses.get(course.code) is course
+
+    def _add_waitlist(self, course: "Course") -> None:
+        if self._waitlists is None:
+            self._waitlists = {}
+        self._waitlists[course.code] = course
+
+    def _remove_waitlist(self, course: "Course") -> None:
+        if self._waitlists is not None:
+            self._waitlists.pop(course.code, None)
 
     # ---------- Grade Management ----------
     def assign_grade(self, course: "Course", value: float) -> None:
-        if course not in self._courses:
+        if not self._is_enrolled_in(course):
             raise GradeError(
                 f"Cannot assign grade to course '{course.code}'."
                 f"Student '{self._id}' is not enrolled."
             )
 
-        if not (0.0 <= value <= 10.0):
+        if not (MIN_GRADE <= value <= MAX_GRADE):
             raise GradeError(
-                "Grades must be between 0.0 and 10.0 (inclusive)."
+                f"Grades must be between {MIN_GRADE} and {MAX_GRADE} (inclusive)."
             )
 
-        self._grades[course] = value
+        grades = self._grades
+        old = grades.get(course)
+        grades[course] = value
+        # Aggregate the value as stored (grade storage may round it, e.g.
+        # to float32), so a later replace or remove subtracts the same one.
+        self._grade_changed(course, old, grades[course])
 
     def remove_grade(self, course: "Course") -> None:
         if course not in self._grades:
@@ -56,11 +132,60 @@ class Student:
                 f"No grade assigned for course '{course.code}'."
             )
 
-        del self._grades[course]
+        old = self._grades.pop(course)
+        self._grade_changed(course, old, None)
 
     def get_grade(self, course: "Course") -> Optional[float]:
         return self._grades.get(course)
 
+    # ---------- Memento (transaction rollback) ----------
+    def memento(self) -> tuple:
+        """Capture name, courses, grades and waitlists; see Course.memento."""
+        waitlists = dict(self._waitlists) if self._waitlists else None
+        return (self._name, dict(self._courses), dict(self._grades), waitlists)
+
+    def restore(self, memento: tuple) -> None:
+        self._name, courses, grades, waitlists = memento
+        self._waitlists = dict(waitlists) if waitlists else None
+        # Courses whose grade from this student changes must recount.
+        for course in self._grades.keys() | grades.keys():
+            if self._grades.get(course) != grades.get(course):
+                course._invalidate_grade_stats()
+        # Restore in place: live views (courses_view) wrap the mapping,
+        # and the grades may be external grade storage.
+        self._courses.clear()
+        self._courses.update(courses)
+        self._grades.clear()
+        self._grades.update(grades)
+        self._grade_stats = None
+
+    # ---------- Grade aggregates ----------
+    def _grade_changed(
+            self, course: "Course", old: Optional[float], new: Optional[float]
+    ) -> None:
+        """Keep this student's and the course's running aggregates in step."""
+        if self._grade_stats is not None:
+            self._grade_stats.replace(old, new)
+        course._grade_changed(old, new)    # protected internal mutation
+
+    def _current_grade_stats(self) -> GradeStats:
+        stats = self._grade_stats
+        if stats is None:
+            stats = self._grade_stats = GradeStats.of(self._grades.values())
+        elif stats.extremes_stale:
+            stats.refresh_extremes(self._grades.values())
+        return stats
+
+    @property
+    def gpa(self) -> Optional[float]:
+        """Unweighted mean of this student's grades, or None without grades."""
+        return self._current_grade_stats().mean
+
+    @property
+    def grade_summary(self) -> GradeSummary:
+        """Count, mean, variance, min and max of this student's grades."""
+        return self._current_grade_stats().summary()
+
     # ---------- Public properties (queries only) ----------
     @property
     def id(self) -> str:
@@ -81,9 +206,29 @@ class Student:
 
     @property
     def courses(self) -> Tuple["Course", ...]:
-        return tuple(self._courses)
+        """Snapshot of enrolled courses; use courses_view to avoid the copy."""
+        return tuple(self._courses.values())
+
+    @property
+    def courses_view(self) -> EntityView["Course"]:
+        """Live read-only view of enrolled courses (no copy)."""
+        return EntityView(self._courses, _course_code)
+
+    @property
+    def waitlisted_courses(self) -> Tuple["Course", ...]:
+        """Courses this student is waiting for a seat in."""
+        return tuple(self._waitlists.values()) if self._waitlists else ()
 
     @property
     def grades(self) -> Dict["Course", float]:
+        """Snapshot copy of grades; use grades_view to avoid the copy."""
         return dict(self._grades)
 
+    @property
+    def grades_view(self) -> Mapping["Course", float]:
+        """Live read-only mapping of grades (no copy)."""
+        return MappingProxyType(self._grades)
+
+
+_course_code = attrgetter("code")
+
@@ -2,34 +2,64 @@ from domain.exceptions.domain_exceptions import (
     TeacherAssignmentError,
     EntityError,
 )
+from domain.models.views import EntityView
 
-from typing import List, Tuple, TYPE_CHECKING
+from operator import attrgetter
+from typing import Dict, MutableMapping, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.models.course import Course
 
 class Teacher:
+    __slots__ = ("_id", "_name", "_courses", "__weakref__")
+
     def __init__(self, teacher_id: str, name: str):
         self._id = teacher_id
         self._name = name
-        self._courses: List["Course"] = []
+        # Assigned courses indexed by course code (insertion-ordered).
+        self._courses: Dict[str, "Course"] = {}
+
+    @classmethod
+    def reconstitute(
+            cls, teacher_id: str, name: str, courses: MutableMapping[str, "Course"]
+    ) -> "Teacher":
+        """
+        Rebuild a stored Teacher for a repository implementation. ``courses``
+        (possibly lazily loaded) must match the courses' teacher references.
+        """
+        teacher = cls.__new__(cls)
+        teacher._id = teacher_id
+        teacher._name = name
+        teacher._courses = courses
+        return teacher
 
     # ---------- Protected internal access (only Course should call these) ----------
     def _add_course(self, course: "Course") -> None:
-        if course in self._courses:
+        if course.code in self._courses:
             raise TeacherAssignmentError(
                 f"Teacher '{self._id}' is already assigned to '{course.code}'"
             )
 
-        self._courses.append(course)
+        self._courses[course.code] = course
 
     def _remove_course(self, course: "Course") -> None:
-        if course not in self._courses:
+        if self._courses.get(course.code) is not course:
             raise TeacherAssignmentError(
                 f"Teacher '{self._id}' is not assigned to '{course.code}'"
             )
 
-        self._courses.remove(course)
+        del self._courses[course.code]
+
+    # ---------- Memento (transaction rollback) ----------
+    def memento(self) -> tuple:
+        """Capture name and assigned courses; see Course.memento."""
+        return (self._name, dict(self._courses))
+
+    def restore(self, memento: tuple) -> None:
+        self._name, courses = memento
+        # Restore in place: live views wrap this mapping.
+        self._courses.clear()
+        self._courses.update(courses)
 
     # ---------- Public properties (queries only) ----------
     @property
@@ -51,5 +81,14 @@ class Teacher:
 
     @property
     def courses(self) -> Tuple["Course", ...]:
-        return tuple(self._courses)
+        """Snapshot of assigned courses; use courses_view to avoid the copy."""
+        return tuple(self._courses.values())
+
+    @property
+    def courses_view(self) -> EntityView["Course"]:
+        """Live read-only view of assigned courses (no copy)."""
+        return EntityView(self._courses, _course_code)
+
+
+_course_code = attrgetter("code")
 
@@ -0,0 +1,69 @@
+# domain/models/views.py
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import islice
+from typing import Callable, Generic, Optional, Tuple, TypeVar, Union
+
+E = TypeVar("E")
+
+
+class EntityView(Sequence, Generic[E]):
+    """
+    Live, read-only view over an entity's id-indexed relationship collection.
+
+    Unlike the tuple returned by the snapshot properties (e.g. Course.students),
+    an EntityView does not copy anything: it reflects later enrollments and
+    drops, and offers no way to mutate the underlying collection. Membership
+    checks use the id index and are O(1).
+
+    Positions follow the collection's order (e.g. enrollment order). The
+    mapping has no positional index, so ``view[i]`` walks i entries and a
+    slice returns a tuple snapshot; iterate, or take the snapshot property,
+    to visit many positions.
+    """
+
+    __slots__ = ("_entities", "_key")
+
+    def __init__(self, entities: Mapping[str, E], key: Callable[[E], str]) -> None:
+        self._entities = entities
+        self._key = key
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __iter__(self) -> Iterator[E]:
+        return iter(self._entities.values())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[E, Tuple[E, ...]]:
+        if isinstance(index, slice):
+            return tuple(self._entities.values())[index]
+        size = len(self._entities)
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError(f"{type(self).__name__} index {index} out of range.")
+        return next(islice(self._entities.values(), position, None))
+
+    def __reversed__(self) -> Iterator[E]:
+        try:
+            return reversed(self._entities.values())
+        except TypeError:    # a Mapping whose values view is not reversible
+            return reversed(tuple(self._entities.values()))
+
+    def __contains__(self, entity: object) -> bool:
+        try:
+            key = self._key(entity)
+        except AttributeError:
+            return False
+        return self._entities.get(key) is entity
+
+    def index(self, entity: object, start: int = 0, stop: Optional[int] = None) -> int:
+        """Position of ``entity``; ValueError if it is not in [start, stop)."""
+        if entity in self:
+            start, stop, _ = slice(start, stop).indices(len(self._entities))
+            for position, member in enumerate(
+                    islice(self._entities.values(), start, stop), start):
+                if member is entity:
+                    return position
+        raise ValueError(f"{entity!r} is not in the view.")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._entities.values())!r})"
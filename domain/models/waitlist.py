@@ -0,0 +1,131 @@
+# domain/models/waitlist.py
+from heapq import heapify, heappop, heappush
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.models.student import Student
+
+
+class Waitlist:
+    """
+    Priority queue of students waiting for a seat in a course.
+
+    Students are served by ascending ``priority`` and, on equal priority,
+    in arrival order; with the default priority of 0 it is a plain FIFO
+    queue, and passing a registration timestamp as the priority orders by
+    time. push/pop are O(log n) on a binary heap; discard (a student
+    leaving the queue) is O(1): the heap entry is left behind and skipped
+    when it reaches the top, and the heap is compacted once most of it is
+    stale.
+
+    Owned by Course, which keeps Student's side of the relationship.
+    """
+
+    __slots__ = ("_heap", "_entries", "_seq")
+
+    def __init__(self) -> None:
+        # (priority, arrival seq, student id); may hold stale entries.
+        self._heap: List[Tuple[float, int, str]] = []
+        # student id -> (priority, arrival seq, student): the live members.
+        self._entries: Dict[str, Tuple[float, int, "Student"]] = {}
+        self._seq = 0
+
+    @classmethod
+    def of(cls, entries: Iterable[Tuple["Student", float, int]]) -> "Waitlist":
+        """
+        Rebuild a stored waitlist from (student, priority, arrival seq)
+        triples, e.g. as returned by entries(). For repository
+        implementations only.
+        """
+        waitlist = cls()
+        for student, priority, seq in entries:
+            waitlist._entries[student.id] = (priority, seq, student)
+            waitlist._heap.append((priority, seq, student.id))
+            if seq >= waitlist._seq:
+                waitlist._seq = seq + 1
+        heapify(waitlist._heap)
+        return waitlist
+
+    def copy(self) -> "Waitlist":
+        waitlist = Waitlist.__new__(Waitlist)
+        waitlist._heap = list(self._heap)
+        waitlist._entries = dict(self._entries)
+        waitlist._seq = self._seq
+        return waitlist
+
+    # ---------- Queue operations ----------
+    def push(self, student: "Student", priority: float = 0.0) -> None:
+        """Queue ``student``, who must not be queued already."""
+        seq = self._seq
+        self._seq += 1
+        self._entries[student.id] = (priority, seq, student)
+        heappush(self._heap, (priority, seq, student.id))
+
+    def peek(self) -> Optional["Student"]:
+        """The student who would be served next, or None if empty."""
+        self._drop_stale_head()
+        return self._entries[self._heap[0][2]][2] if self._heap else None
+
+    def pop(self) -> Optional["Student"]:
+        """Remove and return the student served next, or None if empty."""
+        self._drop_stale_head()
+        if not self._heap:
+            return None
+        _, _, student_id = heappop(self._heap)
+        return self._entries.pop(student_id)[2]
+
+    def discard(self, student_id: str) -> Optional["Student"]:
+        """Remove a student from anywhere in the queue; None if not queued."""
+        entry = self._entries.pop(student_id, None)
+        if entry is None:
+            return None
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._compact()
+        return entry[2]
+
+    def clear(self) -> Tuple["Student", ...]:
+        """Empty the queue; returns the removed students in service order."""
+        students = tuple(student for student, _, _ in self.entries())
+        self._heap.clear()
+        self._entries.clear()
+        return students
+
+    # ---------- Queries ----------
+    def priority(self, student_id: str) -> Optional[float]:
+        entry = self._entries.get(student_id)
+        return None if entry is None else entry[0]
+
+    def entries(self) -> List[Tuple["Student", float, int]]:
+        """(student, priority, arrival seq) of every member in service order."""
+        return [
+            (student, priority, seq)
+            for priority, seq, student in sorted(self._entries.values(), key=_order)
+        ]
+
+    def __iter__(self) -> Iterator["Student"]:
+        """Members in service order (sorts a copy: O(n log n))."""
+        return (student for student, _, _ in self.entries())
+
+    def __contains__(self, student_id: object) -> bool:
+        return student_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------- Internals ----------
+    def _is_live(self, item: Tuple[float, int, str]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is not None and entry[1] == item[1]
+
+    def _drop_stale_head(self) -> None:
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [(priority, seq, student.id) for priority, seq, student in self._entries.values()]
+        heapify(self._heap)
+
+
+def _order(entry: Tuple[float, int, "Student"]) -> Tuple[float, int]:
+    return entry[0], entry[1]
@@ -0,0 +1,62 @@
+#async_base_repository.py
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Generic, Iterable, Optional, Tuple, TypeVar
+
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+class AsyncBaseRepository(ABC, Generic[T, K]):
+    """
+    Asynchronous counterpart of BaseRepository, for storage that lives out
+    of process. Every method has the same contract as its synchronous
+    namesake; only the calling convention differs.
+    """
+
+    @abstractmethod
+    async def add(self, entity: T) -> None:
+        """Persist a new entity. Raises DuplicateEntityError on conflict."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, key: K) -> T:
+        """Retrieve an entity by its identity key. Raises EntityNotFoundError."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, entity: T) -> None:
+        """Persist changes made to an already stored entity."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, key: K) -> None:
+        """Delete an entity. Must enforce cleanup through aggregate roots."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> Iterable[T]:
+        """Return a read-only iterable of all stored entities."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, limit: int, after_id: Optional[K] = None) -> Page[T]:
+        """See BaseRepository.list_page."""
+        raise NotImplementedError
+
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """Lazily iterate over all entities in ascending key order (see list_page)."""
+        after_id = None
+        while True:
+            page = await self.list_page(batch_size, after_id)
+            for entity in page.items:
+                yield entity
+            if page.next_after is None:
+                return
+            after_id = page.next_after
+
+    async def find(self, query: Query[T]) -> Tuple[T, ...]:
+        """Return every entity matching ``query``, in ascending key order."""
+        return tuple([entity async for entity in self.stream() if query.matches(entity)])
@@ -0,0 +1,42 @@
+#async_course_repository.py
+
+from abc import abstractmethod
+from typing import Iterable, Optional
+
+from domain.repositories.async_base_repository import AsyncBaseRepository
+from domain.repositories.pagination import Page
+from domain.models.course import Course
+
+
+class AsyncCourseRepository(AsyncBaseRepository[Course, str]):
+    """Asynchronous counterpart of CourseRepository (same contract)."""
+
+    @abstractmethod
+    async def add(self, course: Course) -> None:
+        """Persist a new Course."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, course_code: str) -> Course:
+        """Retrieve a Course by its code."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, course: Course) -> None:
+        """Persist changes to a Course: name, teacher assignment and roster."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, course_code: str) -> None:
+        """Remove a Course by its code."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> Iterable[Course]:
+        """Return all Courses as a read-only iterable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Course]:
+        """Return the next page of Courses, ordered by code."""
+        raise NotImplementedError
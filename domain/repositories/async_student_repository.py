@@ -0,0 +1,42 @@
+#async_student_repository.py
+
+from abc import abstractmethod
+from typing import Iterable, Optional
+
+from domain.repositories.async_base_repository import AsyncBaseRepository
+from domain.repositories.pagination import Page
+from domain.models.student import Student
+
+
+class AsyncStudentRepository(AsyncBaseRepository[Student, str]):
+    """Asynchronous counterpart of StudentRepository (same contract)."""
+
+    @abstractmethod
+    async def add(self, student: Student) -> None:
+        """Persist a new Student."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, student_id: str) -> Student:
+        """Retrieve a Student by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, student: Student) -> None:
+        """Persist changes to a Student: name and grades."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, student_id: str) -> None:
+        """Remove a Student by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> Iterable[Student]:
+        """Return all Students as a read-only iterable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        """Return the next page of Students, ordered by ID."""
+        raise NotImplementedError
@@ -0,0 +1,42 @@
+#async_teacher_repository.py
+
+from abc import abstractmethod
+from typing import Iterable, Optional
+
+from domain.repositories.async_base_repository import AsyncBaseRepository
+from domain.repositories.pagination import Page
+from domain.models.teacher import Teacher
+
+
+class AsyncTeacherRepository(AsyncBaseRepository[Teacher, str]):
+    """Asynchronous counterpart of TeacherRepository (same contract)."""
+
+    @abstractmethod
+    async def add(self, teacher: Teacher) -> None:
+        """Persist a new Teacher."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, teacher_id: str) -> Teacher:
+        """Retrieve a Teacher by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, teacher: Teacher) -> None:
+        """Persist changes to a Teacher: name."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, teacher_id: str) -> None:
+        """Remove a Teacher by ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(self) -> Iterable[Teacher]:
+        """Return all Teachers as a read-only iterable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        """Return the next page of Teachers, ordered by ID."""
+        raise NotImplementedError
@@ -0,0 +1,21 @@
+#async_unit_of_work.py
+from abc import ABC, abstractmethod
+
+
+class AsyncUnitOfWork(ABC):
+    """Asynchronous counterpart of UnitOfWork (same contract)."""
+
+    @abstractmethod
+    async def begin(self) -> None:
+        """Open a storage transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Make all writes since begin() durable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard all writes since begin()."""
+        raise NotImplementedError
@@ -1,6 +1,9 @@
 #base_repository.py
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, Iterator, Optional, Sequence, Tuple
+
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -18,11 +21,31 @@ class BaseRepository(ABC, Generic[T, K]):
         """Persist a new entity. Raises DuplicateEntityError on conflict."""
         raise NotImplementedError
 
+    def add_many(self, entities: Sequence[T]) -> None:
+        """
+        Persist many new entities at once (bulk import). Raises
+        DuplicateEntityError on conflict.
+
+        This default calls add() per entity, so a conflict leaves the
+        entities before it stored; implementations should override it to
+        check the whole batch up front and store it in one step.
+        """
+        for entity in entities:
+            self.add(entity)
+
     @abstractmethod
     def get(self, key: K) -> T:
         """Retrieve an entity by its identity key. Raises EntityNotFoundError."""
         raise NotImplementedError
 
+    @abstractmethod
+    def update(self, entity: T) -> None:
+        """
+        Persist changes made to an already stored entity (e.g. after an
+        enrollment or grade change). Raises EntityNotFoundError.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, key: K) -> None:
         """Delete an entity. Must enforce cleanup through aggregate roots."""
@@ -32,3 +55,34 @@ class BaseRepository(ABC, Generic[T, K]):
     def list_all(self) -> Iterable[T]:
         """Return a read-only iterable of all stored entities."""
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, limit: int, after_id: Optional[K] = None) -> Page[T]:
+        """
+        Return up to ``limit`` entities whose key sorts after ``after_id``
+        (from the start when None), in ascending key order.
+        """
+        raise NotImplementedError
+
+    def stream(self, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Lazily iterate over all entities in ascending key order, fetching
+        ``batch_size`` at a time via list_page. Entities added or removed
+        while streaming are seen or skipped consistently with that order.
+        """
+        after_id = None
+        while True:
+            page = self.list_page(batch_size, after_id)
+            yield from page.items
+            if page.next_after is None:
+                return
+            after_id = page.next_after
+
+    def find(self, query: Query[T]) -> Tuple[T, ...]:
+        """
+        Return every entity matching ``query``, in ascending key order.
+
+        This default streams through all entities and tests each one;
+        implementations with secondary indexes should override it.
+        """
+        return tuple(entity for entity in self.stream() if query.matches(entity))
@@ -1,9 +1,10 @@
 #course_repository.py
 
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional
 
 from domain.repositories.base_repository import BaseRepository
+from domain.repositories.pagination import Page
 from domain.models.course import Course
 
 
@@ -27,6 +28,11 @@ class CourseRepository(BaseRepository[Course, str]):
         """Retrieve a Course by its code."""
         raise NotImplementedError
 
+    @abstractmethod
+    def update(self, course: Course) -> None:
+        """Persist changes to a Course: name, teacher assignment and roster."""
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, course_code: str) -> None:
         """Remove a Course by its code."""
@@ -35,4 +41,9 @@ class CourseRepository(BaseRepository[Course, str]):
     @abstractmethod
     def list_all(self) -> Iterable[Course]:
         """Return all Courses as a read-only iterable."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Course]:
+        """Return the next page of Courses, ordered by code."""
+        raise NotImplementedError
@@ -0,0 +1,38 @@
+#event_journal.py
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Sequence
+
+from domain.events.domain_events import DomainEvent
+
+
+class EventJournal(ABC):
+    """
+    Append-only log of domain events, written by StudentManagementSystem.
+
+    Events appended together belong to one committed use case or
+    transaction and must be written as a unit. Implementations decide when
+    appended events become durable (see sync()).
+    """
+
+    @abstractmethod
+    def append(self, events: Sequence[DomainEvent]) -> None:
+        """Append events, in order, after everything appended before."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sync(self) -> None:
+        """Make every appended event durable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def position(self) -> int:
+        """Opaque position just after the last appended event (see replay())."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def replay(self, after: Optional[int] = None) -> Iterator[DomainEvent]:
+        """
+        Iterate over appended events in append order: all of them, or only
+        those appended after an earlier position() (e.g. a snapshot's).
+        """
+        raise NotImplementedError
@@ -0,0 +1,38 @@
+#pagination.py
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """
+    One page of a keyset-paginated listing, ordered by identity key.
+
+    ``next_after`` is the cursor to pass as ``after_id`` for the following
+    page, or None when this is the last page.
+    """
+
+    items: Tuple[T, ...]
+    next_after: Optional[str] = None
+
+
+def fetch_page(
+        fetch: Callable[[int, Optional[str]], Sequence[T]],
+        limit: int,
+        after_id: Optional[str],
+        key: Callable[[T], str],
+) -> Page[T]:
+    """
+    list_page() for storage that can fetch the first ``n`` entities after
+    a key, in key order: ``fetch(n, after_id)``. One extra entity is
+    fetched to learn whether another page follows; ``key`` gives the
+    cursor of the last one kept.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be a positive integer.")
+    items = fetch(limit + 1, after_id)
+    if len(items) > limit:
+        return Page(tuple(items[:limit]), key(items[limit - 1]))
+    return Page(tuple(items))
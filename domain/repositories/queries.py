@@ -0,0 +1,76 @@
+#queries.py
+from dataclasses import dataclass
+from typing import Optional, Protocol, TypeVar
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+
+T = TypeVar("T", contravariant=True)
+
+
+class Query(Protocol[T]):
+    """
+    Declarative filter passed to BaseRepository.find.
+
+    ``matches`` is the reference semantics; repositories with secondary
+    indexes answer the same question without testing every entity.
+    """
+
+    def matches(self, entity: T) -> bool:
+        ...
+
+
+def _has_name_prefix(name: str, prefix: Optional[str]) -> bool:
+    # Name prefixes are matched case-insensitively.
+    return prefix is None or name.casefold().startswith(prefix.casefold())
+
+
+@dataclass(frozen=True, slots=True)
+class StudentQuery:
+    """Students whose name starts with ``name_prefix`` (case-insensitive)."""
+
+    name_prefix: Optional[str] = None
+
+    def matches(self, student: Student) -> bool:
+        return _has_name_prefix(student.name, self.name_prefix)
+
+
+@dataclass(frozen=True, slots=True)
+class TeacherQuery:
+    """Teachers whose name starts with ``name_prefix`` (case-insensitive)."""
+
+    name_prefix: Optional[str] = None
+
+    def matches(self, teacher: Teacher) -> bool:
+        return _has_name_prefix(teacher.name, self.name_prefix)
+
+
+@dataclass(frozen=True, slots=True)
+class CourseQuery:
+    """
+    Courses matching every criterion that is set:
+
+    - ``name_prefix``: name starts with it (case-insensitive).
+    - ``teacher_id``: taught by that teacher.
+    - ``has_teacher``: False for courses taught by nobody, True for the rest.
+    - ``min_students`` / ``max_students``: inclusive bounds on enrollment.
+    """
+
+    name_prefix: Optional[str] = None
+    teacher_id: Optional[str] = None
+    has_teacher: Optional[bool] = None
+    min_students: Optional[int] = None
+    max_students: Optional[int] = None
+
+    def matches(self, course: Course) -> bool:
+        teacher = course.teacher
+        size = len(course.students_view)
+        return (
+            _has_name_prefix(course.name, self.name_prefix)
+            and (self.teacher_id is None
+                 or (teacher is not None and teacher.id == self.teacher_id))
+            and (self.has_teacher is None or (teacher is not None) == self.has_teacher)
+            and (self.min_students is None or size >= self.min_students)
+            and (self.max_students is None or size <= self.max_students)
+        )
@@ -0,0 +1,41 @@
+#snapshot_store.py
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+
+
+class SnapshotStore(ABC):
+    """
+    Point-in-time copy of the three repositories and the relationships
+    between their entities, taken by StudentManagementSystem.checkpoint().
+
+    Each snapshot records the event journal position it reflects, so a
+    restart only has to load the snapshot and replay the events after it.
+    """
+
+    @abstractmethod
+    def save(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+            journal_position: int,
+    ) -> None:
+        """Replace the stored snapshot with the repositories' current state."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+    ) -> Optional[int]:
+        """
+        Add the stored snapshot's entities to the (empty) repositories and
+        return its journal position, or None if there is no snapshot yet.
+        """
+        raise NotImplementedError
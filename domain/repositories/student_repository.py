@@ -1,9 +1,10 @@
 #student_repository.py
 
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional
 
 from domain.repositories.base_repository import BaseRepository
+from domain.repositories.pagination import Page
 from domain.models.student import Student
 
 
@@ -28,6 +29,11 @@ class StudentRepository(BaseRepository[Student, str]):
         """Retrieve a Student by ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def update(self, student: Student) -> None:
+        """Persist changes to a Student: name and grades."""
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, student_id: str) -> None:
         """Remove a Student by ID."""
@@ -37,3 +43,8 @@ class StudentRepository(BaseRepository[Student, str]):
     def list_all(self) -> Iterable[Student]:
         """Return all Students as a read-only iterable."""
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        """Return the next page of Students, ordered by ID."""
+        raise NotImplementedError
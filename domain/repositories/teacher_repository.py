@@ -1,9 +1,10 @@
 #teacher_repository.py
 
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional
 
 from domain.repositories.base_repository import BaseRepository
+from domain.repositories.pagination import Page
 from domain.models.teacher import Teacher
 
 
@@ -28,6 +29,11 @@ class TeacherRepository(BaseRepository[Teacher, str]):
         """Retrieve a Teacher by ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def update(self, teacher: Teacher) -> None:
+        """Persist changes to a Teacher (name)."""
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, teacher_id: str) -> None:
         """Remove a Teacher by ID."""
@@ -36,4 +42,9 @@ class TeacherRepository(BaseRepository[Teacher, str]):
     @abstractmethod
     def list_all(self) -> Iterable[Teacher]:
         """Returns all Teachers as a read-only iterable."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        """Return the next page of Teachers, ordered by ID."""
+        raise NotImplementedError
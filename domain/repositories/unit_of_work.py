@@ -0,0 +1,27 @@
+#unit_of_work.py
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """
+    Storage transaction boundary used by StudentManagementSystem.transaction().
+
+    Everything the repositories write between begin() and commit() must
+    become durable together (one flush / fsync), and rollback() must discard
+    it. Implementations are shared by the three repositories of a backend.
+    """
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Open a storage transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Make all writes since begin() durable."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all writes since begin()."""
+        raise NotImplementedError
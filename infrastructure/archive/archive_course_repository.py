@@ -0,0 +1,41 @@
+# infrastructure/archive/archive_course_repository.py
+
+from __future__ import annotations
+from operator import attrgetter
+from typing import Iterable, Optional
+
+from domain.models.course import Course
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import EntityNotFoundError
+from infrastructure.archive.read_only_repository import ReadOnlyRepositoryMixin
+from infrastructure.archive.term_archive import TermArchive
+
+
+class ArchiveCourseRepository(ReadOnlyRepositoryMixin, CourseRepository):
+    """
+    Read-only CourseRepository over a TermArchive.
+
+    Lookups and pages are served straight from the archive file;
+    a course's roster is decoded only when first used.
+    add/add_many/update/remove raise ReadOnlyError.
+    """
+
+    _entity_name = "Course"
+    _entity_key = attrgetter("code")
+
+    def __init__(self, archive: TermArchive) -> None:
+        self._archive = archive
+
+    def get(self, course_code: str) -> Course:
+        course = self._archive.load_course(course_code)
+        if course is None:
+            raise EntityNotFoundError(f"Course '{course_code}' not found.")
+        return course
+
+    def list_all(self) -> Iterable[Course]:
+        # Materializes every course; prefer stream() for large archives.
+        return tuple(self._archive.load_all_courses())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Course]:
+        return fetch_page(self._archive.load_course_page, limit, after_id, self._entity_key)
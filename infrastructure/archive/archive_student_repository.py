@@ -0,0 +1,41 @@
+# infrastructure/archive/archive_student_repository.py
+
+from __future__ import annotations
+from operator import attrgetter
+from typing import Iterable, Optional
+
+from domain.models.student import Student
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import EntityNotFoundError
+from infrastructure.archive.read_only_repository import ReadOnlyRepositoryMixin
+from infrastructure.archive.term_archive import TermArchive
+
+
+class ArchiveStudentRepository(ReadOnlyRepositoryMixin, StudentRepository):
+    """
+    Read-only StudentRepository over a TermArchive.
+
+    Lookups and pages are served straight from the archive file;
+    relationships and grades are decoded only when first used.
+    add/add_many/update/remove raise ReadOnlyError.
+    """
+
+    _entity_name = "Student"
+    _entity_key = attrgetter("id")
+
+    def __init__(self, archive: TermArchive) -> None:
+        self._archive = archive
+
+    def get(self, student_id: str) -> Student:
+        student = self._archive.load_student(student_id)
+        if student is None:
+            raise EntityNotFoundError(f"Student '{student_id}' not found.")
+        return student
+
+    def list_all(self) -> Iterable[Student]:
+        # Materializes every student; prefer stream() for large archives.
+        return tuple(self._archive.load_all_students())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        return fetch_page(self._archive.load_student_page, limit, after_id, self._entity_key)
@@ -0,0 +1,41 @@
+# infrastructure/archive/archive_teacher_repository.py
+
+from __future__ import annotations
+from operator import attrgetter
+from typing import Iterable, Optional
+
+from domain.models.teacher import Teacher
+from domain.repositories.teacher_repository import TeacherRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import EntityNotFoundError
+from infrastructure.archive.read_only_repository import ReadOnlyRepositoryMixin
+from infrastructure.archive.term_archive import TermArchive
+
+
+class ArchiveTeacherRepository(ReadOnlyRepositoryMixin, TeacherRepository):
+    """
+    Read-only TeacherRepository over a TermArchive.
+
+    Lookups and pages are served straight from the archive file;
+    a teacher's courses are decoded only when first used.
+    add/add_many/update/remove raise ReadOnlyError.
+    """
+
+    _entity_name = "Teacher"
+    _entity_key = attrgetter("id")
+
+    def __init__(self, archive: TermArchive) -> None:
+        self._archive = archive
+
+    def get(self, teacher_id: str) -> Teacher:
+        teacher = self._archive.load_teacher(teacher_id)
+        if teacher is None:
+            raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+        return teacher
+
+    def list_all(self) -> Iterable[Teacher]:
+        # Materializes every teacher; prefer stream() for large archives.
+        return tuple(self._archive.load_all_teachers())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        return fetch_page(self._archive.load_teacher_page, limit, after_id, self._entity_key)
@@ -0,0 +1,34 @@
+# infrastructure/archive/read_only_repository.py
+
+from __future__ import annotations
+from typing import Callable, Sequence
+
+from domain.exceptions.domain_exceptions import ReadOnlyError
+
+
+class ReadOnlyRepositoryMixin:
+    """
+    The mutators of a read-only repository: add, add_many, update and
+    remove raise ReadOnlyError. List it before the repository interface,
+    and set ``_entity_name`` (e.g. "Student") and ``_entity_key`` (the
+    entity's key getter).
+    """
+
+    _entity_name: str
+    _entity_key: Callable[[object], str]
+
+    def add(self, entity) -> None:
+        raise ReadOnlyError(
+            f"{self._entity_name} '{self._entity_key(entity)}' cannot be added to an archived term."
+        )
+
+    def add_many(self, entities: Sequence) -> None:
+        raise ReadOnlyError(f"{self._entity_name}s cannot be added to an archived term.")
+
+    def update(self, entity) -> None:
+        raise ReadOnlyError(
+            f"{self._entity_name} '{self._entity_key(entity)}' belongs to an archived term."
+        )
+
+    def remove(self, key: str) -> None:
+        raise ReadOnlyError(f"{self._entity_name} '{key}' belongs to an archived term.")
@@ -0,0 +1,96 @@
+# infrastructure/archive/term_archive.py
+
+from __future__ import annotations
+
+from typing import Callable, Iterator, List, Optional
+from weakref import WeakValueDictionary
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+from infrastructure.journal.snapshot_format import SnapshotFile, SnapshotGraph, write_snapshot
+
+
+class TermArchive:
+    """
+    Read-only archive of one closed term: its students, teachers, courses,
+    enrollments and grades in a memory-mapped file (the snapshot format,
+    see snapshot_format), shared by the three Archive*Repository classes.
+
+    - Opening maps the file and reads its header; nothing else is decoded.
+    - A lookup by id is a binary search over the sorted, fixed-size
+      records; a page is a run of consecutive records.
+    - Each entity is materialized on access with only its id and name.
+      Its relationships are decoded from the file on first use.
+    - Materialized entities are kept only while referenced elsewhere, and
+      an entity is materialized at most once while it is alive. Resident
+      memory therefore follows what callers hold, not the archive size.
+
+    Entities must not be used after close(); unloaded relationships read
+    from the mapping.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = SnapshotFile(path)
+        self._graph = SnapshotGraph(self._file, cache=WeakValueDictionary)
+
+    @staticmethod
+    def write(
+            path: str,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+    ) -> None:
+        """Archive the current contents of the repositories to ``path``."""
+        write_snapshot(path, teacher_repo.list_all(), course_repo.list_all(), student_repo.list_all())
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> TermArchive:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ---------- Loading (used by the repositories) ----------
+    def load_student(self, student_id: str) -> Optional[Student]:
+        index = self._file.find_student(student_id)
+        return None if index is None else self._graph.student(index)
+
+    def load_teacher(self, teacher_id: str) -> Optional[Teacher]:
+        index = self._file.find_teacher(teacher_id)
+        return None if index is None else self._graph.teacher(index)
+
+    def load_course(self, course_code: str) -> Optional[Course]:
+        index = self._file.find_course(course_code)
+        return None if index is None else self._graph.course(index)
+
+    def load_all_students(self) -> Iterator[Student]:
+        return map(self._graph.student, range(self._file.student_count))
+
+    def load_all_teachers(self) -> Iterator[Teacher]:
+        return map(self._graph.teacher, range(self._file.teacher_count))
+
+    def load_all_courses(self) -> Iterator[Course]:
+        return map(self._graph.course, range(self._file.course_count))
+
+    def load_student_page(self, limit: int, after_id: Optional[str]) -> List[Student]:
+        start = self._file.students_after(after_id)
+        return _run(self._graph.student, start, min(start + limit, self._file.student_count))
+
+    def load_teacher_page(self, limit: int, after_id: Optional[str]) -> List[Teacher]:
+        start = self._file.teachers_after(after_id)
+        return _run(self._graph.teacher, start, min(start + limit, self._file.teacher_count))
+
+    def load_course_page(self, limit: int, after_code: Optional[str]) -> List[Course]:
+        start = self._file.courses_after(after_code)
+        return _run(self._graph.course, start, min(start + limit, self._file.course_count))
+
+
+def _run(materialize: Callable[[int], object], start: int, end: int) -> List:
+    return [materialize(index) for index in range(start, end)]
@@ -0,0 +1,88 @@
+# infrastructure/in_memory/async_adapters.py
+
+from __future__ import annotations
+from typing import Generic, Iterable, Optional, Tuple, TypeVar
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.repositories.async_base_repository import AsyncBaseRepository
+from domain.repositories.async_course_repository import AsyncCourseRepository
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_teacher_repository import AsyncTeacherRepository
+from domain.repositories.async_unit_of_work import AsyncUnitOfWork
+from domain.repositories.base_repository import BaseRepository
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+from domain.repositories.unit_of_work import UnitOfWork
+
+T = TypeVar("T")
+
+
+class AsyncRepositoryAdapter(AsyncBaseRepository[T, str], Generic[T]):
+    """
+    Exposes a synchronous repository through the async ports.
+
+    Calls are forwarded directly on the event loop thread: this suits the
+    in-memory repositories, whose operations never block. A repository that
+    does blocking I/O should get a native async implementation instead.
+    """
+
+    def __init__(self, repository: BaseRepository[T, str]) -> None:
+        self.repository = repository
+
+    async def add(self, entity: T) -> None:
+        self.repository.add(entity)
+
+    async def get(self, key: str) -> T:
+        return self.repository.get(key)
+
+    async def update(self, entity: T) -> None:
+        self.repository.update(entity)
+
+    async def remove(self, key: str) -> None:
+        self.repository.remove(key)
+
+    async def list_all(self) -> Iterable[T]:
+        return self.repository.list_all()
+
+    async def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[T]:
+        return self.repository.list_page(limit, after_id)
+
+    async def find(self, query: Query[T]) -> Tuple[T, ...]:
+        # Use the wrapped repository's indexes rather than the default scan.
+        return self.repository.find(query)
+
+
+class AsyncStudentRepositoryAdapter(AsyncRepositoryAdapter[Student], AsyncStudentRepository):
+    def __init__(self, repository: StudentRepository) -> None:
+        super().__init__(repository)
+
+
+class AsyncTeacherRepositoryAdapter(AsyncRepositoryAdapter[Teacher], AsyncTeacherRepository):
+    def __init__(self, repository: TeacherRepository) -> None:
+        super().__init__(repository)
+
+
+class AsyncCourseRepositoryAdapter(AsyncRepositoryAdapter[Course], AsyncCourseRepository):
+    def __init__(self, repository: CourseRepository) -> None:
+        super().__init__(repository)
+
+
+class AsyncUnitOfWorkAdapter(AsyncUnitOfWork):
+    """Exposes a synchronous UnitOfWork through the async port."""
+
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+    async def begin(self) -> None:
+        self.unit_of_work.begin()
+
+    async def commit(self) -> None:
+        self.unit_of_work.commit()
+
+    async def rollback(self) -> None:
+        self.unit_of_work.rollback()
@@ -0,0 +1,33 @@
+# infrastructure/in_memory/batch.py
+
+from __future__ import annotations
+from typing import Callable, Dict, Mapping, Sequence, Set, TypeVar
+
+from domain.exceptions.domain_exceptions import DuplicateEntityError
+
+T = TypeVar("T")
+
+
+def new_batch(
+        entities: Sequence[T],
+        key: Callable[[T], str],
+        stored: Mapping[str, object],
+        kind: str,
+) -> Dict[str, T]:
+    """
+    Key a batch of entities for add_many(), raising DuplicateEntityError
+    before anything is stored if a key repeats within the batch or is
+    already in ``stored``. The stored check is one set operation.
+    """
+    batch = {key(entity): entity for entity in entities}
+    if len(batch) != len(entities):
+        seen: Set[str] = set()
+        for k in map(key, entities):
+            if k in seen:
+                raise DuplicateEntityError(f"{kind} '{k}' appears twice in the batch.")
+            seen.add(k)
+    # Iterates whichever side is smaller.
+    if not batch.keys().isdisjoint(stored.keys()):
+        existing = next(k for k in batch if k in stored)
+        raise DuplicateEntityError(f"{kind} '{existing}' already exists.")
+    return batch
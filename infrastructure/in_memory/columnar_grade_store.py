@@ -0,0 +1,303 @@
+# infrastructure/in_memory/columnar_grade_store.py
+
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from bisect import bisect_right
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:  # Optional: vectorized analytics over the grade columns.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+from domain.models.course import Course
+from domain.models.student import MIN_GRADE, MAX_GRADE
+
+_NO_ROW = -1
+
+
+class ColumnarGradeStore:
+    """
+    All grades of all students in four parallel columns instead of one
+    ``Dict[Course, float]`` per student:
+
+        student  array('i')  student index of each row
+        course   array('i')  course index of each row
+        value    array('f')  the grade, stored as float32
+        next     array('i')  next row of the same student (-1 ends the chain)
+
+    Student ids and course codes map to their indices through plain dicts;
+    ``head[student index]`` is the student's first row. Each student's rows
+    form a chain, so per-student reads and writes cost O(courses graded)
+    and deletes stay O(1) amortized by moving the last row into the gap.
+
+    Students use it through ``grades_for(student_id)``, a MutableMapping
+    that can be handed to Student.reconstitute or Student.attach_grades.
+    Analytics run over whole columns, vectorized when NumPy is installed.
+
+    Values are stored as float32, so a grade is read back as the nearest
+    float32 (e.g. 7.3 -> 7.300000190734863); this is what halves the
+    memory of the value column.
+
+    Thread-safe: reads and writes take an internal lock.
+    """
+
+    __slots__ = (
+        "_student_index", "_student_ids", "_course_index", "_courses",
+        "_head", "_student", "_course", "_value", "_next", "_lock",
+    )
+
+    def __init__(self) -> None:
+        self._student_index: Dict[str, int] = {}
+        self._student_ids: List[str] = []
+        self._course_index: Dict[str, int] = {}
+        self._courses: List[Course] = []
+        self._head = array("i")
+        self._student = array("i")
+        self._course = array("i")
+        self._value = array("f")
+        self._next = array("i")
+        # The columns are shared by all students; every public entry point
+        # holds this lock so concurrent use cases cannot tear a row.
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._value)
+
+    # ---------- Per-student access ----------
+    def grades_for(self, student_id: str) -> StudentGrades:
+        """Live ``{Course: grade}`` mapping over one student's rows."""
+        with self._lock:
+            return StudentGrades(self, self._student_slot(student_id))
+
+    def _student_slot(self, student_id: str) -> int:
+        index = self._student_index.get(student_id)
+        if index is None:
+            index = self._student_index[student_id] = len(self._student_ids)
+            self._student_ids.append(student_id)
+            self._head.append(_NO_ROW)
+        return index
+
+    def _course_slot(self, course: Course) -> int:
+        index = self._course_index.get(course.code)
+        if index is None:
+            index = self._course_index[course.code] = len(self._courses)
+            self._courses.append(course)
+        else:
+            # A re-created course with a reused code takes over the slot.
+            self._courses[index] = course
+        return index
+
+    def _rows_of(self, student: int) -> Iterator[int]:
+        row, next_row = self._head[student], self._next
+        while row != _NO_ROW:
+            yield row
+            row = next_row[row]
+
+    def _find(self, student: int, course: Course) -> int:
+        index = self._course_index.get(course.code)
+        if index is None or self._courses[index] is not course:
+            return _NO_ROW
+        for row in self._rows_of(student):
+            if self._course[row] == index:
+                return row
+        return _NO_ROW
+
+    def _set(self, student: int, course: Course, value: float) -> None:
+        row = self._find(student, course)
+        if row != _NO_ROW:
+            self._value[row] = value
+            return
+        self._student.append(student)
+        self._course.append(self._course_slot(course))
+        self._value.append(value)
+        self._next.append(self._head[student])
+        self._head[student] = len(self._value) - 1
+
+    def _delete(self, student: int, row: int) -> None:
+        self._unlink(student, row)
+        last = len(self._value) - 1
+        if row != last:
+            # Move the last row into the gap and re-point its predecessor.
+            moved_student = self._student[last]
+            self._relink(moved_student, last, row)
+            self._student[row] = moved_student
+            self._course[row] = self._course[last]
+            self._value[row] = self._value[last]
+            self._next[row] = self._next[last]
+        for column in (self._student, self._course, self._value, self._next):
+            column.pop()
+
+    def _unlink(self, student: int, row: int) -> None:
+        self._relink(student, row, self._next[row])
+
+    def _relink(self, student: int, old: int, new: int) -> None:
+        """Make whatever pointed at row ``old`` in the chain point at ``new``."""
+        if self._head[student] == old:
+            self._head[student] = new
+            return
+        for previous in self._rows_of(student):
+            if self._next[previous] == old:
+                self._next[previous] = new
+                return
+
+    # ---------- Analytics ----------
+    def course_values(self, course_code: str) -> Sequence[float]:
+        """All grades given in a course (an ndarray when NumPy is available)."""
+        with self._lock:
+            index = self._course_index.get(course_code, _NO_ROW)
+            if np is not None:
+                return self._values_array()[self._courses_array() == index]
+            return [v for c, v in zip(self._course, self._value) if c == index]
+
+    def course_histogram(
+            self, course_code: str, bins: int = 10
+    ) -> Tuple[List[int], List[float]]:
+        """
+        Counts of a course's grades in ``bins`` equal-width bins over
+        [MIN_GRADE, MAX_GRADE], and the ``bins + 1`` bin edges. The last
+        bin includes MAX_GRADE.
+        """
+        values = self.course_values(course_code)
+        if np is not None:
+            counts, edges = np.histogram(values, bins=bins, range=(MIN_GRADE, MAX_GRADE))
+            return counts.tolist(), edges.tolist()
+        width = (MAX_GRADE - MIN_GRADE) / bins
+        edges = [MIN_GRADE + i * width for i in range(bins)] + [MAX_GRADE]
+        counts = [0] * bins
+        for value in values:
+            counts[min(bisect_right(edges, value) - 1, bins - 1)] += 1
+        return counts, edges
+
+    def course_percentiles(
+            self, course_code: str, percentiles: Sequence[float]
+    ) -> List[Optional[float]]:
+        """Linearly interpolated percentiles (0-100) of a course's grades."""
+        values = self.course_values(course_code)
+        if not len(values):
+            return [None] * len(percentiles)
+        if np is not None:
+            return np.percentile(values, percentiles).tolist()
+        ordered = sorted(values)
+        result = []
+        for percentile in percentiles:
+            position = (len(ordered) - 1) * percentile / 100
+            low = math.floor(position)
+            high = min(low + 1, len(ordered) - 1)
+            result.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+        return result
+
+    def course_z_scores(self, course_code: str) -> Dict[str, float]:
+        """
+        Each graded student's z-score within a course (population standard
+        deviation); all zeros when every grade is the same.
+        """
+        with self._lock:
+            index = self._course_index.get(course_code, _NO_ROW)
+            if np is not None:
+                mask = self._courses_array() == index
+                values = self._values_array()[mask].astype(np.float64)
+                students = np.frombuffer(self._student, dtype=np.int32)[mask]
+                if not len(values):
+                    return {}
+                std = values.std()
+                scores = (values - values.mean()) / std if std else np.zeros_like(values)
+                return {self._student_ids[s]: z for s, z in zip(students.tolist(), scores.tolist())}
+
+            rows = [(s, v) for s, c, v in zip(self._student, self._course, self._value) if c == index]
+            if not rows:
+                return {}
+            mean = sum(v for _, v in rows) / len(rows)
+            std = math.sqrt(sum((v - mean) ** 2 for _, v in rows) / len(rows))
+            return {self._student_ids[s]: (v - mean) / std if std else 0.0 for s, v in rows}
+
+    def grade_matrix(self):
+        """
+        Dense students x courses grade matrix with NaN where no grade is
+        set. Returns ``(student_ids, course_codes, matrix)``; the matrix is
+        a float32 ndarray when NumPy is available, else a list of lists.
+        """
+        with self._lock:
+            student_ids = list(self._student_ids)
+            course_codes = [course.code for course in self._courses]
+            if np is not None:
+                matrix = np.full((len(student_ids), len(course_codes)), np.nan, dtype=np.float32)
+                matrix[
+                    np.frombuffer(self._student, dtype=np.int32),
+                    self._courses_array(),
+                ] = self._values_array()
+                return student_ids, course_codes, matrix
+            matrix = [[math.nan] * len(course_codes) for _ in student_ids]
+            for s, c, v in zip(self._student, self._course, self._value):
+                matrix[s][c] = v
+            return student_ids, course_codes, matrix
+
+    def _values_array(self):
+        return np.frombuffer(self._value, dtype=np.float32)
+
+    def _courses_array(self):
+        return np.frombuffer(self._course, dtype=np.int32)
+
+
+class StudentGrades(MutableMapping):
+    """One student's ``{Course: grade}`` rows in a ColumnarGradeStore."""
+
+    __slots__ = ("_store", "_student")
+
+    def __init__(self, store: ColumnarGradeStore, student: int) -> None:
+        self._store = store
+        self._student = student
+
+    def __getitem__(self, course: Course) -> float:
+        with self._store._lock:
+            row = self._store._find(self._student, course)
+            if row == _NO_ROW:
+                raise KeyError(course)
+            return self._store._value[row]
+
+    def get(self, course: Course, default: Optional[float] = None) -> Optional[float]:
+        with self._store._lock:
+            row = self._store._find(self._student, course)
+            return default if row == _NO_ROW else self._store._value[row]
+
+    def __contains__(self, course: object) -> bool:
+        with self._store._lock:
+            return (
+                isinstance(course, Course)
+                and self._store._find(self._student, course) != _NO_ROW
+            )
+
+    def __setitem__(self, course: Course, value: float) -> None:
+        with self._store._lock:
+            self._store._set(self._student, course, value)
+
+    def __delitem__(self, course: Course) -> None:
+        with self._store._lock:
+            row = self._store._find(self._student, course)
+            if row == _NO_ROW:
+                raise KeyError(course)
+            self._store._delete(self._student, row)
+
+    def __iter__(self) -> Iterator[Course]:
+        with self._store._lock:
+            store = self._store
+            # Materialize first so callers may delete while iterating.
+            return iter([store._courses[store._course[row]] for row in store._rows_of(self._student)])
+
+    def __len__(self) -> int:
+        with self._store._lock:
+            return sum(1 for _ in self._store._rows_of(self._student))
+
+    def clear(self) -> None:
+        with self._store._lock:
+            store = self._store
+            while store._head[self._student] != _NO_ROW:
+                store._delete(self._student, store._head[self._student])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
@@ -1,14 +1,25 @@
 # infrastructure/in_memory/in_memory_course_repository.py
 
 from __future__ import annotations
-from typing import Dict, Iterable
+import threading
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from domain.models.course import Course
 from domain.repositories.course_repository import CourseRepository
+from domain.repositories.pagination import Page
+from domain.repositories.queries import CourseQuery, Query
 from domain.exceptions.domain_exceptions import (
     DuplicateEntityError,
     EntityNotFoundError
 )
+from infrastructure.in_memory.batch import new_batch
+from infrastructure.in_memory.prefix_index import PrefixIndex
+from infrastructure.in_memory.sorted_key_index import SortedKeyIndex
+from infrastructure.in_memory.value_index import ValueIndex
+
+# What a course was last indexed under: (name, teacher id, enrollment count).
+_Indexed = Tuple[str, Optional[str], int]
 
 
 class InMemoryCourseRepository(CourseRepository):
@@ -21,31 +32,144 @@ class InMemoryCourseRepository(CourseRepository):
     This repository does NOT enforce relationship rules (e.g. dropping
     students, unassigning teachers). That is the responsibility of the
     Course aggregate and the application service layer orchestrating them.
+
+    Secondary indexes (name prefix, teacher, enrollment count) answer
+    CourseQuery lookups in find(). They are refreshed on add/remove and
+    whenever a stored course reports a teacher or roster change (see
+    Course.observe), so changes made through the course itself are indexed
+    without an update() call; update() refreshes them too, e.g. after a
+    rename.
     """
 
     def __init__(self) -> None:
+        # Guards the dict and its indexes so the repository can be shared
+        # by threads (see StudentManagementSystem's thread_safe mode).
+        self._lock = threading.RLock()
         self._courses: Dict[str, Course] = {}
+        self._order = SortedKeyIndex(self._courses)
+        self._indexed: Dict[str, _Indexed] = {}
+        self._by_name = PrefixIndex()
+        self._by_teacher: ValueIndex[Optional[str]] = ValueIndex()
+        self._by_size: ValueIndex[int] = ValueIndex()
 
     def add(self, course: Course) -> None:
-        code = course.code
-        if code in self._courses:
-            raise DuplicateEntityError(f"Course '{code}' already exists.")
-        self._courses[code] = course
+        with self._lock:
+            code = course.code
+            if code in self._courses:
+                raise DuplicateEntityError(f"Course '{code}' already exists.")
+            self._courses[code] = course
+            self._order.add(code)
+            self._index(code, _index_values(course))
+            course.observe(self._reindex)
+
+    def add_many(self, courses: Sequence[Course]) -> None:
+        """Add a batch of new courses in one step (see the student repository)."""
+        with self._lock:
+            batch = new_batch(courses, _course_code, self._courses, "Course")
+            self._courses.update(batch)
+            self._order.add_many(batch)
+            for code, course in batch.items():
+                self._index(code, _index_values(course))
+                course.observe(self._reindex)
 
     def get(self, course_code: str) -> Course:
         if course_code not in self._courses:
             raise EntityNotFoundError(f"Course '{course_code}' not found.")
         return self._courses[course_code]
 
+    def update(self, course: Course) -> None:
+        with self._lock:
+            # Entities are stored by reference, so there is nothing to write back.
+            if self._courses.get(course.code) is not course:
+                raise EntityNotFoundError(f"Course '{course.code}' not found.")
+            self._reindex(course)
+
     def remove(self, course_code: str) -> None:
-        if course_code not in self._courses:
-            raise EntityNotFoundError(f"Course '{course_code}' not found.")
-        del self._courses[course_code]
+        with self._lock:
+            if course_code not in self._courses:
+                raise EntityNotFoundError(f"Course '{course_code}' not found.")
+            self._courses.pop(course_code).observe(None)
+            self._order.discard(course_code)
+            name, teacher_id, size = self._indexed.pop(course_code)
+            self._by_name.discard(name, course_code)
+            self._by_teacher.discard(teacher_id, course_code)
+            self._by_size.discard(size, course_code)
 
     def list_all(self) -> Iterable[Course]:
         # Return a tuple to prevent external mutation of internal state
         return tuple(self._courses.values())
 
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Course]:
+        with self._lock:
+            return self._order.entity_page(limit, after_id)
+
+    def find(self, query: Query[Course]) -> Tuple[Course, ...]:
+        if not isinstance(query, CourseQuery):
+            return super().find(query)
+        with self._lock:
+            # Intersect the candidate sets of the criteria that are set,
+            # smallest first; no criteria means every course.
+            candidates: List[Set[str]] = []
+            if query.name_prefix is not None:
+                candidates.append(self._by_name.keys_with_prefix(query.name_prefix))
+            if query.teacher_id is not None:
+                candidates.append(self._by_teacher.keys_for(query.teacher_id))
+            if query.has_teacher is False:
+                candidates.append(self._by_teacher.keys_for(None))
+            elif query.has_teacher:
+                candidates.append(set(self._courses) - self._by_teacher.keys_for(None))
+            if query.min_students is not None or query.max_students is not None:
+                candidates.append(
+                    self._by_size.keys_between(query.min_students, query.max_students)
+                )
+
+            if not candidates:
+                codes: Iterable[str] = self._courses
+            else:
+                candidates.sort(key=len)
+                codes = candidates[0].intersection(*candidates[1:])
+            return tuple(self._courses[code] for code in sorted(codes))
+
+    def _reindex(self, course: Course) -> None:
+        """Move ``course`` to the index entries of its current values."""
+        with self._lock:
+            code = course.code
+            name, teacher_id, size = old = self._indexed[code]
+            new = _index_values(course)
+            if new != old:
+                if new[0] != name:
+                    self._by_name.discard(name, code)
+                    self._by_name.add(new[0], code)
+                self._by_teacher.move(teacher_id, new[1], code)
+                self._by_size.move(size, new[2], code)
+                self._indexed[code] = new
+
+    def _index(self, code: str, values: _Indexed) -> None:
+        name, teacher_id, size = self._indexed[code] = values
+        self._by_name.add(name, code)
+        self._by_teacher.add(teacher_id, code)
+        self._by_size.add(size, code)
+
     # Test utility - not part of domain interface
     def clear(self) -> None:
-        self._courses.clear()
+        with self._lock:
+            for course in self._courses.values():
+                course.observe(None)
+            self._courses.clear()
+            self._order.clear()
+            self._indexed.clear()
+            self._by_name.clear()
+            self._by_teacher.clear()
+            self._by_size.clear()
+
+
+def _index_values(course: Course) -> _Indexed:
+    teacher = course.teacher
+    return (
+        course.name,
+        None if teacher is None else teacher.id,
+        len(course.students_view),
+    )
+
+
+_course_code = attrgetter("code")
@@ -1,14 +1,22 @@
 # infrastructure/in_memory/in_memory_student_repository.py
 
 from __future__ import annotations
-from typing import Dict, Iterable
+import threading
+from operator import attrgetter
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 from domain.models.student import Student
 from domain.repositories.student_repository import StudentRepository
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query, StudentQuery
 from domain.exceptions.domain_exceptions import (
     DuplicateEntityError,
     EntityNotFoundError
 )
+from infrastructure.in_memory.batch import new_batch
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+from infrastructure.in_memory.prefix_index import PrefixIndex
+from infrastructure.in_memory.sorted_key_index import SortedKeyIndex
 
 class InMemoryStudentRepository(StudentRepository):
     """
@@ -21,31 +29,102 @@ class InMemoryStudentRepository(StudentRepository):
     Student aggregates but does not enforce enrollment/un-enrollment
     invariants. Those are handled through the Course and Student aggregates
     and orchestrated by the application service layer.
+
+    Pass a ColumnarGradeStore to keep all stored students' grades in shared
+    columns instead of one dict per student.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, grade_store: Optional[ColumnarGradeStore] = None) -> None:
+        # Guards the dict and its indexes so the repository can be shared
+        # by threads (see StudentManagementSystem's thread_safe mode).
+        self._lock = threading.RLock()
         self._students: Dict[str, Student] = {}
+        # When given, every stored student keeps its grades in this store.
+        self.grade_store = grade_store
+        self._order = SortedKeyIndex(self._students)
+        # Name each student was last indexed under, for the prefix index.
+        self._names: Dict[str, str] = {}
+        self._by_name = PrefixIndex()
 
     def add(self, student: Student) -> None:
-        student_id = student.id
-        if student_id in self._students:
-            raise DuplicateEntityError(f"Student '{student_id}' already exists.")
-        self._students[student_id] = student
+        with self._lock:
+            student_id = student.id
+            if student_id in self._students:
+                raise DuplicateEntityError(f"Student '{student_id}' already exists.")
+            self._students[student_id] = student
+            self._order.add(student_id)
+            self._names[student_id] = student.name
+            self._by_name.add(student.name, student_id)
+            if self.grade_store is not None:
+                student.attach_grades(self.grade_store.grades_for(student_id))
+
+    def add_many(self, students: Sequence[Student]) -> None:
+        """
+        Add a batch of new students in one step: duplicates are rejected
+        up front (nothing is added), the dict grows once for the whole
+        batch and the name index is filled on its next query.
+        """
+        with self._lock:
+            batch = new_batch(students, _student_id, self._students, "Student")
+            self._students.update(batch)
+            self._order.add_many(batch)
+            names = {student_id: student.name for student_id, student in batch.items()}
+            self._names.update(names)
+            self._by_name.add_many(zip(names.values(), names))
+            if self.grade_store is not None:
+                for student_id, student in batch.items():
+                    student.attach_grades(self.grade_store.grades_for(student_id))
 
     def get(self, student_id: str) -> Student:
         if student_id not in self._students:
             raise EntityNotFoundError(f"Student '{student_id}' not found.")
         return self._students[student_id]
 
+    def update(self, student: Student) -> None:
+        with self._lock:
+            # Students are held by reference; changes are already visible here.
+            student_id = student.id
+            if self._students.get(student_id) is not student:
+                raise EntityNotFoundError(f"Student '{student_id}' not found.")
+            name = self._names[student_id]
+            if student.name != name:
+                self._by_name.discard(name, student_id)
+                self._by_name.add(student.name, student_id)
+                self._names[student_id] = student.name
+
     def remove(self, student_id: str) -> None:
-        if student_id not in self._students:
-            raise EntityNotFoundError(f"Student '{student_id}' not found.")
-        del self._students[student_id]
+        with self._lock:
+            if student_id not in self._students:
+                raise EntityNotFoundError(f"Student '{student_id}' not found.")
+            del self._students[student_id]
+            self._order.discard(student_id)
+            self._by_name.discard(self._names.pop(student_id), student_id)
 
     def list_all(self) -> Iterable[Student]:
         # Return an immutable snapshot to avoid exposing internal state.
         return tuple(self._students.values())
 
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        with self._lock:
+            return self._order.entity_page(limit, after_id)
+
+    def find(self, query: Query[Student]) -> Tuple[Student, ...]:
+        if not isinstance(query, StudentQuery):
+            return super().find(query)
+        with self._lock:
+            if query.name_prefix is None:
+                ids: Iterable[str] = self._students
+            else:
+                ids = self._by_name.keys_with_prefix(query.name_prefix)
+            return tuple(self._students[student_id] for student_id in sorted(ids))
+
     # Test utility - not part of the domain interface.
     def clear(self) -> None:
-        self._students.clear()
+        with self._lock:
+            self._students.clear()
+            self._order.clear()
+            self._names.clear()
+            self._by_name.clear()
+
+
+_student_id = attrgetter("id")
@@ -1,14 +1,21 @@
 # infrastructure/in_memory/in_memory_teacher_repository.py
 
 from __future__ import annotations
-from typing import Dict, Iterable
+import threading
+from operator import attrgetter
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 from domain.models.teacher import Teacher
 from domain.repositories.teacher_repository import TeacherRepository
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query, TeacherQuery
 from domain.exceptions.domain_exceptions import (
     DuplicateEntityError,
     EntityNotFoundError
 )
+from infrastructure.in_memory.batch import new_batch
+from infrastructure.in_memory.prefix_index import PrefixIndex
+from infrastructure.in_memory.sorted_key_index import SortedKeyIndex
 
 class InMemoryTeacherRepository(TeacherRepository):
     """
@@ -23,28 +30,85 @@ class InMemoryTeacherRepository(TeacherRepository):
     """
 
     def __init__(self) -> None:
+        # Guards the dict and its indexes so the repository can be shared
+        # by threads (see StudentManagementSystem's thread_safe mode).
+        self._lock = threading.RLock()
         self._teachers: Dict[str, Teacher] = {}
+        self._order = SortedKeyIndex(self._teachers)
+        # Name each teacher was last indexed under, for the prefix index.
+        self._names: Dict[str, str] = {}
+        self._by_name = PrefixIndex()
 
     def add(self, teacher: Teacher) -> None:
-        teacher_id = teacher.id
-        if teacher_id in self._teachers:
-            raise DuplicateEntityError(f"Teacher '{teacher_id}' already exists.")
-        self._teachers[teacher_id] = teacher
+        with self._lock:
+            teacher_id = teacher.id
+            if teacher_id in self._teachers:
+                raise DuplicateEntityError(f"Teacher '{teacher_id}' already exists.")
+            self._teachers[teacher_id] = teacher
+            self._order.add(teacher_id)
+            self._names[teacher_id] = teacher.name
+            self._by_name.add(teacher.name, teacher_id)
+
+    def add_many(self, teachers: Sequence[Teacher]) -> None:
+        """Add a batch of new teachers in one step (see the student repository)."""
+        with self._lock:
+            batch = new_batch(teachers, _teacher_id, self._teachers, "Teacher")
+            self._teachers.update(batch)
+            self._order.add_many(batch)
+            names = {teacher_id: teacher.name for teacher_id, teacher in batch.items()}
+            self._names.update(names)
+            self._by_name.add_many(zip(names.values(), names))
 
     def get(self, teacher_id: str) -> Teacher:
         if teacher_id not in self._teachers:
             raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
         return self._teachers[teacher_id]
 
+    def update(self, teacher: Teacher) -> None:
+        with self._lock:
+            # Nothing to write back: the stored Teacher is the same object.
+            teacher_id = teacher.id
+            if self._teachers.get(teacher_id) is not teacher:
+                raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+            name = self._names[teacher_id]
+            if teacher.name != name:
+                self._by_name.discard(name, teacher_id)
+                self._by_name.add(teacher.name, teacher_id)
+                self._names[teacher_id] = teacher.name
+
     def remove(self, teacher_id: str) -> None:
-        if teacher_id not in self._teachers:
-            raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
-        del self._teachers[teacher_id]
+        with self._lock:
+            if teacher_id not in self._teachers:
+                raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+            del self._teachers[teacher_id]
+            self._order.discard(teacher_id)
+            self._by_name.discard(self._names.pop(teacher_id), teacher_id)
 
     def list_all(self) -> Iterable[Teacher]:
         # Return an immutable snapshot to protect internal storage.
         return tuple(self._teachers.values())
 
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        with self._lock:
+            return self._order.entity_page(limit, after_id)
+
+    def find(self, query: Query[Teacher]) -> Tuple[Teacher, ...]:
+        if not isinstance(query, TeacherQuery):
+            return super().find(query)
+        with self._lock:
+            if query.name_prefix is None:
+                ids: Iterable[str] = self._teachers
+            else:
+                ids = self._by_name.keys_with_prefix(query.name_prefix)
+            return tuple(self._teachers[teacher_id] for teacher_id in sorted(ids))
+
     # Test utility - not part of domain interface
     def clear(self) -> None:
-        self._teachers.clear()
+        with self._lock:
+            self._teachers.clear()
+            self._order.clear()
+            self._names.clear()
+            self._by_name.clear()
+
+
+_teacher_id = attrgetter("id")
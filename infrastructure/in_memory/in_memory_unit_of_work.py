@@ -0,0 +1,21 @@
+# infrastructure/in_memory/in_memory_unit_of_work.py
+
+from domain.repositories.unit_of_work import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    UnitOfWork for the in-memory repositories.
+
+    There is no storage to commit: the repositories hold the live objects,
+    and StudentManagementSystem restores them itself on rollback.
+    """
+
+    def begin(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
@@ -0,0 +1,89 @@
+# infrastructure/in_memory/prefix_index.py
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class _Node:
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.keys: Set[str] = set()
+
+
+class PrefixIndex:
+    """
+    Trie from (case-folded) names to the keys of the entities carrying them.
+
+    ``add``/``discard`` cost O(len(name)); ``keys_with_prefix`` costs
+    O(len(prefix)) plus the size of the matching subtree. Branches left
+    empty by ``discard`` are pruned so the trie does not grow with churn.
+
+    ``add_many`` (bulk loads) only queues its pairs; they are inserted on
+    the next discard or lookup, so loading never waits for the trie.
+    """
+
+    __slots__ = ("_root", "_pending")
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._pending: List[Tuple[str, str]] = []
+
+    def add_many(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Queue (name, key) pairs to be added on first use."""
+        self._pending.extend(pairs)
+
+    def add(self, name: str, key: str) -> None:
+        node = self._root
+        for char in name.casefold():
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+        node.keys.add(key)
+
+    def discard(self, name: str, key: str) -> None:
+        self._flush()
+        path = [self._root]
+        folded = name.casefold()
+        for char in folded:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].keys.discard(key)
+
+        # Prune the now-empty tail of the branch.
+        for depth in range(len(folded), 0, -1):
+            node = path[depth]
+            if node.keys or node.children:
+                break
+            del path[depth - 1].children[folded[depth - 1]]
+
+    def clear(self) -> None:
+        self._root = _Node()
+        self._pending.clear()
+
+    def keys_with_prefix(self, prefix: str) -> Set[str]:
+        self._flush()
+        node = self._root
+        for char in prefix.casefold():
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return set(_subtree_keys(node))
+
+    def _flush(self) -> None:
+        if self._pending:
+            pending, self._pending = self._pending, []
+            for name, key in pending:
+                self.add(name, key)
+
+
+def _subtree_keys(node: _Node) -> Iterator[str]:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield from node.keys
+        stack.extend(node.children.values())
@@ -0,0 +1,89 @@
+# infrastructure/in_memory/sorted_key_index.py
+
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+from domain.repositories.pagination import Page
+
+
+class SortedKeyIndex:
+    """
+    Sorted view of a repository's keys, used for keyset pagination.
+
+    The index is built on the first page request and then maintained
+    cheaply so that bulk loads stay linear:
+
+    - ``add`` appends and marks the list unsorted; the next page request
+      re-sorts it, which Timsort does in close to O(n) for a sorted run
+      followed by new keys.
+    - ``discard`` is lazy: removed keys are skipped while paging, and the
+      list is rebuilt once they make up half of it.
+    """
+
+    __slots__ = ("_source", "_keys", "_unsorted", "_stale")
+
+    def __init__(self, source: Mapping[str, object]) -> None:
+        # ``source`` is the repository's own dict; it decides which keys are live.
+        self._source = source
+        self._keys: Optional[List[str]] = None
+        self._unsorted = False
+        self._stale = 0
+
+    def add(self, key: str) -> None:
+        if self._keys is not None:
+            self._keys.append(key)
+            self._unsorted = True
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        if self._keys is not None:
+            self._keys.extend(keys)
+            self._unsorted = True
+
+    def discard(self, key: str) -> None:
+        if self._keys is not None:
+            self._stale += 1
+
+    def clear(self) -> None:
+        self._keys = None
+        self._unsorted = False
+        self._stale = 0
+
+    def page(self, limit: int, after: Optional[str] = None) -> Tuple[List[str], bool]:
+        """
+        Return up to ``limit`` live keys greater than ``after`` and whether
+        more keys may follow.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer.")
+        keys = self._sorted_keys()
+        source = self._source
+
+        i = 0 if after is None else bisect_right(keys, after)
+        result: List[str] = []
+        previous = after
+        while i < len(keys) and len(result) < limit:
+            key = keys[i]
+            i += 1
+            # Skip removed keys and duplicates left by remove-then-re-add.
+            if key != previous and key in source:
+                result.append(key)
+                previous = key
+        return result, i < len(keys)
+
+    def entity_page(self, limit: int, after: Optional[str] = None) -> Page:
+        """list_page() of the repository whose dict is the source."""
+        keys, has_more = self.page(limit, after)
+        source = self._source
+        return Page(tuple(source[key] for key in keys), keys[-1] if has_more and keys else None)
+
+    def _sorted_keys(self) -> List[str]:
+        keys = self._keys
+        if keys is None or self._stale * 2 > len(keys):
+            keys = self._keys = sorted(self._source)
+            self._unsorted = False
+            self._stale = 0
+        elif self._unsorted:
+            keys.sort()
+            self._unsorted = False
+        return keys
@@ -0,0 +1,53 @@
+# infrastructure/in_memory/value_index.py
+
+from __future__ import annotations
+from typing import Dict, Generic, Hashable, Optional, Set, TypeVar
+
+V = TypeVar("V", bound=Hashable)
+
+
+class ValueIndex(Generic[V]):
+    """
+    Buckets of entity keys grouped by one attribute value, e.g. the
+    teacher id of a course or its enrollment count.
+
+    Moving a key between buckets is O(1). Empty buckets are dropped, so a
+    range query only visits the distinct values actually in use.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self) -> None:
+        self._buckets: Dict[V, Set[str]] = {}
+
+    def add(self, value: V, key: str) -> None:
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            bucket = self._buckets[value] = set()
+        bucket.add(key)
+
+    def discard(self, value: V, key: str) -> None:
+        bucket = self._buckets.get(value)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[value]
+
+    def move(self, old: V, new: V, key: str) -> None:
+        if old != new:
+            self.discard(old, key)
+            self.add(new, key)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def keys_for(self, value: V) -> Set[str]:
+        return set(self._buckets.get(value, ()))
+
+    def keys_between(self, low: Optional[V], high: Optional[V]) -> Set[str]:
+        """Keys whose value lies in [low, high]; either bound may be None."""
+        keys: Set[str] = set()
+        for value, bucket in self._buckets.items():
+            if (low is None or value >= low) and (high is None or value <= high):
+                keys |= bucket
+        return keys
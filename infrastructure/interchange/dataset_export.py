@@ -0,0 +1,183 @@
+# infrastructure/interchange/dataset_export.py
+"""
+Streaming export of the whole dataset to CSV or JSON Lines:
+
+    export_dataset("out/", student_repo, teacher_repo, course_repo, fmt="jsonl", compression="gz")
+
+writes students, teachers, courses and enrollments (one row per enrolled
+student per course, with the grade or empty/null) to one file each. The
+files can be read back with row_readers and fed to the bulk import use
+cases.
+
+Rows are produced by generators, so memory stays bounded by a page plus
+one roster however large the dataset is:
+- By default the repositories are read through stream(), a page of
+  entities at a time, and a roster is walked through
+  Course.students_view without copying it.
+- A store that can list its rows without building entities is passed
+  as ``rows`` (any RowSource, e.g. the SqliteDatabase behind SQLite
+  repositories) and read a page at a time instead. For SQLite this
+  keeps the entities out of the database's identity map and reads each
+  course's enrollments and grades in one join query.
+Writes go through buffered (and optionally compressing) files from
+text_files.open_text.
+
+The export reads the repositories as they are: pause writers (or export
+a snapshot loaded into fresh repositories) for a consistent copy.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional, Protocol, Sequence, Tuple
+
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+from infrastructure.interchange.text_files import TextSource, open_text
+
+STUDENT_FIELDS = ("student_id", "name")
+TEACHER_FIELDS = ("teacher_id", "name")
+COURSE_FIELDS = ("course_code", "name", "teacher_id", "capacity")
+ENROLLMENT_FIELDS = ("student_id", "course_code", "grade")
+
+FORMATS = ("csv", "jsonl")
+COMPRESSIONS = ("gz", "bz2", "xz")
+
+Row = Tuple[object, ...]
+
+
+class RowSource(Protocol):
+    """
+    A store that lists its rows directly, in the field order of the
+    export files (see SqliteDatabase).
+    """
+
+    def student_rows(self, batch_size: int) -> Iterator[Row]: ...
+
+    def teacher_rows(self, batch_size: int) -> Iterator[Row]: ...
+
+    def course_rows(self, batch_size: int) -> Iterator[Row]: ...
+
+    def enrollment_rows(self, batch_size: int) -> Iterator[Row]: ...
+
+
+# ---------- Row generators ----------
+def student_rows(students: StudentRepository, batch_size: int = 1000) -> Iterator[Row]:
+    return ((student.id, student.name) for student in students.stream(batch_size))
+
+
+def teacher_rows(teachers: TeacherRepository, batch_size: int = 1000) -> Iterator[Row]:
+    return ((teacher.id, teacher.name) for teacher in teachers.stream(batch_size))
+
+
+def course_rows(courses: CourseRepository, batch_size: int = 1000) -> Iterator[Row]:
+    """(code, name, teacher id or None, capacity or None) per course."""
+    return (
+        (course.code, course.name, None if course.teacher is None else course.teacher.id,
+         course.capacity)
+        for course in courses.stream(batch_size)
+    )
+
+
+def enrollment_rows(courses: CourseRepository, batch_size: int = 1000) -> Iterator[Row]:
+    """(student id, course code, grade or None) per enrollment, by course."""
+    for course in courses.stream(batch_size):
+        code = course.code
+        for student in course.students_view:
+            yield student.id, code, student.get_grade(course)
+
+
+# ---------- Writers ----------
+def write_csv(target: TextSource, fields: Sequence[str], rows: Iterable[Row]) -> int:
+    """
+    Write a header and ``rows`` as CSV; None is written as an empty
+    field. Returns the number of rows written.
+    """
+    counted = _Counter(rows)
+    with open_text(target, "w") as file:
+        writer = csv.writer(file)
+        writer.writerow(fields)
+        writer.writerows(counted)
+    return counted.count
+
+
+def write_jsonl(target: TextSource, fields: Sequence[str], rows: Iterable[Row]) -> int:
+    """
+    Write each row as a JSON object keyed by ``fields``, one per line.
+    Returns the number of rows written.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    counted = _Counter(rows)
+    with open_text(target, "w") as file:
+        file.writelines(encode(dict(zip(fields, row))) + "\n" for row in counted)
+    return counted.count
+
+
+_WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
+
+
+def export_dataset(
+        directory: str,
+        student_repo: StudentRepository,
+        teacher_repo: TeacherRepository,
+        course_repo: CourseRepository,
+        fmt: str = "csv",
+        compression: Optional[str] = None,
+        batch_size: int = 1000,
+        rows: Optional[RowSource] = None,
+) -> Dict[str, int]:
+    """
+    Write students, teachers, courses and enrollments into ``directory``
+    (created if needed) as ``<name>.<fmt>[.<compression>]``, e.g.
+    ``enrollments.csv.gz``. Returns the number of rows per file name.
+
+    If ``rows`` is given, the rows are read from it instead of from the
+    repositories, which must then hold the same data.
+
+    Raises ValueError for an unknown format or compression.
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {FORMATS}.")
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}.")
+    write = _WRITERS[fmt]
+    suffix = f".{fmt}" if compression is None else f".{fmt}.{compression}"
+    os.makedirs(directory, exist_ok=True)
+
+    if rows is None:
+        tables = (
+            ("students", STUDENT_FIELDS, student_rows(student_repo, batch_size)),
+            ("teachers", TEACHER_FIELDS, teacher_rows(teacher_repo, batch_size)),
+            ("courses", COURSE_FIELDS, course_rows(course_repo, batch_size)),
+            ("enrollments", ENROLLMENT_FIELDS, enrollment_rows(course_repo, batch_size)),
+        )
+    else:
+        tables = (
+            ("students", STUDENT_FIELDS, rows.student_rows(batch_size)),
+            ("teachers", TEACHER_FIELDS, rows.teacher_rows(batch_size)),
+            ("courses", COURSE_FIELDS, rows.course_rows(batch_size)),
+            ("enrollments", ENROLLMENT_FIELDS, rows.enrollment_rows(batch_size)),
+        )
+    counts: Dict[str, int] = {}
+    for name, fields, rows in tables:
+        file_name = name + suffix
+        counts[file_name] = write(os.path.join(directory, file_name), fields, rows)
+    return counts
+
+
+class _Counter:
+    """Pass rows through, counting them (the writers consume iterators)."""
+
+    __slots__ = ("_rows", "count")
+
+    def __init__(self, rows: Iterable[Row]) -> None:
+        self._rows = rows
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Row]:
+        for row in self._rows:
+            self.count += 1
+            yield row
@@ -0,0 +1,77 @@
+# infrastructure/interchange/row_readers.py
+"""
+Streaming row sources for the bulk import use cases
+(StudentManagementSystem.import_students etc.):
+
+    sms.import_students(read_csv("students.csv", ["id", "name"]))
+    sms.import_enrollments(read_jsonl("enrollments.jsonl.gz", ["student_id", "course_code"]))
+
+Rows are yielded as tuples one line at a time, so a file is never held in
+memory as a whole; compressed files are read through text_files.open_text.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from operator import itemgetter
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+from infrastructure.interchange.text_files import TextSource, open_text
+
+
+def read_csv(
+        source: TextSource,
+        columns: Optional[Sequence[str]] = None,
+        header: bool = True,
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the rows of a CSV file as tuples of strings.
+
+    With ``columns``, only those header columns are yielded, in that
+    order (ValueError if one is missing). Without a header row, every
+    column is yielded as is.
+    """
+    with open_text(source) as file:
+        reader = csv.reader(file)
+        pick: Callable[[list], Tuple[str, ...]] = tuple
+        if header:
+            names = next(reader, None)
+            if names is None:
+                return
+            if columns is not None:
+                missing = [column for column in columns if column not in names]
+                if missing:
+                    raise ValueError(f"CSV header has no column(s) {missing}.")
+                pick = _picker([names.index(column) for column in columns])
+        elif columns is not None:
+            raise ValueError("columns can only be selected by name from a header row.")
+        for row in reader:
+            if row:
+                yield pick(row)
+
+
+def read_jsonl(source: TextSource, fields: Sequence[str]) -> Iterator[Tuple[object, ...]]:
+    """
+    Yield ``fields`` of each JSON object in a JSON Lines file, as a tuple.
+    Blank lines are skipped; a line without one of the fields raises
+    ValueError naming the line.
+    """
+    pick = _picker(list(fields))
+    loads = json.loads
+    with open_text(source) as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield pick(loads(line))
+            except KeyError as error:
+                raise ValueError(f"Line {number} has no field {error}.") from None
+
+
+def _picker(keys: list) -> Callable[..., Tuple]:
+    # itemgetter returns a bare value, not a 1-tuple, for a single key.
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
@@ -0,0 +1,50 @@
+# infrastructure/interchange/text_files.py
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import os
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, IO, Iterator, Union
+
+TextSource = Union[str, "os.PathLike[str]", IO[str]]
+
+# Write buffer for plain files: large enough that a streaming export
+# issues few, big writes.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Compressed formats recognised by file extension.
+_OPENERS: Dict[str, Callable[..., IO[str]]] = {
+    # zlib's default level: gzip.open's default of 9 is several times
+    # slower for a few percent smaller files.
+    ".gz": partial(gzip.open, compresslevel=6),
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+@contextmanager
+def open_text(source: TextSource, mode: str = "r") -> Iterator[IO[str]]:
+    """
+    Open ``source`` for text reading ("r") or writing ("w"), with UTF-8
+    and universal newlines as the csv module expects.
+
+    A path ending in .gz, .bz2 or .xz is (de)compressed on the fly;
+    plain files are written through a WRITE_BUFFER_SIZE buffer. An
+    already open text file is used as is and left open.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        yield source
+        return
+    path = os.fspath(source)
+    opener = _OPENERS.get(os.path.splitext(path)[1].lower())
+    if opener is None:
+        buffering = WRITE_BUFFER_SIZE if "w" in mode else -1
+        file = open(path, mode, buffering=buffering, encoding="utf-8", newline="")
+    else:
+        file = opener(path, mode + "t", encoding="utf-8", newline="")
+    with file:
+        yield file
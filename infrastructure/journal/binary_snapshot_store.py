@@ -0,0 +1,64 @@
+# infrastructure/journal/binary_snapshot_store.py
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.snapshot_store import SnapshotStore
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+from infrastructure.journal.snapshot_format import SnapshotFile, SnapshotGraph, write_snapshot
+
+
+class BinarySnapshotStore(SnapshotStore):
+    """
+    Snapshot kept in one file in the compact binary format described in
+    snapshot_format, memory-mapped on load.
+
+    load() creates every entity with only its id and name and hands the
+    domain LazyMappings for its relationships: a roster, a teacher's
+    courses or a student's courses and grades are decoded from the mapped
+    file the first time they are used. Entities nobody touches never read
+    more than their own record. (A ColumnarGradeStore still copies grades
+    in when students are added to its repository.)
+
+    save() replaces the file atomically, so a crash leaves either the old
+    or the new snapshot.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def save(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+            journal_position: int,
+    ) -> None:
+        write_snapshot(
+            self.path,
+            teacher_repo.list_all(), course_repo.list_all(), student_repo.list_all(),
+            journal_position,
+        )
+
+    def load(
+            self,
+            student_repo: StudentRepository,
+            teacher_repo: TeacherRepository,
+            course_repo: CourseRepository,
+    ) -> Optional[int]:
+        if not os.path.exists(self.path):
+            return None
+        # The graph (and the mapping) stays alive while unloaded
+        # relationships still refer to it.
+        graph = SnapshotGraph(SnapshotFile(self.path))
+        for index in range(graph.file.teacher_count):
+            teacher_repo.add(graph.teacher(index))
+        for index in range(graph.file.course_count):
+            course_repo.add(graph.course(index))
+        for index in range(graph.file.student_count):
+            student_repo.add(graph.student(index))
+        return graph.file.journal_position
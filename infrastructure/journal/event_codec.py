@@ -0,0 +1,122 @@
+# infrastructure/journal/event_codec.py
+"""
+Binary encoding of domain events.
+
+An event body is a one-byte type code followed by its fields, in
+dataclass field order:
+
+    str    u16 byte length + UTF-8 bytes
+    float  float64
+    int    int64
+
+All integers are little-endian. Type codes are part of the on-disk format:
+never renumber them, only append new ones.
+"""
+import struct
+from dataclasses import fields
+from typing import Callable, Dict, List, Tuple, Type
+
+from domain.events.domain_events import (
+    CapacityRemoved,
+    CapacitySet,
+    CourseAdded,
+    CourseRemoved,
+    DomainEvent,
+    Dropped,
+    Enrolled,
+    GradeAssigned,
+    GradeRemoved,
+    StudentAdded,
+    StudentRemoved,
+    TeacherAdded,
+    TeacherAssigned,
+    TeacherRemoved,
+    TeacherUnassigned,
+    WaitlistCleared,
+    WaitlistLeft,
+    Waitlisted,
+)
+
+EVENT_TYPES: Dict[int, type] = {
+    1: StudentAdded,
+    2: TeacherAdded,
+    3: CourseAdded,
+    4: StudentRemoved,
+    5: TeacherRemoved,
+    6: CourseRemoved,
+    7: TeacherAssigned,
+    8: TeacherUnassigned,
+    9: Enrolled,
+    10: Dropped,
+    11: GradeAssigned,
+    12: GradeRemoved,
+    13: CapacitySet,
+    14: CapacityRemoved,
+    15: Waitlisted,
+    16: WaitlistLeft,
+    17: WaitlistCleared,
+}
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_F64 = struct.Struct("<d")
+_I64 = struct.Struct("<q")
+_NUMBERS = {"f": _F64, "i": _I64}
+
+
+def _layout(cls: type) -> str:
+    """'s' per str, 'f' per float and 'i' per int field, e.g. 'ssf'."""
+    return "".join(_kind(field.type) for field in fields(cls))
+
+
+def _kind(annotation: object) -> str:
+    if annotation in (float, "float"):
+        return "f"
+    if annotation in (int, "int"):
+        return "i"
+    return "s"
+
+
+_CODES: Dict[Type, int] = {cls: code for code, cls in EVENT_TYPES.items()}
+_LAYOUTS: Dict[int, Tuple[Callable[..., DomainEvent], str]] = {
+    code: (cls, _layout(cls)) for code, cls in EVENT_TYPES.items()
+}
+_FIELD_NAMES: Dict[Type, Tuple[str, ...]] = {
+    cls: tuple(field.name for field in fields(cls)) for cls in EVENT_TYPES.values()
+}
+
+
+def encode(event: DomainEvent) -> bytes:
+    cls = type(event)
+    code = _CODES[cls]
+    parts: List[bytes] = [_U8.pack(code)]
+    for kind, name in zip(_LAYOUTS[code][1], _FIELD_NAMES[cls]):
+        value = getattr(event, name)
+        if kind != "s":
+            parts.append(_NUMBERS[kind].pack(value))
+        else:
+            raw = value.encode("utf-8")
+            if len(raw) > 0xFFFF:
+                raise ValueError(f"{cls.__name__} field is too long to journal ({len(raw)} bytes).")
+            parts.append(_U16.pack(len(raw)))
+            parts.append(raw)
+    return b"".join(parts)
+
+
+def decode(data: bytes, offset: int, end: int) -> DomainEvent:
+    """Decode the event body in ``data[offset:end]``."""
+    cls, layout = _LAYOUTS[data[offset]]
+    offset += 1
+    values = []
+    for kind in layout:
+        if kind != "s":
+            values.append(_NUMBERS[kind].unpack_from(data, offset)[0])
+            offset += 8
+        else:
+            size = _U16.unpack_from(data, offset)[0]
+            offset += 2
+            values.append(data[offset:offset + size].decode("utf-8"))
+            offset += size
+    if offset != end:
+        raise ValueError("Event body length does not match its type.")
+    return cls(*values)
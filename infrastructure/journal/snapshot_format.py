@@ -0,0 +1,403 @@
+# infrastructure/journal/snapshot_format.py
+"""
+On-disk format shared by snapshots (BinarySnapshotStore) and read-only
+term archives (infrastructure/archive):
+
+    MAGIC | header | teachers | courses | students
+          | teacher courses | rosters | student courses
+          | grade courses | grade values
+          | waitlist students | waitlist priorities | student waitlists
+          | strings
+
+- The header holds the journal position and the item count of every
+  section, which fixes every section's offset.
+- Entities are fixed-size records sorted by id/code, so one is found by
+  binary search and the n-th by offset arithmetic.
+- Relationships are runs of u32 record indexes, in their original order
+  (roster = enrollment order, waitlist = service order, etc.). Grade
+  values and waitlist priorities are float64.
+- Ids and names live once each in a string table (u16 length + UTF-8);
+  records refer to them by byte offset, so repeated names cost nothing.
+
+All integers are little-endian.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, MutableMapping, Optional, Tuple
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.models.waitlist import Waitlist
+from infrastructure.repositories.lazy_mapping import LazyMapping
+
+MAGIC = b"SMSS\x02"    # format name + version
+
+# Journal position, then the item count of each section.
+_HEADER = struct.Struct("<Q10I")
+_U16 = struct.Struct("<H")
+
+# Fixed-size records, all fields u32 (indexes are positions in the
+# teacher/course/student sections; _NONE marks a missing teacher or an
+# unlimited capacity).
+_TEACHER = struct.Struct("<4I")    # id, name, first course entry, course count
+# code, name, teacher, first roster entry, roster size, capacity,
+# first waitlist entry, waitlist size
+_COURSE = struct.Struct("<8I")
+# id, name, first course entry, course count, first grade, grade count,
+# first waitlisted course entry, waitlisted course count
+_STUDENT = struct.Struct("<8I")
+_NONE = 0xFFFFFFFF
+
+
+# ---------- Writing ----------
+def write_snapshot(
+        path: str,
+        teachers: Iterable[Teacher],
+        courses: Iterable[Course],
+        students: Iterable[Student],
+        journal_position: int = 0,
+) -> None:
+    """
+    Write the entities and every relationship between them to ``path``.
+    The file is written next to ``path`` and renamed over it, so a crash
+    leaves either the old or the new file.
+    """
+    teachers = sorted(teachers, key=_teacher_id)
+    courses = sorted(courses, key=_course_code)
+    students = sorted(students, key=_student_id)
+    teacher_index = {teacher.id: i for i, teacher in enumerate(teachers)}
+    course_index = {course.code: i for i, course in enumerate(courses)}
+    student_index = {student.id: i for i, student in enumerate(students)}
+
+    strings = _StringTable()
+    teacher_records, course_records, student_records = array("I"), array("I"), array("I")
+    teacher_courses, roster, student_courses, grade_courses = (
+        array("I"), array("I"), array("I"), array("I")
+    )
+    grade_values = array("d")
+    waitlist_students, waitlist_priorities, student_waitlists = (
+        array("I"), array("d"), array("I")
+    )
+
+    for teacher in teachers:
+        teacher_records.extend((
+            strings.ref(teacher.id), strings.ref(teacher.name),
+            len(teacher_courses), len(teacher.courses_view),
+        ))
+        teacher_courses.extend(course_index[course.code] for course in teacher.courses_view)
+    for course in courses:
+        teacher = course.teacher
+        # Stored in service order; the position becomes the arrival seq.
+        waitlist = course.waitlist_entries
+        course_records.extend((
+            strings.ref(course.code), strings.ref(course.name),
+            _NONE if teacher is None else teacher_index[teacher.id],
+            len(roster), len(course.students_view),
+            _NONE if course.capacity is None else course.capacity,
+            len(waitlist_students), len(waitlist),
+        ))
+        roster.extend(student_index[student.id] for student in course.students_view)
+        for student, priority, _ in waitlist:
+            waitlist_students.append(student_index[student.id])
+            waitlist_priorities.append(priority)
+    for student in students:
+        grades = student.grades_view
+        waitlisted = student.waitlisted_courses
+        student_records.extend((
+            strings.ref(student.id), strings.ref(student.name),
+            len(student_courses), len(student.courses_view),
+            len(grade_courses), len(grades),
+            len(student_waitlists), len(waitlisted),
+        ))
+        student_waitlists.extend(course_index[course.code] for course in waitlisted)
+        student_courses.extend(course_index[course.code] for course in student.courses_view)
+        for course, value in grades.items():
+            grade_courses.append(course_index[course.code])
+            grade_values.append(value)
+
+    sections = (
+        teacher_records, course_records, student_records,
+        teacher_courses, roster, student_courses, grade_courses, grade_values,
+        waitlist_students, waitlist_priorities, student_waitlists,
+    )
+    if sys.byteorder == "big":
+        for section in sections:
+            section.byteswap()
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(MAGIC)
+        file.write(_HEADER.pack(
+            journal_position, len(teachers), len(courses), len(students),
+            len(teacher_courses), len(roster), len(student_courses),
+            len(grade_courses), len(waitlist_students), len(student_waitlists),
+            len(strings.data),
+        ))
+        for section in sections:
+            file.write(section.tobytes())
+        file.write(strings.data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+class _StringTable:
+    """Deduplicating string section being written."""
+
+    __slots__ = ("data", "_refs")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._refs: Dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        ref = self._refs.get(value)
+        if ref is None:
+            raw = value.encode("utf-8")
+            if len(raw) > 0xFFFF:
+                raise ValueError(f"'{value[:32]}...' is too long to snapshot ({len(raw)} bytes).")
+            ref = self._refs[value] = len(self.data)
+            self.data += _U16.pack(len(raw))
+            self.data += raw
+        return ref
+
+
+# ---------- Reading ----------
+class SnapshotFile:
+    """
+    A snapshot file mapped read-only into memory. Nothing is decoded up
+    front; records, strings and relationship runs are read on request.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            # The map keeps its own handle on the file.
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' is not a snapshot.")
+        (
+            self.journal_position, self.teacher_count, self.course_count, self.student_count,
+            teacher_courses, roster, student_courses, grades, waitlist, student_waitlists,
+            strings,
+        ) = _HEADER.unpack_from(data, len(MAGIC))
+
+        offset = len(MAGIC) + _HEADER.size
+        self._teachers_at, offset = offset, offset + self.teacher_count * _TEACHER.size
+        self._courses_at, offset = offset, offset + self.course_count * _COURSE.size
+        self._students_at, offset = offset, offset + self.student_count * _STUDENT.size
+        self._teacher_courses_at, offset = offset, offset + teacher_courses * 4
+        self._roster_at, offset = offset, offset + roster * 4
+        self._student_courses_at, offset = offset, offset + student_courses * 4
+        self._grade_courses_at, offset = offset, offset + grades * 4
+        self._grade_values_at, offset = offset, offset + grades * 8
+        self._waitlist_students_at, offset = offset, offset + waitlist * 4
+        self._waitlist_priorities_at, offset = offset, offset + waitlist * 8
+        self._student_waitlists_at, offset = offset, offset + student_waitlists * 4
+        self._strings_at = offset
+        if offset + strings != len(data):
+            raise ValueError(f"Snapshot '{path}' is truncated or corrupt.")
+
+    def close(self) -> None:
+        self._map.close()
+
+    # ---------- Records ----------
+    def teacher(self, index: int) -> Tuple[int, ...]:
+        return _TEACHER.unpack_from(self._map, self._teachers_at + index * _TEACHER.size)
+
+    def course(self, index: int) -> Tuple[int, ...]:
+        return _COURSE.unpack_from(self._map, self._courses_at + index * _COURSE.size)
+
+    def student(self, index: int) -> Tuple[int, ...]:
+        return _STUDENT.unpack_from(self._map, self._students_at + index * _STUDENT.size)
+
+    def string(self, ref: int) -> str:
+        return str(self._raw_string(ref), "utf-8")
+
+    def _raw_string(self, ref: int) -> bytes:
+        (length,) = _U16.unpack_from(self._map, self._strings_at + ref)
+        start = self._strings_at + ref + _U16.size
+        return self._map[start:start + length]
+
+    # ---------- Relationship runs ----------
+    def teacher_courses(self, first: int, count: int) -> Tuple[int, ...]:
+        return self._indexes(self._teacher_courses_at, first, count)
+
+    def roster(self, first: int, count: int) -> Tuple[int, ...]:
+        return self._indexes(self._roster_at, first, count)
+
+    def student_courses(self, first: int, count: int) -> Tuple[int, ...]:
+        return self._indexes(self._student_courses_at, first, count)
+
+    def grades(self, first: int, count: int) -> Iterable[Tuple[int, float]]:
+        values = struct.unpack_from(f"<{count}d", self._map, self._grade_values_at + 8 * first)
+        return zip(self._indexes(self._grade_courses_at, first, count), values)
+
+    def waitlist(self, first: int, count: int) -> Iterable[Tuple[int, float]]:
+        priorities = struct.unpack_from(
+            f"<{count}d", self._map, self._waitlist_priorities_at + 8 * first
+        )
+        return zip(self._indexes(self._waitlist_students_at, first, count), priorities)
+
+    def student_waitlists(self, first: int, count: int) -> Tuple[int, ...]:
+        return self._indexes(self._student_waitlists_at, first, count)
+
+    def _indexes(self, section_at: int, first: int, count: int) -> Tuple[int, ...]:
+        return struct.unpack_from(f"<{count}I", self._map, section_at + 4 * first)
+
+    # ---------- Key lookup (records are sorted by key) ----------
+    def find_teacher(self, teacher_id: str) -> Optional[int]:
+        return self._find(self.teacher, self.teacher_count, teacher_id)
+
+    def find_course(self, course_code: str) -> Optional[int]:
+        return self._find(self.course, self.course_count, course_code)
+
+    def find_student(self, student_id: str) -> Optional[int]:
+        return self._find(self.student, self.student_count, student_id)
+
+    def teachers_after(self, teacher_id: Optional[str]) -> int:
+        return self._after(self.teacher, self.teacher_count, teacher_id)
+
+    def courses_after(self, course_code: Optional[str]) -> int:
+        return self._after(self.course, self.course_count, course_code)
+
+    def students_after(self, student_id: Optional[str]) -> int:
+        return self._after(self.student, self.student_count, student_id)
+
+    def _find(self, record: Callable[[int], Tuple[int, ...]], count: int, key: str) -> Optional[int]:
+        index = self._after(record, count, key) - 1
+        if index >= 0 and self.string(record(index)[0]) == key:
+            return index
+        return None
+
+    def _after(self, record: Callable[[int], Tuple[int, ...]], count: int, key: Optional[str]) -> int:
+        """Index of the first record whose key sorts after ``key`` (bisect_right)."""
+        if key is None:
+            return 0
+        # UTF-8 preserves code point order, so raw bytes compare like str.
+        raw = key.encode("utf-8")
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if raw < self._raw_string(record(middle)[0]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+
+class SnapshotGraph:
+    """
+    Domain objects materialized from a SnapshotFile, by record index.
+
+    An entity is created with its id and name only; its relationships are
+    LazyMappings decoded from the file on first use, and the entities they
+    reach are materialized (once) in turn. ``cache`` decides how long
+    materialized entities are kept: a dict keeps them all, a
+    WeakValueDictionary only while something else references them.
+    """
+
+    def __init__(
+            self,
+            file: SnapshotFile,
+            cache: Callable[[], MutableMapping[int, object]] = dict,
+    ) -> None:
+        self.file = file
+        self._lock = threading.RLock()
+        self._teachers = cache()
+        self._courses = cache()
+        self._students = cache()
+        # Equal strings share one object, like they share one table entry.
+        self._strings: Dict[int, str] = {}
+
+    def teacher(self, index: int) -> Teacher:
+        with self._lock:
+            teacher = self._teachers.get(index)
+            if teacher is None:
+                id_ref, name_ref, _, count = self.file.teacher(index)
+                teacher = self._teachers[index] = Teacher.reconstitute(
+                    self._string(id_ref), self._string(name_ref),
+                    LazyMapping(self._load_teacher_courses, index, count),
+                )
+            return teacher
+
+    def course(self, index: int) -> Course:
+        with self._lock:
+            course = self._courses.get(index)
+            if course is None:
+                (code_ref, name_ref, teacher, _, size,
+                 capacity, first, waitlisted) = self.file.course(index)
+                course = self._courses[index] = Course.reconstitute(
+                    self._string(code_ref), self._string(name_ref),
+                    None if teacher == _NONE else self.teacher(teacher),
+                    LazyMapping(self._load_roster, index, size),
+                    capacity=None if capacity == _NONE else capacity,
+                    # Waitlisted students are only materialized (not
+                    # loaded) here, which never leads back to this course.
+                    waitlist=Waitlist.of(
+                        (self.student(i), priority, seq)
+                        for seq, (i, priority) in enumerate(self.file.waitlist(first, waitlisted))
+                    ) if waitlisted else None,
+                )
+            return course
+
+    def student(self, index: int) -> Student:
+        with self._lock:
+            student = self._students.get(index)
+            if student is None:
+                (id_ref, name_ref, _, course_count, _, grade_count,
+                 _, waitlist_count) = self.file.student(index)
+                student = self._students[index] = Student.reconstitute(
+                    self._string(id_ref), self._string(name_ref),
+                    LazyMapping(self._load_student_courses, index, course_count),
+                    LazyMapping(self._load_grades, index, grade_count),
+                    LazyMapping(self._load_student_waitlists, index, waitlist_count)
+                    if waitlist_count else None,
+                )
+            return student
+
+    def _string(self, ref: int) -> str:
+        value = self._strings.get(ref)
+        if value is None:
+            value = self._strings[ref] = self.file.string(ref)
+        return value
+
+    # ---------- Relationship loaders (called once per LazyMapping) ----------
+    def _load_teacher_courses(self, index: int) -> Dict[str, Course]:
+        _, _, first, count = self.file.teacher(index)
+        courses = (self.course(i) for i in self.file.teacher_courses(first, count))
+        return {course.code: course for course in courses}
+
+    def _load_roster(self, index: int) -> Dict[str, Student]:
+        _, _, _, first, size, _, _, _ = self.file.course(index)
+        students = (self.student(i) for i in self.file.roster(first, size))
+        return {student.id: student for student in students}
+
+    def _load_student_courses(self, index: int) -> Dict[str, Course]:
+        _, _, first, count, _, _, _, _ = self.file.student(index)
+        courses = (self.course(i) for i in self.file.student_courses(first, count))
+        return {course.code: course for course in courses}
+
+    def _load_student_waitlists(self, index: int) -> Dict[str, Course]:
+        _, _, _, _, _, _, first, count = self.file.student(index)
+        courses = (self.course(i) for i in self.file.student_waitlists(first, count))
+        return {course.code: course for course in courses}
+
+    def _load_grades(self, index: int) -> Dict[Course, float]:
+        _, _, _, _, first, count, _, _ = self.file.student(index)
+        return {self.course(i): value for i, value in self.file.grades(first, count)}
+
+
+_teacher_id = attrgetter("id")
+_course_code = attrgetter("code")
+_student_id = attrgetter("id")
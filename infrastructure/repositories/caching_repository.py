@@ -0,0 +1,206 @@
+# infrastructure/repositories/caching_repository.py
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Callable, Generic, Iterable, Optional, Sequence, Tuple, TypeVar
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.repositories.base_repository import BaseRepository
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.pagination import Page
+from domain.repositories.queries import Query
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.teacher_repository import TeacherRepository
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of a CachingRepository since it was created (or reset)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingRepository(BaseRepository[T, str], Generic[T]):
+    """
+    Read-through cache in front of any repository, for get().
+
+    - Holds at most ``max_size`` entities; the least recently used one is
+      evicted to make room.
+    - With a ``ttl`` (seconds), an entry older than that is reloaded from
+      the wrapped repository on its next get().
+    - add(), add_many() and remove() invalidate the keys; update()
+      refreshes the entry with the entity just written. Misses
+      (EntityNotFoundError) are not cached.
+    - Listings, pages, streams and find() go straight to the wrapped
+      repository, which may serve them from its own indexes.
+
+    ``key`` gives an entity's repository key (e.g. a course's code); each
+    subclass below passes the one of its entity type.
+
+    stats() reports hits, misses and evictions for sizing the cache.
+    Thread-safe: the cache takes an internal lock, released while the
+    wrapped repository loads a miss.
+    """
+
+    def __init__(
+            self,
+            repository: BaseRepository[T, str],
+            key: Callable[[T], str],
+            max_size: int = 10_000,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer.")
+        self.repository = repository
+        self._key = key
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (entity, time cached); order = least recently used first.
+        self._entries: OrderedDict[str, Tuple[T, float]] = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+        # Bumped by every write, so a load that raced with a write
+        # does not cache what it read before the write.
+        self._generation = 0
+
+    # ---------- Cached reads ----------
+    def get(self, key: str) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or self._clock() - entry[1] < self.ttl):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            generation = self._generation
+        entity = self.repository.get(key)
+        self._store(key, entity, generation)
+        return entity
+
+    # ---------- Writes (through to the wrapped repository) ----------
+    def add(self, entity: T) -> None:
+        self.repository.add(entity)
+        self.invalidate(self._key(entity))
+
+    def add_many(self, entities: Sequence[T]) -> None:
+        try:
+            self.repository.add_many(entities)
+        finally:
+            with self._lock:
+                for entity in entities:
+                    self._entries.pop(self._key(entity), None)
+                self._generation += 1
+
+    def update(self, entity: T) -> None:
+        self.repository.update(entity)
+        key = self._key(entity)
+        with self._lock:
+            self._generation += 1
+            if key in self._entries:
+                self._entries[key] = (entity, self._clock())
+                self._entries.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        try:
+            self.repository.remove(key)
+        finally:
+            self.invalidate(key)
+
+    # ---------- Uncached reads ----------
+    def list_all(self) -> Iterable[T]:
+        return self.repository.list_all()
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[T]:
+        return self.repository.list_page(limit, after_id)
+
+    def find(self, query: Query[T]) -> Tuple[T, ...]:
+        return self.repository.find(query)
+
+    # ---------- Cache management ----------
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Empty the cache (not the wrapped repository)."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries), self.max_size
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def _store(self, key: str, entity: T, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (entity, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+class CachingStudentRepository(CachingRepository[Student], StudentRepository):
+    def __init__(
+            self,
+            repository: StudentRepository,
+            max_size: int = 10_000,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(repository, _entity_id, max_size, ttl, clock)
+
+
+class CachingTeacherRepository(CachingRepository[Teacher], TeacherRepository):
+    def __init__(
+            self,
+            repository: TeacherRepository,
+            max_size: int = 10_000,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(repository, _entity_id, max_size, ttl, clock)
+
+
+class CachingCourseRepository(CachingRepository[Course], CourseRepository):
+    def __init__(
+            self,
+            repository: CourseRepository,
+            max_size: int = 10_000,
+            ttl: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(repository, _course_code, max_size, ttl, clock)
+
+
+_entity_id = attrgetter("id")
+_course_code = attrgetter("code")
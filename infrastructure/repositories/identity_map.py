@@ -0,0 +1,40 @@
+# infrastructure/repositories/identity_map.py
+
+from __future__ import annotations
+from typing import Dict, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """
+    Per-session registry of the entities materialized from storage.
+
+    Guarantees that a given (entity type, id) is loaded at most once per
+    session, so every relationship and every repository ``get`` refers to
+    the same object. A session lasts until ``clear()``; objects handed out
+    before that are detached from the storage afterwards.
+    """
+
+    __slots__ = ("_entities",)
+
+    def __init__(self) -> None:
+        self._entities: Dict[type, Dict[str, object]] = {}
+
+    def get(self, kind: Type[T], key: str) -> Optional[T]:
+        entities = self._entities.get(kind)
+        return None if entities is None else entities.get(key)
+
+    def add(self, kind: Type[T], key: str, entity: T) -> None:
+        self._entities.setdefault(kind, {})[key] = entity
+
+    def discard(self, kind: type, key: str) -> None:
+        entities = self._entities.get(kind)
+        if entities is not None:
+            entities.pop(key, None)
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entities) for entities in self._entities.values())
@@ -0,0 +1,95 @@
+# infrastructure/repositories/lazy_mapping.py
+
+from __future__ import annotations
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Generic, Iterator, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LazyMapping(MutableMapping, Generic[K, V]):
+    """
+    Mutable mapping that is filled by a loader on first access.
+
+    Storage-backed repositories hand these to the domain (see
+    Course.reconstitute / Student.reconstitute / Teacher.reconstitute) for
+    relationship collections, so loading an entity costs one row and its
+    related entities are only fetched when the collection is actually used.
+
+    The loader is called as ``loader(key)`` and must return a dict; after
+    that the mapping behaves exactly like that dict. When the caller already
+    knows how many items the loader will return, passing it as ``length``
+    lets len() answer without loading (e.g. for repository indexes).
+    """
+
+    __slots__ = ("_loader", "_key", "_data", "_length")
+
+    def __init__(
+            self,
+            loader: Callable[[object], Dict[K, V]],
+            key: object,
+            length: Optional[int] = None,
+    ) -> None:
+        self._loader = loader
+        self._key = key
+        self._data: Dict[K, V] | None = None
+        self._length = length
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None
+
+    def _load(self) -> Dict[K, V]:
+        data = self._data
+        if data is None:
+            data = self._data = self._loader(self._key)
+            self._loader = None    # release the loader's references
+        return data
+
+    # The dict methods are forwarded directly rather than going through the
+    # MutableMapping mixins: these calls sit on the enroll/drop/grade paths.
+    def __getitem__(self, key: K) -> V:
+        return self._load()[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._load()[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        del self._load()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        if self._data is None and self._length is not None:
+            return self._length
+        return len(self._load())
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        return self._load().get(key, default)
+
+    def pop(self, key: K, *default: V) -> V:
+        return self._load().pop(key, *default)
+
+    def clear(self) -> None:
+        # Nothing to load: the result is empty either way.
+        self._data = {}
+        self._loader = None
+
+    def keys(self):
+        return self._load().keys()
+
+    def values(self):
+        return self._load().values()
+
+    def items(self):
+        return self._load().items()
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return f"{type(self).__name__}({self._data!r})"
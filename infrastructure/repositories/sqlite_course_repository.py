@@ -0,0 +1,161 @@
+# infrastructure/repositories/sqlite_course_repository.py
+
+from __future__ import annotations
+import sqlite3
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence
+
+from domain.models.course import Course
+from domain.repositories.course_repository import CourseRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EntityNotFoundError
+)
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+
+
+class SqliteCourseRepository(CourseRepository):
+    """
+    SQLite implementation of CourseRepository.
+
+    Course is the aggregate root for enrollment and teacher assignment, so
+    this repository persists the ``courses`` row (including ``teacher_id``
+    and ``capacity``) and the course's rows in ``enrollments`` and
+    ``waitlist``. Removing a course cascades to its enrollments, their
+    grades and its waitlist.
+
+    update() writes only the roster changes recorded since the last write
+    (see TrackedMapping), so one enrollment costs one INSERT whatever the
+    size of the course.
+    """
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._db = database
+
+    def add(self, course: Course) -> None:
+        code = course.code
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO courses (code, name, teacher_id, capacity) VALUES (?, ?, ?, ?)",
+                    (code, course.name, course.teacher.id if course.teacher else None,
+                     course.capacity),
+                )
+                self._write_roster(conn, course, everything=True)
+                self._write_waitlist(conn, course)
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError(f"Course '{code}' already exists.") from None
+        self._db.identity_map.add(Course, code, course)
+
+    def add_many(self, courses: Sequence[Course]) -> None:
+        """Insert a batch of courses with one statement; all or nothing."""
+        try:
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO courses (code, name, teacher_id, capacity) VALUES (?, ?, ?, ?)",
+                    [
+                        (course.code, course.name,
+                         course.teacher.id if course.teacher else None, course.capacity)
+                        for course in courses
+                    ],
+                )
+                for course in courses:
+                    self._write_roster(conn, course, everything=True)
+                    if course.waitlist_length:
+                        self._write_waitlist(conn, course)
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError("A course in the batch already exists.") from None
+        for course in courses:
+            self._db.identity_map.add(Course, course.code, course)
+
+    def get(self, course_code: str) -> Course:
+        course = self._db.load_course(course_code)
+        if course is None:
+            raise EntityNotFoundError(f"Course '{course_code}' not found.")
+        return course
+
+    def update(self, course: Course) -> None:
+        code = course.code
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE courses SET name = ?, teacher_id = ?, capacity = ? WHERE code = ?",
+                (course.name, course.teacher.id if course.teacher else None,
+                 course.capacity, code),
+            )
+            if cursor.rowcount == 0:
+                raise EntityNotFoundError(f"Course '{code}' not found.")
+            self._write_roster(conn, course, everything=False)
+            self._write_waitlist(conn, course)
+
+    def remove(self, course_code: str) -> None:
+        cursor = self._db.connection.execute("DELETE FROM courses WHERE code = ?", (course_code,))
+        if cursor.rowcount == 0:
+            raise EntityNotFoundError(f"Course '{course_code}' not found.")
+        self._db.identity_map.discard(Course, course_code)
+
+    def list_all(self) -> Iterable[Course]:
+        return tuple(self._db.load_all_courses())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Course]:
+        return fetch_page(self._db.load_course_page, limit, after_id, _course_code)
+
+    def _write_roster(self, conn: sqlite3.Connection, course: Course, everything: bool) -> None:
+        """
+        Write the roster changes recorded since the last write, one row per
+        student who joined or left; with ``everything`` (a course being
+        added) write the whole roster. New rows keep roster order.
+        """
+        roster = self._db.tracked_roster(course)
+        code = course.code
+        if everything:
+            cleared, written, deleted = False, roster, ()
+        elif roster.is_dirty:
+            cleared, written, deleted = roster.changes()
+        else:
+            return
+        if cleared:
+            conn.execute("DELETE FROM enrollments WHERE course_code = ?", (code,))
+        if deleted:
+            conn.executemany(
+                "DELETE FROM enrollments WHERE course_code = ? AND student_id = ?",
+                [(code, student_id) for student_id in deleted],
+            )
+        if written:
+            # OR IGNORE: a student dropped and re-enrolled since the last
+            # write keeps the stored row (and its place in the enrollment order).
+            conn.executemany(
+                "INSERT OR IGNORE INTO enrollments (course_code, student_id) VALUES (?, ?)",
+                [(code, student_id) for student_id in written],
+            )
+        roster.mark_clean()
+
+    @staticmethod
+    def _write_waitlist(conn: sqlite3.Connection, course: Course) -> None:
+        """Replace the persisted waitlist of ``course`` with its current entries."""
+        persisted = {
+            student_id: (priority, seq)
+            for student_id, priority, seq in conn.execute(
+                "SELECT student_id, priority, seq FROM waitlist WHERE course_code = ?",
+                (course.code,),
+            )
+        }
+        current = {
+            student.id: (priority, seq) for student, priority, seq in course.waitlist_entries
+        }
+        conn.executemany(
+            "DELETE FROM waitlist WHERE course_code = ? AND student_id = ?",
+            [(course.code, student_id) for student_id in persisted.keys() - current.keys()],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO waitlist (course_code, student_id, priority, seq) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (course.code, student_id, priority, seq)
+                for student_id, (priority, seq) in current.items()
+                if persisted.get(student_id) != (priority, seq)
+            ],
+        )
+
+
+_course_code = attrgetter("code")
@@ -0,0 +1,418 @@
+# infrastructure/repositories/sqlite_database.py
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.models.waitlist import Waitlist
+from infrastructure.repositories.identity_map import IdentityMap
+from infrastructure.repositories.lazy_mapping import LazyMapping
+from infrastructure.repositories.tracked_mapping import TrackedMapping
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id   TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS teachers (
+    id   TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+-- capacity is NULL for a course without a seat limit.
+CREATE TABLE IF NOT EXISTS courses (
+    code       TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    teacher_id TEXT REFERENCES teachers(id) ON DELETE SET NULL,
+    capacity   INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_courses_teacher ON courses(teacher_id);
+
+-- seq records enrollment order for both Course.students and Student.courses.
+CREATE TABLE IF NOT EXISTS enrollments (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_code TEXT NOT NULL REFERENCES courses(code) ON DELETE CASCADE,
+    student_id  TEXT NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+    UNIQUE (course_code, student_id)
+);
+CREATE INDEX IF NOT EXISTS idx_enrollments_student ON enrollments(student_id);
+
+-- A grade cannot outlive the enrollment it belongs to.
+CREATE TABLE IF NOT EXISTS grades (
+    student_id  TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    value       REAL NOT NULL CHECK (value BETWEEN 0.0 AND 10.0),
+    PRIMARY KEY (student_id, course_code),
+    FOREIGN KEY (course_code, student_id)
+        REFERENCES enrollments(course_code, student_id) ON DELETE CASCADE
+);
+
+-- Waitlists of full courses; seq is the arrival order within a course.
+CREATE TABLE IF NOT EXISTS waitlist (
+    course_code TEXT NOT NULL REFERENCES courses(code) ON DELETE CASCADE,
+    student_id  TEXT NOT NULL REFERENCES students(id) ON DELETE CASCADE,
+    priority    REAL NOT NULL,
+    seq         INTEGER NOT NULL,
+    PRIMARY KEY (course_code, student_id)
+);
+CREATE INDEX IF NOT EXISTS idx_waitlist_student ON waitlist(student_id);
+"""
+
+
+class SqliteDatabase:
+    """
+    Shared SQLite connection, schema and identity map for the SQLite
+    repositories (SqliteStudentRepository, SqliteTeacherRepository,
+    SqliteCourseRepository).
+
+    - The connection runs in WAL mode with foreign keys enforced. All SQL is
+      parameterized and issued as constant strings, so sqlite3 keeps the
+      prepared statements in its per-connection statement cache.
+    - Each row is materialized at most once per session: the identity map
+      guarantees that ``get`` on any repository returns the same object that
+      relationships point to. ``identity_map.clear()`` starts a new session.
+    - Loading an entity reads one row. Its relationship collections
+      (Course roster, Student courses/grades/waitlists, Teacher courses)
+      are LazyMappings that run a single join query on first access and
+      resolve related rows through the identity map. A course with a seat
+      limit also reads its waitlist when it is loaded.
+    - A course's roster and a student's grades are TrackedMappings: the
+      repositories write only what changed since the last write, and
+      checking or changing a single enrollment or grade is a point query
+      that leaves the collection unloaded.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.connection = sqlite3.connect(
+            path, isolation_level=None, cached_statements=256
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._migrate()
+        self.identity_map = IdentityMap()
+        # The change-tracked collections of every entity this database has
+        # loaded or stored; weak, like a detached entity, they may go away.
+        self._rosters: WeakKeyDictionary[Course, TrackedMapping[str, Student]] = (
+            WeakKeyDictionary()
+        )
+        self._grades: WeakKeyDictionary[Student, TrackedMapping[Course, float]] = (
+            WeakKeyDictionary()
+        )
+
+    def _migrate(self) -> None:
+        """Bring a database created by an earlier version up to SCHEMA."""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(courses)")}
+        if "capacity" not in columns:
+            self.connection.execute("ALTER TABLE courses ADD COLUMN capacity INTEGER")
+
+    # ---------- Connection management ----------
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of statements atomically. Nested calls join the
+        outermost transaction.
+        """
+        if self.connection.in_transaction:
+            yield self.connection
+            return
+
+        self.connection.execute("BEGIN")
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> SqliteDatabase:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ---------- Change-tracked relationships ----------
+    def tracked_roster(self, course: Course) -> TrackedMapping[str, Student]:
+        """
+        The change-tracked roster of ``course``. A course built outside
+        this database (e.g. one being added) gets one attached, holding
+        its current students as unwritten changes.
+        """
+        roster = self._rosters.get(course)
+        if roster is None:
+            roster = TrackedMapping(None, course.code, self._probe_roster, data={})
+            course.attach_roster(roster)
+            self._rosters[course] = roster
+        return roster
+
+    def tracked_grades(self, student: Student) -> TrackedMapping[Course, float]:
+        """Same as tracked_roster, for the grades of ``student``."""
+        grades = self._grades.get(student)
+        if grades is None:
+            grades = TrackedMapping(None, student.id, self._probe_grade, data={})
+            student.attach_grades(grades)
+            self._grades[student] = grades
+        return grades
+
+    # ---------- Loading (identity-mapped, one row per entity) ----------
+    def load_student(self, student_id: str) -> Optional[Student]:
+        student = self.identity_map.get(Student, student_id)
+        if student is None:
+            row = self.connection.execute(
+                "SELECT id, name FROM students WHERE id = ?", (student_id,)
+            ).fetchone()
+            student = row and self._student(*row)
+        return student
+
+    def load_teacher(self, teacher_id: str) -> Optional[Teacher]:
+        teacher = self.identity_map.get(Teacher, teacher_id)
+        if teacher is None:
+            row = self.connection.execute(
+                "SELECT id, name FROM teachers WHERE id = ?", (teacher_id,)
+            ).fetchone()
+            teacher = row and self._teacher(*row)
+        return teacher
+
+    def load_course(self, course_code: str) -> Optional[Course]:
+        course = self.identity_map.get(Course, course_code)
+        if course is None:
+            row = self.connection.execute(
+                f"SELECT {_COURSE_COLUMNS} FROM courses c {_TEACHER_JOIN} WHERE c.code = ?", (course_code,)
+            ).fetchone()
+            course = row and self._course(*row)
+        return course
+
+    def load_all_students(self) -> List[Student]:
+        return [self._student(*row) for row in self.connection.execute(
+            "SELECT id, name FROM students ORDER BY rowid"
+        )]
+
+    def load_all_teachers(self) -> List[Teacher]:
+        return [self._teacher(*row) for row in self.connection.execute(
+            "SELECT id, name FROM teachers ORDER BY rowid"
+        )]
+
+    def load_all_courses(self) -> List[Course]:
+        return [self._course(*row) for row in self.connection.execute(
+            f"SELECT {_COURSE_COLUMNS} FROM courses c {_TEACHER_JOIN} ORDER BY c.rowid"
+        )]
+
+    def load_student_page(self, limit: int, after_id: Optional[str]) -> List[Student]:
+        return [self._student(*row) for row in self.connection.execute(
+            "SELECT id, name FROM students WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id if after_id is not None else "", limit),
+        )]
+
+    def load_teacher_page(self, limit: int, after_id: Optional[str]) -> List[Teacher]:
+        return [self._teacher(*row) for row in self.connection.execute(
+            "SELECT id, name FROM teachers WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id if after_id is not None else "", limit),
+        )]
+
+    def load_course_page(self, limit: int, after_id: Optional[str]) -> List[Course]:
+        return [self._course(*row) for row in self.connection.execute(
+            f"SELECT {_COURSE_COLUMNS} FROM courses c {_TEACHER_JOIN} "
+            "WHERE c.code > ? ORDER BY c.code LIMIT ?",
+            (after_id if after_id is not None else "", limit),
+        )]
+
+    # ---------- Plain rows (no entities, identity map untouched) ----------
+    def student_rows(self, batch_size: int) -> Iterator[Tuple[str, str]]:
+        """(id, name) per student in id order, fetched ``batch_size`` at a time."""
+        return self._paged_rows(
+            "SELECT id, name FROM students WHERE id > ? ORDER BY id LIMIT ?", batch_size
+        )
+
+    def teacher_rows(self, batch_size: int) -> Iterator[Tuple[str, str]]:
+        """Same as student_rows, for teachers."""
+        return self._paged_rows(
+            "SELECT id, name FROM teachers WHERE id > ? ORDER BY id LIMIT ?", batch_size
+        )
+
+    def course_rows(
+            self, batch_size: int
+    ) -> Iterator[Tuple[str, str, Optional[str], Optional[int]]]:
+        """(code, name, teacher id, capacity) per course in code order."""
+        return self._paged_rows(
+            "SELECT code, name, teacher_id, capacity FROM courses "
+            "WHERE code > ? ORDER BY code LIMIT ?",
+            batch_size,
+        )
+
+    def enrollment_rows(
+            self, batch_size: int
+    ) -> Iterator[Tuple[str, str, Optional[float]]]:
+        """
+        (student id, course code, grade or None) per enrollment, by course
+        in code order and roster order within a course; one query per
+        course, so at most one roster of rows is held at a time.
+        """
+        codes = self._paged_rows(
+            "SELECT code FROM courses WHERE code > ? ORDER BY code LIMIT ?", batch_size
+        )
+        for (code,) in codes:
+            yield from self.connection.execute(
+                "SELECT e.student_id, e.course_code, g.value FROM enrollments e "
+                "LEFT JOIN grades g "
+                "ON g.student_id = e.student_id AND g.course_code = e.course_code "
+                "WHERE e.course_code = ? ORDER BY e.seq",
+                (code,),
+            ).fetchall()
+
+    def _paged_rows(self, sql: str, batch_size: int) -> Iterator[tuple]:
+        """
+        Rows of ``sql``, which selects the key first and takes the key to
+        start after and the page size as parameters (keyset paging).
+        """
+        after = ""
+        while True:
+            rows = self.connection.execute(sql, (after, batch_size)).fetchall()
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    # ---------- Row -> entity (identity map first) ----------
+    def _student(self, student_id: str, name: str) -> Student:
+        student = self.identity_map.get(Student, student_id)
+        if student is None:
+            grades = TrackedMapping(self._load_student_grades, student_id, self._probe_grade)
+            student = Student.reconstitute(
+                student_id,
+                name,
+                courses=LazyMapping(self._load_student_courses, student_id),
+                grades=grades,
+                waitlists=LazyMapping(self._load_student_waitlists, student_id),
+            )
+            self._grades[student] = grades
+            self.identity_map.add(Student, student_id, student)
+        return student
+
+    def _teacher(self, teacher_id: str, name: str) -> Teacher:
+        teacher = self.identity_map.get(Teacher, teacher_id)
+        if teacher is None:
+            teacher = Teacher.reconstitute(
+                teacher_id, name, courses=LazyMapping(self._load_teacher_courses, teacher_id)
+            )
+            self.identity_map.add(Teacher, teacher_id, teacher)
+        return teacher
+
+    def _course(
+            self,
+            code: str,
+            name: str,
+            capacity: Optional[int],
+            teacher_id: Optional[str],
+            teacher_name: Optional[str],
+    ) -> Course:
+        course = self.identity_map.get(Course, code)
+        if course is None:
+            teacher = None if teacher_id is None else self._teacher(teacher_id, teacher_name)
+            # Only a course with a seat limit can have a waitlist.
+            waitlist = None if capacity is None else self._load_waitlist(code)
+            roster = TrackedMapping(self._load_roster, code, self._probe_roster)
+            course = Course.reconstitute(
+                code, name, teacher, students=roster, capacity=capacity, waitlist=waitlist,
+            )
+            self._rosters[course] = roster
+            self.identity_map.add(Course, code, course)
+        return course
+
+    # ---------- Relationship loaders (one query per collection) ----------
+    def _load_roster(self, course_code: str) -> Dict[str, Student]:
+        return {
+            student_id: self._student(student_id, name)
+            for student_id, name in self.connection.execute(
+                "SELECT s.id, s.name FROM enrollments e JOIN students s ON s.id = e.student_id "
+                "WHERE e.course_code = ? ORDER BY e.seq",
+                (course_code,),
+            )
+        }
+
+    def _probe_roster(self, course_code: str, student_id: str) -> Optional[Student]:
+        row = self.connection.execute(
+            "SELECT s.id, s.name FROM enrollments e JOIN students s ON s.id = e.student_id "
+            "WHERE e.course_code = ? AND e.student_id = ?",
+            (course_code, student_id),
+        ).fetchone()
+        return row and self._student(*row)
+
+    def _load_student_courses(self, student_id: str) -> Dict[str, Course]:
+        return {
+            row[0]: self._course(*row)
+            for row in self.connection.execute(
+                f"SELECT {_COURSE_COLUMNS} FROM enrollments e "
+                f"JOIN courses c ON c.code = e.course_code {_TEACHER_JOIN} "
+                "WHERE e.student_id = ? ORDER BY e.seq",
+                (student_id,),
+            )
+        }
+
+    def _load_student_grades(self, student_id: str) -> Dict[Course, float]:
+        return {
+            self._course(code, name, capacity, teacher_id, teacher_name): value
+            for code, name, capacity, teacher_id, teacher_name, value in self.connection.execute(
+                f"SELECT {_COURSE_COLUMNS}, g.value FROM grades g "
+                f"JOIN courses c ON c.code = g.course_code {_TEACHER_JOIN} "
+                "WHERE g.student_id = ?",
+                (student_id,),
+            )
+        }
+
+    def _probe_grade(self, student_id: str, course: Course) -> Optional[float]:
+        row = self.connection.execute(
+            "SELECT value FROM grades WHERE student_id = ? AND course_code = ?",
+            (student_id, course.code),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _load_waitlist(self, course_code: str) -> Optional[Waitlist]:
+        rows = self.connection.execute(
+            "SELECT s.id, s.name, w.priority, w.seq FROM waitlist w "
+            "JOIN students s ON s.id = w.student_id WHERE w.course_code = ?",
+            (course_code,),
+        ).fetchall()
+        if not rows:
+            return None
+        return Waitlist.of(
+            (self._student(student_id, name), priority, seq)
+            for student_id, name, priority, seq in rows
+        )
+
+    def _load_student_waitlists(self, student_id: str) -> Dict[str, Course]:
+        return {
+            row[0]: self._course(*row)
+            for row in self.connection.execute(
+                f"SELECT {_COURSE_COLUMNS} FROM waitlist w "
+                f"JOIN courses c ON c.code = w.course_code {_TEACHER_JOIN} "
+                "WHERE w.student_id = ? ORDER BY c.code",
+                (student_id,),
+            )
+        }
+
+    def _load_teacher_courses(self, teacher_id: str) -> Dict[str, Course]:
+        return {
+            row[0]: self._course(*row)
+            for row in self.connection.execute(
+                f"SELECT {_COURSE_COLUMNS} FROM courses c {_TEACHER_JOIN} "
+                "WHERE c.teacher_id = ? ORDER BY c.rowid",
+                (teacher_id,),
+            )
+        }
+
+
+# A course row always comes with its teacher's name so the teacher can be
+# materialized without another round trip.
+_COURSE_COLUMNS = "c.code, c.name, c.capacity, c.teacher_id, t.name"
+_TEACHER_JOIN = "LEFT JOIN teachers t ON t.id = c.teacher_id"
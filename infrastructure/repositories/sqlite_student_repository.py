@@ -0,0 +1,120 @@
+# infrastructure/repositories/sqlite_student_repository.py
+
+from __future__ import annotations
+import sqlite3
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence
+
+from domain.models.student import Student
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EntityNotFoundError
+)
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+
+
+class SqliteStudentRepository(StudentRepository):
+    """
+    SQLite implementation of StudentRepository.
+
+    Persists the ``students`` table and the student's grades (Student owns
+    grades). Enrollments are owned by the Course aggregate and written by
+    SqliteCourseRepository. Removing a student cascades to its enrollments
+    and grades.
+
+    update() writes only the grades changed since the last write (see
+    TrackedMapping), so one grade costs one statement whatever the size of
+    the student's transcript.
+    """
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._db = database
+
+    def add(self, student: Student) -> None:
+        student_id = student.id
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO students (id, name) VALUES (?, ?)",
+                    (student_id, student.name),
+                )
+                self._write_grades(conn, student, everything=True)
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError(f"Student '{student_id}' already exists.") from None
+        self._db.identity_map.add(Student, student_id, student)
+
+    def add_many(self, students: Sequence[Student]) -> None:
+        """Insert a batch of students with one statement; all or nothing."""
+        try:
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO students (id, name) VALUES (?, ?)",
+                    [(student.id, student.name) for student in students],
+                )
+                for student in students:
+                    self._write_grades(conn, student, everything=True)
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError("A student in the batch already exists.") from None
+        for student in students:
+            self._db.identity_map.add(Student, student.id, student)
+
+    def get(self, student_id: str) -> Student:
+        student = self._db.load_student(student_id)
+        if student is None:
+            raise EntityNotFoundError(f"Student '{student_id}' not found.")
+        return student
+
+    def update(self, student: Student) -> None:
+        student_id = student.id
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE students SET name = ? WHERE id = ?", (student.name, student_id)
+            )
+            if cursor.rowcount == 0:
+                raise EntityNotFoundError(f"Student '{student_id}' not found.")
+            self._write_grades(conn, student, everything=False)
+
+    def remove(self, student_id: str) -> None:
+        cursor = self._db.connection.execute("DELETE FROM students WHERE id = ?", (student_id,))
+        if cursor.rowcount == 0:
+            raise EntityNotFoundError(f"Student '{student_id}' not found.")
+        self._db.identity_map.discard(Student, student_id)
+
+    def list_all(self) -> Iterable[Student]:
+        return tuple(self._db.load_all_students())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Student]:
+        return fetch_page(self._db.load_student_page, limit, after_id, _student_id)
+
+    def _write_grades(self, conn: sqlite3.Connection, student: Student, everything: bool) -> None:
+        """
+        Write the grades set or removed since the last write; with
+        ``everything`` (a student being added) write all of them.
+        """
+        grades = self._db.tracked_grades(student)
+        student_id = student.id
+        if everything:
+            cleared, written, deleted = False, grades, ()
+        elif grades.is_dirty:
+            cleared, written, deleted = grades.changes()
+        else:
+            return
+        if cleared:
+            conn.execute("DELETE FROM grades WHERE student_id = ?", (student_id,))
+        if deleted:
+            conn.executemany(
+                "DELETE FROM grades WHERE student_id = ? AND course_code = ?",
+                [(student_id, course.code) for course in deleted],
+            )
+        if written:
+            conn.executemany(
+                "INSERT INTO grades (student_id, course_code, value) VALUES (?, ?, ?) "
+                "ON CONFLICT (student_id, course_code) DO UPDATE SET value = excluded.value",
+                [(student_id, course.code, value) for course, value in written.items()],
+            )
+        grades.mark_clean()
+
+
+_student_id = attrgetter("id")
@@ -0,0 +1,80 @@
+# infrastructure/repositories/sqlite_teacher_repository.py
+
+from __future__ import annotations
+import sqlite3
+from operator import attrgetter
+from typing import Iterable, Optional, Sequence
+
+from domain.models.teacher import Teacher
+from domain.repositories.teacher_repository import TeacherRepository
+from domain.repositories.pagination import Page, fetch_page
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EntityNotFoundError
+)
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+
+
+class SqliteTeacherRepository(TeacherRepository):
+    """
+    SQLite implementation of TeacherRepository.
+
+    Only the ``teachers`` table is written here: teacher assignment is part
+    of the Course aggregate (``courses.teacher_id``) and is persisted by
+    SqliteCourseRepository. Removing a teacher clears that column.
+    """
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._db = database
+
+    def add(self, teacher: Teacher) -> None:
+        teacher_id = teacher.id
+        try:
+            self._db.connection.execute(
+                "INSERT INTO teachers (id, name) VALUES (?, ?)", (teacher_id, teacher.name)
+            )
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError(f"Teacher '{teacher_id}' already exists.") from None
+        self._db.identity_map.add(Teacher, teacher_id, teacher)
+
+    def add_many(self, teachers: Sequence[Teacher]) -> None:
+        """Insert a batch of teachers with one statement; all or nothing."""
+        try:
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO teachers (id, name) VALUES (?, ?)",
+                    [(teacher.id, teacher.name) for teacher in teachers],
+                )
+        except sqlite3.IntegrityError:
+            raise DuplicateEntityError("A teacher in the batch already exists.") from None
+        for teacher in teachers:
+            self._db.identity_map.add(Teacher, teacher.id, teacher)
+
+    def get(self, teacher_id: str) -> Teacher:
+        teacher = self._db.load_teacher(teacher_id)
+        if teacher is None:
+            raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+        return teacher
+
+    def update(self, teacher: Teacher) -> None:
+        teacher_id = teacher.id
+        cursor = self._db.connection.execute(
+            "UPDATE teachers SET name = ? WHERE id = ?", (teacher.name, teacher_id)
+        )
+        if cursor.rowcount == 0:
+            raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+
+    def remove(self, teacher_id: str) -> None:
+        cursor = self._db.connection.execute("DELETE FROM teachers WHERE id = ?", (teacher_id,))
+        if cursor.rowcount == 0:
+            raise EntityNotFoundError(f"Teacher '{teacher_id}' not found.")
+        self._db.identity_map.discard(Teacher, teacher_id)
+
+    def list_all(self) -> Iterable[Teacher]:
+        return tuple(self._db.load_all_teachers())
+
+    def list_page(self, limit: int, after_id: Optional[str] = None) -> Page[Teacher]:
+        return fetch_page(self._db.load_teacher_page, limit, after_id, _teacher_id)
+
+
+_teacher_id = attrgetter("id")
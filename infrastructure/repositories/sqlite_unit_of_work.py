@@ -0,0 +1,29 @@
+# infrastructure/repositories/sqlite_unit_of_work.py
+
+from domain.repositories.unit_of_work import UnitOfWork
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+
+
+class SqliteUnitOfWork(UnitOfWork):
+    """
+    UnitOfWork over a SqliteDatabase connection.
+
+    Repository writes issued while a transaction is open join it (see
+    SqliteDatabase.transaction), so a whole batch costs a single COMMIT.
+    Foreign keys are checked at COMMIT rather than per statement, which lets
+    the application replay its undo steps in any order before a ROLLBACK.
+    """
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._db = database
+
+    def begin(self) -> None:
+        self._db.connection.execute("BEGIN")
+        self._db.connection.execute("PRAGMA defer_foreign_keys = ON")
+
+    def commit(self) -> None:
+        self._db.connection.execute("COMMIT")
+
+    def rollback(self) -> None:
+        if self._db.connection.in_transaction:
+            self._db.connection.execute("ROLLBACK")
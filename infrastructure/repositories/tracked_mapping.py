@@ -0,0 +1,147 @@
+# infrastructure/repositories/tracked_mapping.py
+
+from __future__ import annotations
+from typing import Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from infrastructure.repositories.lazy_mapping import LazyMapping
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TrackedMapping(LazyMapping[K, V]):
+    """
+    LazyMapping that records its changes since the last write, so a
+    storage-backed repository can persist only the delta (the rows of
+    the students who joined or left a roster, the grades that changed)
+    instead of re-reading and diffing the whole collection.
+
+    While not loaded, single-key reads and writes do not load it either:
+    a write is only recorded, and a read consults the recorded changes and
+    then ``probe(key, item_key)``, which looks up one stored item (None if
+    absent). Enrolling one student into a large course therefore costs a
+    point query, not the roster. Everything else (iteration, len(), ...)
+    loads the stored items and applies the recorded changes on top.
+
+    changes() returns (cleared, written, deleted): ``cleared`` means every
+    stored item goes first; ``written`` items are set (new or changed);
+    ``deleted`` keys are removed. mark_clean() starts a new record once the
+    repository has written them.
+    """
+
+    __slots__ = ("_probe", "_written", "_deleted", "_cleared")
+
+    def __init__(
+            self,
+            loader: Optional[Callable[[object], Dict[K, V]]],
+            key: object,
+            probe: Optional[Callable[[object, K], Optional[V]]] = None,
+            data: Optional[Dict[K, V]] = None,
+    ) -> None:
+        super().__init__(loader, key)
+        if data is not None:
+            self._data = data
+            self._loader = None
+        self._probe = probe
+        # Allocated on the first change: most entities are never modified.
+        self._written: Optional[Dict[K, V]] = None
+        self._deleted: Optional[Set[K]] = None
+        self._cleared = False
+
+    # ---------- Change record ----------
+    @property
+    def is_dirty(self) -> bool:
+        return self._cleared or bool(self._written) or bool(self._deleted)
+
+    def changes(self) -> Tuple[bool, Dict[K, V], Set[K]]:
+        return self._cleared, self._written or {}, self._deleted or set()
+
+    def mark_clean(self) -> None:
+        self._written = self._deleted = None
+        self._cleared = False
+
+    def _record_write(self, key: K, value: V) -> None:
+        if self._written is None:
+            self._written = {}
+        self._written[key] = value
+        if self._deleted:
+            self._deleted.discard(key)
+
+    def _record_delete(self, key: K) -> None:
+        if self._written:
+            self._written.pop(key, None)
+        if self._deleted is None:
+            self._deleted = set()
+        self._deleted.add(key)
+
+    # ---------- Loading ----------
+    def _load(self) -> Dict[K, V]:
+        data = self._data
+        if data is None:
+            data = super()._load()
+            # Changes recorded before loading are not stored yet.
+            for key in self._deleted or ():
+                data.pop(key, None)
+            data.update(self._written or {})
+        return data
+
+    def _peek(self, key: K):
+        """The value of ``key`` (or _MISSING), without loading if possible."""
+        data = self._data
+        if data is not None:
+            return data.get(key, _MISSING)
+        if self._probe is None:
+            return self._load().get(key, _MISSING)
+        if self._written and key in self._written:
+            return self._written[key]
+        if self._deleted and key in self._deleted:
+            return _MISSING
+        value = self._probe(self._key, key)
+        return _MISSING if value is None else value
+
+    # ---------- Mapping (single keys go through _peek) ----------
+    def __getitem__(self, key: K) -> V:
+        value = self._peek(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if self._data is not None:
+            self._data[key] = value
+        self._record_write(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        self.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self._peek(key) is not _MISSING
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        value = self._peek(key)
+        return default if value is _MISSING else value
+
+    def pop(self, key: K, *default: V) -> V:
+        value = self._peek(key)
+        if value is _MISSING:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        if self._data is not None:
+            del self._data[key]
+        self._record_delete(key)
+        return value
+
+    def clear(self) -> None:
+        if self._data is None:
+            # Nothing to load: every stored item goes.
+            self._cleared = True
+            self._deleted = None
+        else:
+            for key in self._data:
+                self._record_delete(key)
+        self._written = None
+        self._data = {}
+        self._loader = None
@@ -6,6 +6,18 @@ from application.services.student_management_system import StudentManagementSyst
 from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
 from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
 from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_student_repository import SqliteStudentRepository
+from infrastructure.repositories.sqlite_teacher_repository import SqliteTeacherRepository
+from infrastructure.repositories.sqlite_course_repository import SqliteCourseRepository
+from infrastructure.repositories.sqlite_unit_of_work import SqliteUnitOfWork
+from infrastructure.repositories.caching_repository import (
+    CachingCourseRepository,
+    CachingStudentRepository,
+    CachingTeacherRepository,
+)
 
 from domain.models.student import Student
 from domain.models.teacher import Teacher
@@ -15,19 +27,39 @@ from domain.models.course import Course
 # ----------------------------
 # System-level fixture
 # ----------------------------
-@pytest.fixture
-def sms():
+@pytest.fixture(params=["in_memory", "columnar", "sqlite", "cached_sqlite"])
+def sms(request, tmp_path):
     """
-    Fresh StudentManagementSystem for every test.
+    Fresh StudentManagementSystem for every test, once per repository backend.
 
     This is the correct way to initialize the SMS after refactoring:
     using dependency-injected repository implementations.
     """
-    return StudentManagementSystem(
-        student_repo=InMemoryStudentRepository(),
-        teacher_repo=InMemoryTeacherRepository(),
-        course_repo=InMemoryCourseRepository(),
-    )
+    if request.param in ("in_memory", "columnar"):
+        grade_store = ColumnarGradeStore() if request.param == "columnar" else None
+        yield StudentManagementSystem(
+            student_repo=InMemoryStudentRepository(grade_store),
+            teacher_repo=InMemoryTeacherRepository(),
+            course_repo=InMemoryCourseRepository(),
+            unit_of_work=InMemoryUnitOfWork(),
+        )
+        return
+
+    with SqliteDatabase(str(tmp_path / "sms.sqlite3")) as database:
+        student_repo = SqliteStudentRepository(database)
+        teacher_repo = SqliteTeacherRepository(database)
+        course_repo = SqliteCourseRepository(database)
+        if request.param == "cached_sqlite":
+            # Small enough that the suites also exercise eviction.
+            student_repo = CachingStudentRepository(student_repo, max_size=8)
+            teacher_repo = CachingTeacherRepository(teacher_repo, max_size=8)
+            course_repo = CachingCourseRepository(course_repo, max_size=8)
+        yield StudentManagementSystem(
+            student_repo=student_repo,
+            teacher_repo=teacher_repo,
+            course_repo=course_repo,
+            unit_of_work=SqliteUnitOfWork(database),
+        )
 
 # ----------------------------
 # Sample entity factories
@@ -1,7 +1,11 @@
 #tests/domain/test_course.py
+import weakref
+
 import pytest
 
 from domain.exceptions.domain_exceptions import EnrollmentError, TeacherAssignmentError
+from domain.models.course import Course
+from domain.models.student import Student
 from tests.conftest import make_course, make_student
 
 
@@ -129,5 +133,236 @@ def test_assigning_a_valid_grade_to_a_student_enrolled_in_the_course_succeeds(
     # Assert
     assert student.get_grade(course) == 8.5
 
+def test_enrolling_several_students_keeps_the_roster_in_enrollment_order(make_course, make_student):
+    # Arrange
+    course = make_course()
+    students = [make_student() for _ in range(5)]
+
+    # Act
+    for student in reversed(students):
+        course.enroll(student)
+    course.drop(students[2])
+
+    # Assert
+    assert course.students == (students[4], students[3], students[1], students[0])
+
+def test_dropping_a_different_student_that_shares_an_enrolled_students_id_raises_enrollmenterror(make_course):
+    # Arrange
+    course = make_course()
+    enrolled = Student("S01", "Alice")
+    impostor = Student("S01", "Mallory")
+    course.enroll(enrolled)
+
+    # Act / Assert
+    with pytest.raises(EnrollmentError):
+        course.drop(impostor)
+    assert course.students == (enrolled,)
+
+def test_students_view_reflects_later_enrollments_and_drops_without_copying(make_course, make_student):
+    # Arrange
+    course = make_course()
+    alice = make_student("Alice")
+    bob = make_student("Bob")
+    view = course.students_view
+
+    # Act
+    course.enroll(alice)
+    course.enroll(bob)
+    course.drop(alice)
+
+    # Assert
+    assert list(view) == [bob]
+    assert len(view) == 1
+    assert bob in view
+    assert alice not in view
+
+def test_students_view_does_not_allow_mutating_the_roster(make_course, make_student):
+    # Arrange
+    course = make_course()
+    student = make_student()
+    course.enroll(student)
+    view = course.students_view
+
+    # Act / Assert
+    assert not hasattr(view, "append")
+    assert not hasattr(view, "remove")
+    with pytest.raises(TypeError):
+        del view[student.id]
+    assert course.students == (student,)
+
+def test_students_view_indexes_and_slices_in_enrollment_order(make_course, make_student):
+    # Arrange
+    course = make_course()
+    alice, bob, carol = (make_student(name) for name in ("Alice", "Bob", "Carol"))
+    view = course.students_view
+    for student in (alice, bob, carol):
+        course.enroll(student)
+
+    # Act
+    course.drop(bob)
+
+    # Assert
+    assert (view[0], view[1], view[-1]) == (alice, carol, carol)
+    assert view[::-1] == (carol, alice)
+    assert list(reversed(view)) == [carol, alice]
+    assert view.index(carol) == 1
+    with pytest.raises(IndexError):
+        view[2]
+    with pytest.raises(ValueError):
+        view.index(bob)
+
+def test_a_course_can_be_weakly_referenced_and_rejects_ad_hoc_attributes(make_course):
+    # Arrange
+    course = make_course()
+
+    # Act
+    ref = weakref.ref(course)
+
+    # Assert
+    assert ref() is course
+    with pytest.raises(AttributeError):
+        course.capacity_override = 10
+
+def test_a_reconstituted_course_enforces_enrollment_rules_on_its_restored_roster(make_student):
+    # Arrange
+    student = make_student()
+    course = Course.reconstitute("C01", "Math", None, students={student.id: student})
+    student._add_course(course)    # the repository restores the other side
+
+    # Act / Assert
+    with pytest.raises(EnrollmentError):
+        course.enroll(student)
+    course.drop(student)
+    assert course.students == ()
+    assert student.courses == ()
+
+def test_restoring_mementos_undoes_an_enrollment_on_both_sides(make_course, make_student):
+    # Arrange
+    course = make_course()
+    student = make_student()
+    course_memento, student_memento = course.memento(), student.memento()
+    course.enroll(student)
+
+    # Act
+    course.restore(course_memento)
+    student.restore(student_memento)
+
+    # Assert
+    assert course.students == ()
+    assert student.courses == ()
+    course.enroll(student)    # invariants hold again after the restore
+    assert course.students == (student,)
+
+
+def test_detach_all_unassigns_teacher_and_drops_every_student_with_their_grades(
+        make_course, make_student, make_teacher
+):
+    course = make_course()
+    teacher = make_teacher()
+    students = [make_student() for _ in range(3)]
+    course.assign_teacher(teacher)
+    for student in students:
+        course.enroll(student)
+    students[0].assign_grade(course, 8.0)
+
+    dropped = course.detach_all()
+
+    assert dropped == tuple(students)
+    assert course.teacher is None and course not in teacher.courses
+    assert len(course.students_view) == 0
+    assert all(course not in student.courses_view for student in students)
+    assert students[0].get_grade(course) is None
+
+
+def test_drop_all_on_an_empty_course_returns_nothing(make_course):
+    assert make_course().drop_all() == ()
+
+
+# ---------- Capacity and waitlist ----------
+def test_enrolling_in_a_full_course_raises_enrollmenterror(make_student):
+    course = Course("C01", "Math", capacity=1)
+    course.enroll(make_student())
+
+    assert course.is_full
+    with pytest.raises(EnrollmentError):
+        course.enroll(make_student())
+
+
+def test_registering_enrolls_while_seats_are_free_then_waitlists(make_student):
+    course = Course("C01", "Math", capacity=1)
+    first, second, third = make_student(), make_student(), make_student()
+
+    assert course.register(first) is True
+    assert course.register(second, priority=2.0) is False
+    assert course.register(third, priority=1.0) is False
+
+    assert course.students == (first,)
+    assert course.waitlist == (third, second)
+    assert second.waitlisted_courses == (course,)
+    with pytest.raises(EnrollmentError):
+        course.join_waitlist(second)
+
+
+def test_dropping_a_student_promotes_the_next_waitlisted_student(make_student):
+    course = Course("C01", "Math", capacity=1)
+    first, second = make_student(), make_student()
+    course.register(first)
+    course.register(second)
+
+    promoted = course.drop(first)
+
+    assert promoted is second
+    assert course.students == (second,)
+    assert course.waitlist == ()
+    assert second.courses == (course,) and second.waitlisted_courses == ()
+    assert course.drop(second) is None
+
+
+def test_raising_the_capacity_promotes_in_waitlist_order_and_lowering_it_is_bounded(make_student):
+    course = Course("C01", "Math", capacity=1)
+    students = [make_student() for _ in range(4)]
+    for student in students:
+        course.register(student)
+
+    with pytest.raises(EnrollmentError):
+        course.set_capacity(0)
+    assert course.set_capacity(3) == tuple(students[1:3])
+    assert course.waitlist == (students[3],)
+    assert course.set_capacity(None) == (students[3],)
+    assert not course.is_full
+
+
+def test_joining_the_waitlist_of_a_course_with_free_seats_raises_enrollmenterror(make_student):
+    course = Course("C01", "Math", capacity=2)
+
+    with pytest.raises(EnrollmentError):
+        course.join_waitlist(make_student())
+    with pytest.raises(EnrollmentError):
+        Course("C02", "Art", capacity=-1)
+
+
+def test_restoring_a_memento_undoes_a_promotion_on_every_side(make_student):
+    course = Course("C01", "Math", capacity=1)
+    first, second = make_student(), make_student()
+    course.register(first)
+    course.register(second)
+    mementos = [(entity, entity.memento()) for entity in (course, first, second)]
+
+    course.drop(first)
+    for entity, memento in mementos:
+        entity.restore(memento)
+
+    assert course.students == (first,)
+    assert course.waitlist == (second,)
+    assert second.waitlisted_courses == (course,)
+
 
+def test_detach_all_clears_the_waitlist_instead_of_promoting(make_student):
+    course = Course("C01", "Math", capacity=1)
+    first, second = make_student(), make_student()
+    course.register(first)
+    course.register(second)
 
+    assert course.detach_all() == (first,)
+    assert course.students == () and course.waitlist == ()
+    assert second.waitlisted_courses == ()
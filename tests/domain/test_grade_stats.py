@@ -0,0 +1,97 @@
+# tests/domain/test_grade_stats.py
+
+import statistics
+
+import pytest
+
+from domain.models.course import Course
+from domain.models.student import Student
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+
+
+def expected(values):
+    return (
+        len(values),
+        statistics.fmean(values),
+        statistics.pvariance(values),
+        min(values),
+        max(values),
+    )
+
+
+def actual(summary):
+    return (summary.count, summary.mean, summary.variance, summary.minimum, summary.maximum)
+
+
+@pytest.fixture(params=["dict", "columnar"])
+def graded_course(request):
+    """Four students enrolled in C01, their grades in a dict or a ColumnarGradeStore."""
+    course = Course("C01", "Math")
+    students = [Student(f"S{i}", "Student") for i in range(4)]
+    store = ColumnarGradeStore() if request.param == "columnar" else None
+    for student in students:
+        if store is not None:
+            student.attach_grades(store.grades_for(student.id))
+        course.enroll(student)
+    return course, students
+
+
+def test_course_and_student_aggregates_follow_assign_replace_and_remove(graded_course):
+    course, students = graded_course
+    other = Course("C02", "Art")
+    other.enroll(students[0])
+    course.grade_summary    # build the running aggregates before changes
+    students[0].grade_summary
+
+    for student, value in zip(students, [6.0, 9.0, 3.0, 7.5]):
+        student.assign_grade(course, value)
+    students[0].assign_grade(other, 10.0)
+    students[2].assign_grade(course, 4.0)    # replace the minimum
+    students[1].remove_grade(course)         # remove the maximum
+
+    assert actual(course.grade_summary) == pytest.approx(expected([6.0, 4.0, 7.5]))
+    assert actual(students[0].grade_summary) == pytest.approx(expected([6.0, 10.0]))
+    assert students[0].gpa == pytest.approx(8.0)
+    assert course.average_grade == pytest.approx(17.5 / 3)
+
+
+def test_dropping_a_student_removes_their_grade_from_the_course_aggregates(graded_course):
+    course, students = graded_course
+    for student, value in zip(students, [2.0, 4.0, 6.0, 8.0]):
+        student.assign_grade(course, value)
+    assert course.grade_summary.count == 4
+
+    course.drop(students[3])
+    assert actual(course.grade_summary) == pytest.approx(expected([2.0, 4.0, 6.0]))
+
+    course.drop_all()
+    assert actual(course.grade_summary) == (0, None, None, None, None)
+    assert students[0].gpa is None
+
+
+def test_aggregates_are_recomputed_after_a_memento_restore(graded_course):
+    course, students = graded_course
+    students[0].assign_grade(course, 5.0)
+    assert course.average_grade == 5.0
+    course_memento, student_memento = course.memento(), students[0].memento()
+
+    students[0].assign_grade(course, 9.0)
+    students[1].assign_grade(course, 9.0)
+    students[1].remove_grade(course)
+    course.restore(course_memento)
+    students[0].restore(student_memento)
+
+    assert course.average_grade == 5.0
+    assert students[0].gpa == 5.0
+
+
+def test_aggregates_use_the_grade_as_stored(graded_course):
+    # 7.3 is not exact in float32: the aggregates must add and later
+    # subtract the same (stored) value.
+    course, students = graded_course
+    course.grade_summary
+    students[0].assign_grade(course, 7.3)
+    students[1].assign_grade(course, 9.0)
+    students[0].remove_grade(course)
+
+    assert actual(course.grade_summary) == (1, 9.0, 0.0, 9.0, 9.0)
@@ -1,11 +1,14 @@
 # tests/domain/test_student.py
 
+import weakref
+
 import pytest
 
 from domain.exceptions.domain_exceptions import (
     EnrollmentError,
     GradeError,
 )
+from domain.models.course import Course
 from tests.conftest import make_student, make_course
 
 
@@ -154,3 +157,84 @@ def test_removing_a_grade_from_a_course_the_student_is_not_enrolled_in_raises_gr
     # Act / Assert
     with pytest.raises(GradeError):
         student.remove_grade(course)
+
+
+# -------------------------------------------------------------------
+# Grading a different course that reuses an enrolled course's code raises
+# -------------------------------------------------------------------
+def test_assigning_a_grade_for_a_different_course_sharing_an_enrolled_course_code_raises_gradeerror(
+    make_student
+):
+    # Arrange
+    student = make_student()
+    enrolled = Course("C01", "Math")
+    other = Course("C01", "Other Math")
+    enrolled.enroll(student)
+
+    # Act / Assert
+    with pytest.raises(GradeError):
+        student.assign_grade(other, 8.0)
+    assert student.courses == (enrolled,)
+
+
+# -------------------------------------------------------------------
+# Live views follow enrollment and grade changes without copying
+# -------------------------------------------------------------------
+def test_courses_and_grades_views_reflect_later_changes(
+    make_student,
+    make_course
+):
+    # Arrange
+    student = make_student()
+    course = make_course()
+    courses_view = student.courses_view
+    grades_view = student.grades_view
+
+    # Act
+    course.enroll(student)
+    student.assign_grade(course, 6.5)
+
+    # Assert
+    assert course in courses_view
+    assert grades_view[course] == 6.5
+
+    # Act
+    course.drop(student)
+
+    # Assert
+    assert course not in courses_view
+    assert course not in grades_view
+
+
+# -------------------------------------------------------------------
+# The grades view cannot be used to bypass grade validation
+# -------------------------------------------------------------------
+def test_writing_through_the_grades_view_raises_typeerror(
+    make_student,
+    make_course
+):
+    # Arrange
+    student = make_student()
+    course = make_course()
+    course.enroll(student)
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        student.grades_view[course] = 42.0
+    assert student.get_grade(course) is None
+
+
+# -------------------------------------------------------------------
+# Students are compact (slot-based) yet weakly referenceable
+# -------------------------------------------------------------------
+def test_a_student_can_be_weakly_referenced_and_rejects_ad_hoc_attributes(make_student):
+    # Arrange
+    student = make_student()
+
+    # Act
+    ref = weakref.ref(student)
+
+    # Assert
+    assert ref() is student
+    with pytest.raises(AttributeError):
+        student.nickname = "Al"
@@ -147,3 +147,29 @@ def test_unassigning_a_teacher_from_one_course_does_not_affect_other_courses(
 
 
 
+
+# -------------------------------------------------------------------
+# The courses view follows assignment changes without copying
+# -------------------------------------------------------------------
+def test_courses_view_reflects_later_assignments_and_unassignments(
+    make_teacher,
+    make_course
+):
+    # Arrange
+    teacher = make_teacher()
+    course = make_course()
+    view = teacher.courses_view
+
+    # Act
+    course.assign_teacher(teacher)
+
+    # Assert
+    assert course in view
+    assert len(view) == 1
+
+    # Act
+    course.unassign_teacher()
+
+    # Assert
+    assert course not in view
+    assert len(view) == 0
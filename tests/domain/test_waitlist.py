@@ -0,0 +1,63 @@
+# tests/domain/test_waitlist.py
+
+from domain.models.student import Student
+from domain.models.waitlist import Waitlist
+
+
+def _students(count):
+    return [Student(f"S{i:02d}", f"Student {i}") for i in range(count)]
+
+
+def test_waitlist_serves_lowest_priority_first_and_ties_in_arrival_order():
+    a, b, c, d = _students(4)
+    waitlist = Waitlist()
+    waitlist.push(a, 5.0)
+    waitlist.push(b)
+    waitlist.push(c, 5.0)
+    waitlist.push(d, -1.0)
+
+    assert list(waitlist) == [d, b, a, c]
+    assert waitlist.peek() is d
+    assert [waitlist.pop() for _ in range(4)] == [d, b, a, c]
+    assert waitlist.pop() is None and waitlist.peek() is None
+
+
+def test_discarded_students_are_skipped_and_the_heap_is_compacted():
+    students = _students(100)
+    waitlist = Waitlist()
+    for student in students:
+        waitlist.push(student)
+
+    for student in students[:90]:
+        assert waitlist.discard(student.id) is student
+    assert waitlist.discard(students[0].id) is None
+
+    assert len(waitlist) == 10
+    assert students[0].id not in waitlist and students[95].id in waitlist
+    assert len(waitlist._heap) < 100    # stale entries were dropped
+    assert waitlist.pop() is students[90]
+
+
+def test_a_rejoining_student_goes_to_the_back_of_the_queue():
+    a, b = _students(2)
+    waitlist = Waitlist()
+    waitlist.push(a)
+    waitlist.push(b)
+    waitlist.discard(a.id)
+    waitlist.push(a)
+
+    assert [waitlist.pop(), waitlist.pop(), waitlist.pop()] == [b, a, None]
+
+
+def test_a_waitlist_rebuilt_from_its_entries_keeps_order_and_arrival_counter():
+    a, b, c = _students(3)
+    waitlist = Waitlist()
+    waitlist.push(a, 2.0)
+    waitlist.push(b, 1.0)
+
+    rebuilt = Waitlist.of(waitlist.entries())
+    rebuilt.push(c, 2.0)
+
+    assert list(rebuilt) == [b, a, c]
+    assert rebuilt.priority(a.id) == 2.0
+    assert list(waitlist) == [b, a]    # the original is untouched
@@ -0,0 +1,91 @@
+# tests/integration/test_archive_repositories.py
+
+import gc
+import weakref
+
+import pytest
+
+from application.services.student_management_system import StudentManagementSystem
+from domain.exceptions.domain_exceptions import EntityNotFoundError, ReadOnlyError
+from domain.repositories.queries import CourseQuery
+from infrastructure.archive.archive_course_repository import ArchiveCourseRepository
+from infrastructure.archive.archive_student_repository import ArchiveStudentRepository
+from infrastructure.archive.archive_teacher_repository import ArchiveTeacherRepository
+from infrastructure.archive.term_archive import TermArchive
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+
+
+@pytest.fixture
+def archive(tmp_path):
+    live = StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+    live.add_teacher("T01", "Ada")
+    for code in ("C03", "C01", "C02"):
+        live.add_course(code, f"Course {code}")
+    live.assign_teacher_to_course("T01", "C02")
+    for i in range(10):
+        live.add_student(f"S{i:02d}", "Student")
+        live.enroll_student_in_course(f"S{i:02d}", "C01")
+        live.assign_grade_to_student(f"S{i:02d}", "C01", float(i))
+    live.enroll_student_in_course("S03", "C02")
+
+    path = str(tmp_path / "2024-fall.archive")
+    TermArchive.write(path, live.student_repo, live.teacher_repo, live.course_repo)
+    with TermArchive(path) as archive:
+        yield archive
+
+
+@pytest.fixture
+def archived_sms(archive):
+    return StudentManagementSystem(
+        ArchiveStudentRepository(archive),
+        ArchiveTeacherRepository(archive),
+        ArchiveCourseRepository(archive),
+    )
+
+
+def test_archived_term_answers_queries(archived_sms):
+    assert archived_sms.get_student_grade("S07", "C01") == 7.0
+    assert [c.code for c in archived_sms.get_student("S03").courses] == ["C01", "C02"]
+    assert archived_sms.get_course("C02").teacher.name == "Ada"
+    assert archived_sms.get_course_grade_summary("C01").mean == 4.5
+    assert [c.code for c in archived_sms.find_courses(CourseQuery(min_students=2))] == ["C01"]
+
+
+def test_lookups_page_in_key_order(archived_sms):
+    page = archived_sms.list_students_page(4, after_id="S02")
+    assert [s.id for s in page.items] == ["S03", "S04", "S05", "S06"]
+    assert page.next_after == "S06"
+    assert [c.code for c in archived_sms.stream_courses(batch_size=2)] == ["C01", "C02", "C03"]
+    assert archived_sms.list_students_page(5, after_id="S04").next_after is None
+
+    with pytest.raises(EntityNotFoundError):
+        archived_sms.get_student("S99")
+    with pytest.raises(EntityNotFoundError):
+        archived_sms.get_course("C00")
+
+
+def test_entities_are_materialized_once_while_referenced(archived_sms):
+    student = archived_sms.get_student("S01")
+    assert archived_sms.get_student("S01") is student
+    assert student in archived_sms.get_course("C01").students_view
+
+    ref = weakref.ref(student)
+    del student
+    gc.collect()
+    assert ref() is None
+    assert archived_sms.get_student("S01").id == "S01"
+
+
+def test_archive_rejects_changes(archived_sms):
+    with pytest.raises(ReadOnlyError):
+        archived_sms.add_student("S50", "New")
+    with pytest.raises(ReadOnlyError):
+        archived_sms.remove_course("C03")
+    with pytest.raises(ReadOnlyError):
+        archived_sms.assign_grade_to_student("S01", "C01", 2.0)
+    with pytest.raises(ReadOnlyError):
+        archived_sms.import_students([("S60", "New")])
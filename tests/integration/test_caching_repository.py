@@ -0,0 +1,119 @@
+# tests/integration/test_caching_repository.py
+
+import pytest
+
+from domain.exceptions.domain_exceptions import EntityNotFoundError
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.repositories.queries import StudentQuery
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.repositories.caching_repository import (
+    CachingCourseRepository,
+    CachingStudentRepository,
+)
+
+
+class CountingStudentRepository(InMemoryStudentRepository):
+    """Stands in for a slow backend: counts the gets that reach it."""
+
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+
+    def get(self, student_id):
+        self.gets += 1
+        return super().get(student_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def backend():
+    repo = CountingStudentRepository()
+    for i in range(5):
+        repo.add(Student(f"S{i}", f"Student {i}"))
+    return repo
+
+
+def test_repeated_gets_are_served_from_the_cache(backend):
+    cache = CachingStudentRepository(backend, max_size=10)
+
+    assert cache.get("S1") is cache.get("S1") is backend.get("S1")
+    assert backend.gets == 2          # one miss + the direct call above
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 0, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_least_recently_used_entry_is_evicted(backend):
+    cache = CachingStudentRepository(backend, max_size=2)
+    cache.get("S0")
+    cache.get("S1")
+    cache.get("S0")                   # S1 is now the least recently used
+    cache.get("S2")
+
+    assert cache.stats().evictions == 1
+    backend.gets = 0
+    cache.get("S0")
+    cache.get("S2")
+    assert backend.gets == 0
+    cache.get("S1")
+    assert backend.gets == 1
+
+
+def test_entries_expire_after_ttl(backend):
+    clock = FakeClock()
+    cache = CachingStudentRepository(backend, ttl=30, clock=clock)
+    cache.get("S0")
+    clock.now = 29
+    cache.get("S0")
+    clock.now = 31
+    cache.get("S0")
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_add_and_remove_invalidate_and_misses_are_not_cached(backend):
+    cache = CachingStudentRepository(backend)
+    with pytest.raises(EntityNotFoundError):
+        cache.get("S9")
+    cache.add(Student("S9", "Late"))
+    assert cache.get("S9").name == "Late"
+
+    cache.remove("S9")
+    with pytest.raises(EntityNotFoundError):
+        cache.get("S9")
+    assert cache.stats().size == 0
+
+
+def test_update_refreshes_the_entry_and_listings_pass_through(backend):
+    clock = FakeClock()
+    cache = CachingStudentRepository(backend, ttl=10, clock=clock)
+    student = cache.get("S3")
+    clock.now = 8
+    student.name = "Renamed"
+    cache.update(student)
+    clock.now = 15                    # expired if update had not refreshed it
+    cache.get("S3")
+
+    assert cache.stats().misses == 1
+    assert [s.id for s in cache.find(StudentQuery(name_prefix="ren"))] == ["S3"]
+    assert cache.list_page(2).next_after == "S1"
+    assert len(cache.list_all()) == 5
+
+
+def test_courses_are_keyed_by_code():
+    cache = CachingCourseRepository(InMemoryCourseRepository(), max_size=4)
+    course = Course("C01", "Math")
+    cache.add(course)
+    assert cache.get("C01") is course
+    cache.remove("C01")
+    assert cache.stats().size == 0
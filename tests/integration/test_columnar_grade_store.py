@@ -0,0 +1,107 @@
+# tests/integration/test_columnar_grade_store.py
+
+import math
+import random
+
+import pytest
+
+from domain.models.course import Course
+from domain.models.student import Student
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+
+
+@pytest.fixture
+def store_with_students():
+    store = ColumnarGradeStore()
+    courses = [Course(f"C{i}", "Course") for i in range(3)]
+    students = []
+    for i in range(4):
+        student = Student(f"S{i}", "Student")
+        student.attach_grades(store.grades_for(student.id))
+        for course in courses:
+            course.enroll(student)
+        students.append(student)
+    return store, courses, students
+
+
+def test_student_grade_operations_work_on_top_of_the_store(store_with_students):
+    store, courses, students = store_with_students
+
+    students[0].assign_grade(courses[0], 7.5)
+    students[0].assign_grade(courses[1], 9.0)
+    students[0].assign_grade(courses[0], 8.5)     # overwrite in place
+    students[1].assign_grade(courses[0], 2.0)
+    students[0].remove_grade(courses[1])
+
+    assert students[0].get_grade(courses[0]) == 8.5
+    assert students[0].get_grade(courses[1]) is None
+    assert dict(students[0].grades_view) == {courses[0]: 8.5}
+    assert students[0].gpa == 8.5
+    assert courses[0].average_grade == pytest.approx(5.25)
+    assert len(store) == 2
+
+
+def test_grades_are_stored_as_float32(store_with_students):
+    _, courses, students = store_with_students
+    students[0].assign_grade(courses[0], 7.3)
+
+    assert students[0].get_grade(courses[0]) == pytest.approx(7.3, abs=1e-6)
+
+
+def test_store_matches_per_student_dicts_under_random_assign_and_remove(store_with_students):
+    store, courses, students = store_with_students
+    rng = random.Random(14)
+    expected = {student.id: {} for student in students}
+
+    for _ in range(500):
+        student, course = rng.choice(students), rng.choice(courses)
+        if rng.random() < 0.6:
+            value = float(rng.randint(0, 10))
+            student.assign_grade(course, value)
+            expected[student.id][course] = value
+        elif course in student.grades_view:
+            student.remove_grade(course)
+            del expected[student.id][course]
+
+    for student in students:
+        assert dict(student.grades_view) == expected[student.id]
+    assert len(store) == sum(len(grades) for grades in expected.values())
+
+
+def test_dropping_a_course_removes_the_grade_row(store_with_students):
+    store, courses, students = store_with_students
+    students[2].assign_grade(courses[1], 6.0)
+
+    courses[1].drop(students[2])
+
+    assert len(store) == 0
+    assert courses[1] not in students[2].grades_view
+
+
+def test_course_analytics(store_with_students):
+    store, courses, students = store_with_students
+    for student, value in zip(students, [2.0, 4.0, 4.0, 10.0]):
+        student.assign_grade(courses[0], value)
+    students[0].assign_grade(courses[2], 5.0)
+
+    counts, edges = store.course_histogram("C0", bins=5)
+    assert list(counts) == [0, 1, 2, 0, 1]    # [0,2) [2,4) [4,6) [6,8) [8,10]
+    assert list(edges) == pytest.approx([0.0, 2.0, 4.0, 6.0, 8.0, 10.0])
+
+    assert store.course_percentiles("C0", [0, 50, 100]) == pytest.approx([2.0, 4.0, 10.0])
+    assert store.course_percentiles("C1", [50]) == [None]
+
+    z_scores = store.course_z_scores("C0")
+    assert z_scores["S3"] == pytest.approx((10.0 - 5.0) / math.sqrt(9.0))
+    assert sum(z_scores.values()) == pytest.approx(0.0)
+
+
+def test_grade_matrix_has_nan_for_missing_grades(store_with_students):
+    store, courses, students = store_with_students
+    students[1].assign_grade(courses[2], 3.0)
+
+    student_ids, course_codes, matrix = store.grade_matrix()
+
+    row, column = student_ids.index("S1"), course_codes.index("C2")
+    assert matrix[row][column] == 3.0
+    assert sum(not math.isnan(value) for line in matrix for value in line) == 1
@@ -0,0 +1,106 @@
+# tests/integration/test_dataset_export.py
+
+import json
+import lzma
+
+import pytest
+
+from application.services.student_management_system import StudentManagementSystem
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.interchange.dataset_export import export_dataset
+from infrastructure.interchange.row_readers import read_csv
+from infrastructure.repositories.sqlite_course_repository import SqliteCourseRepository
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_student_repository import SqliteStudentRepository
+from infrastructure.repositories.sqlite_teacher_repository import SqliteTeacherRepository
+
+
+@pytest.fixture
+def populated(sms):
+    sms.import_students([("S01", "Alice"), ("S02", "Bob")])
+    sms.add_teacher("T01", "Smith")
+    sms.add_course("C01", "Math", capacity=5)
+    sms.add_course("C02", "Art")
+    sms.assign_teacher_to_course("T01", "C01")
+    sms.import_enrollments([("S01", "C01"), ("S02", "C01"), ("S02", "C02")])
+    sms.assign_grade_to_student("S02", "C01", 3.5)
+    return sms
+
+
+def _export(sms, directory, **options):
+    return export_dataset(
+        str(directory), sms.student_repo, sms.teacher_repo, sms.course_repo,
+        batch_size=1, **options,
+    )
+
+
+def test_csv_export_round_trips_through_the_bulk_import(populated, tmp_path):
+    counts = _export(populated, tmp_path, compression="gz")
+
+    assert counts == {
+        "students.csv.gz": 2, "teachers.csv.gz": 1,
+        "courses.csv.gz": 2, "enrollments.csv.gz": 3,
+    }
+    assert list(read_csv(tmp_path / "courses.csv.gz")) == [
+        ("C01", "Math", "T01", "5"), ("C02", "Art", "", ""),
+    ]
+
+    copy = StudentManagementSystem(
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+    copy.import_students(read_csv(tmp_path / "students.csv.gz"))
+    copy.import_courses(read_csv(tmp_path / "courses.csv.gz", ["course_code", "name", "capacity"]))
+    copy.import_enrollments(read_csv(tmp_path / "enrollments.csv.gz", ["student_id", "course_code"]))
+
+    assert [s.id for s in copy.get_course("C01").students] == ["S01", "S02"]
+    assert copy.get_course("C01").capacity == 5
+    assert [c.code for c in copy.get_student("S02").courses] == ["C01", "C02"]
+
+
+def test_jsonl_export_writes_grades_and_missing_values_as_json(populated, tmp_path):
+    _export(populated, tmp_path, fmt="jsonl", compression="xz")
+
+    with lzma.open(tmp_path / "enrollments.jsonl.xz", "rt", encoding="utf-8") as file:
+        rows = [json.loads(line) for line in file]
+    assert rows == [
+        {"student_id": "S01", "course_code": "C01", "grade": None},
+        {"student_id": "S02", "course_code": "C01", "grade": 3.5},
+        {"student_id": "S02", "course_code": "C02", "grade": None},
+    ]
+
+
+def test_unknown_format_or_compression_is_rejected(populated, tmp_path):
+    with pytest.raises(ValueError):
+        _export(populated, tmp_path, fmt="xml")
+    with pytest.raises(ValueError):
+        _export(populated, tmp_path, compression="zip")
+
+
+def test_exporting_a_sqlite_dataset_loads_no_entities(tmp_path):
+    # Arrange
+    database = SqliteDatabase()
+    student_repo = SqliteStudentRepository(database)
+    teacher_repo = SqliteTeacherRepository(database)
+    course_repo = SqliteCourseRepository(database)
+    sms = StudentManagementSystem(student_repo, teacher_repo, course_repo)
+    student_ids = [f"S{i:03d}" for i in range(500)]
+    sms.import_students((student_id, "Student") for student_id in student_ids)
+    sms.import_courses([("C01", "Math"), ("C02", "Art")])
+    sms.import_enrollments((student_id, "C01") for student_id in student_ids)
+    sms.import_grades(student_ids, ["C01"] * 500, [5.0] * 500)
+    database.identity_map.clear()
+    queries = []
+    database.connection.set_trace_callback(queries.append)
+
+    # Act
+    counts = export_dataset(
+        str(tmp_path), student_repo, teacher_repo, course_repo, batch_size=100, rows=database
+    )
+
+    # Assert: rows only, and one enrollment query per course (not per student)
+    assert counts["students.csv"] == counts["enrollments.csv"] == 500
+    assert len(database.identity_map) == 0
+    assert len([q for q in queries if "FROM enrollments" in q]) == 2
+    assert list(read_csv(tmp_path / "enrollments.csv"))[0] == ("S000", "C01", "5.0")
@@ -0,0 +1,107 @@
+# tests/integration/test_event_journal.py
+
+import time
+
+import pytest
+
+from domain.events.domain_events import (
+    CourseAdded,
+    Enrolled,
+    GradeAssigned,
+    GradeRemoved,
+    StudentAdded,
+    TeacherUnassigned,
+)
+from infrastructure.journal.binary_event_journal import BinaryEventJournal, MAGIC
+from infrastructure.journal.event_codec import decode, encode
+
+EVENTS = [
+    StudentAdded("S01", "Zoë Ågren"),
+    CourseAdded("C01", "Math"),
+    Enrolled("S01", "C01"),
+    GradeAssigned("S01", "C01", 7.25),
+    GradeRemoved("S01", "C01"),
+    TeacherUnassigned("C01"),
+]
+
+
+@pytest.mark.parametrize("event", EVENTS)
+def test_codec_roundtrips_every_field(event):
+    body = encode(event)
+    assert decode(body, 0, len(body)) == event
+
+
+def test_journal_replays_appended_events_across_reopen(tmp_path):
+    path = str(tmp_path / "events.journal")
+    with BinaryEventJournal(path) as journal:
+        journal.append(EVENTS[:2])
+        journal.append(EVENTS[2:])
+        assert list(journal.replay()) == EVENTS
+
+    with BinaryEventJournal(path) as journal:
+        journal.append([StudentAdded("S02", "Bob")])
+        assert list(journal.replay()) == EVENTS + [StudentAdded("S02", "Bob")]
+
+
+def test_torn_tail_is_truncated_on_open(tmp_path):
+    path = tmp_path / "events.journal"
+    with BinaryEventJournal(str(path)) as journal:
+        journal.append(EVENTS)
+    intact = path.stat().st_size
+
+    # Simulate a crash halfway through writing the next record.
+    with open(path, "ab") as file:
+        file.write(b"\x20\x00\x00\x00\xde\xad")
+
+    with BinaryEventJournal(str(path)) as journal:
+        assert list(journal.replay()) == EVENTS
+    assert path.stat().st_size == intact
+
+
+def test_corrupt_record_ends_the_journal(tmp_path):
+    path = tmp_path / "events.journal"
+    with BinaryEventJournal(str(path)) as journal:
+        journal.append(EVENTS)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF                        # flip a bit in the last body
+    path.write_bytes(bytes(data))
+
+    with BinaryEventJournal(str(path)) as journal:
+        assert list(journal.replay()) == EVENTS[:-1]
+
+
+def test_group_commit_defers_fsync_until_batch_is_full(tmp_path, monkeypatch):
+    journal = BinaryEventJournal(str(tmp_path / "events.journal"), sync_every=3, sync_interval=60)
+    syncs = []
+    monkeypatch.setattr(journal, "_fsync", lambda: syncs.append(journal._pending))
+
+    journal.append(EVENTS[:1])
+    journal.append(EVENTS[1:2])
+    assert syncs == []
+    journal.append(EVENTS[2:3])
+    assert syncs == [3]
+
+    journal.append(EVENTS[3:4])
+    journal.close()
+    assert syncs == [3, 1]
+
+
+def test_a_pending_append_is_written_by_its_deadline_without_further_appends(tmp_path):
+    path = tmp_path / "events.journal"
+    journal = BinaryEventJournal(str(path), sync_every=100, sync_interval=0.05)
+    journal.append(EVENTS[:1])
+
+    time.sleep(0.3)
+
+    # Read through a second handle: the first one's buffer must be on disk.
+    data = path.read_bytes()
+    assert decode(data, len(MAGIC) + 8, len(data)) == EVENTS[0]
+    journal.close()
+
+
+def test_rejects_files_that_are_not_journals(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a journal")
+    with pytest.raises(ValueError):
+        BinaryEventJournal(str(path))
+    assert MAGIC not in path.read_bytes()
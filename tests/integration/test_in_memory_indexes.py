@@ -0,0 +1,108 @@
+# tests/integration/test_in_memory_indexes.py
+
+import random
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from domain.repositories.queries import CourseQuery, StudentQuery
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.prefix_index import PrefixIndex
+
+
+def scan(repo, query):
+    return tuple(entity for entity in repo.stream() if query.matches(entity))
+
+
+def test_indexed_course_queries_agree_with_a_full_scan_under_random_churn():
+    rng = random.Random(11)
+    repo = InMemoryCourseRepository()
+    teachers = [Teacher(f"T{i}", "Teacher") for i in range(3)]
+    students = [Student(f"S{i:02d}", "Student") for i in range(12)]
+
+    for step in range(400):
+        code = f"C{rng.randrange(15):02d}"
+        action = rng.random()
+        if code not in {c.code for c in repo.list_all()}:
+            repo.add(Course(code, rng.choice(["Art", "Arch", "Bio"])))
+            continue
+        course = repo.get(code)
+        if action < 0.1:
+            # Clean up relationships first, as the service does.
+            if course.teacher is not None:
+                course.unassign_teacher()
+            for student in course.students:
+                course.drop(student)
+            repo.remove(code)
+        elif action < 0.5:
+            student = rng.choice(students)
+            if student in course.students_view:
+                course.drop(student)
+            else:
+                course.enroll(student)
+            repo.update(course)
+        else:
+            if course.teacher is None:
+                course.assign_teacher(rng.choice(teachers))
+            else:
+                course.unassign_teacher()
+            repo.update(course)
+
+    queries = [
+        CourseQuery(),
+        CourseQuery(name_prefix="ar"),
+        CourseQuery(has_teacher=False),
+        CourseQuery(has_teacher=True, min_students=2),
+        CourseQuery(teacher_id="T1", max_students=3),
+        CourseQuery(name_prefix="Bio", min_students=1, max_students=4),
+    ]
+    for query in queries:
+        assert repo.find(query) == scan(repo, query)
+
+
+def test_student_prefix_index_follows_renames_reported_through_update():
+    repo = InMemoryStudentRepository()
+    student = Student("S01", "Alice")
+    repo.add(student)
+
+    student.name = "Bob"
+    repo.update(student)
+
+    assert repo.find(StudentQuery(name_prefix="Al")) == ()
+    assert repo.find(StudentQuery(name_prefix="b")) == (student,)
+
+
+def test_prefix_index_prunes_branches_when_names_are_discarded():
+    index = PrefixIndex()
+    index.add("Anna", "S01")
+    index.add("Ann", "S02")
+
+    index.discard("Anna", "S01")
+    index.discard("Ann", "S02")
+
+    assert index.keys_with_prefix("") == set()
+    assert index._root.children == {}
+
+
+def test_course_indexes_follow_changes_made_through_the_domain_without_update():
+    repo = InMemoryCourseRepository()
+    course = Course("C01", "Math", capacity=1)
+    repo.add(course)
+    first, second = Student("S01", "Alice"), Student("S02", "Bob")
+
+    course.enroll(first)
+    course.join_waitlist(second)
+    course.assign_teacher(Teacher("T1", "Teacher"))
+
+    assert repo.find(CourseQuery(min_students=1)) == (course,)
+    assert repo.find(CourseQuery(teacher_id="T1")) == (course,)
+
+    course.drop(first)    # the seat goes to the waitlisted student
+    course.unassign_teacher()
+    assert repo.find(CourseQuery(min_students=1)) == (course,)
+    assert repo.find(CourseQuery(has_teacher=False)) == (course,)
+
+    repo.remove("C01")
+    course.drop(second)    # no longer stored, so no longer indexed
+    assert repo.find(CourseQuery()) == ()
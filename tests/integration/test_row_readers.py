@@ -0,0 +1,31 @@
+# tests/integration/test_row_readers.py
+
+import gzip
+import io
+
+import pytest
+
+from infrastructure.interchange.row_readers import read_csv, read_jsonl
+
+
+def test_read_csv_selects_header_columns_in_the_given_order(tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text("name,id,year\nAlice,S01,1\n\nBob,S02,2\n", encoding="utf-8")
+
+    assert list(read_csv(path, ["id", "name"])) == [("S01", "Alice"), ("S02", "Bob")]
+    assert list(read_csv(path, header=False))[0] == ("name", "id", "year")
+    with pytest.raises(ValueError):
+        list(read_csv(path, ["id", "email"]))
+
+
+def test_read_jsonl_reads_compressed_files_and_names_a_bad_line(tmp_path):
+    path = tmp_path / "enrollments.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write('{"student_id": "S01", "course_code": "C01"}\n\n')
+        file.write('{"student_id": "S02", "course_code": "C01"}\n')
+
+    assert list(read_jsonl(path, ["student_id", "course_code"])) == [
+        ("S01", "C01"), ("S02", "C01"),
+    ]
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_jsonl(io.StringIO('{"id": "S01"}\n{"name": "x"}\n'), ["id"]))
@@ -0,0 +1,120 @@
+# tests/integration/test_snapshot_store.py
+
+import pytest
+
+from domain.models.course import Course
+from domain.models.student import Student
+from domain.models.teacher import Teacher
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.journal.binary_snapshot_store import BinarySnapshotStore
+from infrastructure.repositories.lazy_mapping import LazyMapping
+
+
+@pytest.fixture
+def repos():
+    students, teachers, courses = (
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+    ada, grace = Teacher("T01", "Ada"), Teacher("T02", "Grace")
+    math, physics, art = Course("C01", "Math"), Course("C02", "Physics"), Course("C03", "Art")
+    alice, bob, zoe = Student("S01", "Alice"), Student("S02", "Bob"), Student("S03", "Zoë")
+    math.assign_teacher(ada)
+    art.assign_teacher(ada)
+    physics.assign_teacher(grace)
+    physics.enroll(bob)
+    math.enroll(bob)
+    math.enroll(alice)
+    art.enroll(zoe)
+    bob.assign_grade(physics, 6.5)
+    bob.assign_grade(math, 9.25)
+    art.set_capacity(1)
+    art.register(bob, priority=2.0)
+    art.register(alice, priority=1.0)
+    for teacher in (ada, grace):
+        teachers.add(teacher)
+    for course in (math, physics, art):
+        courses.add(course)
+    for student in (alice, bob, zoe):
+        students.add(student)
+    return students, teachers, courses
+
+
+def _state(students, teachers, courses):
+    return (
+        [(s.id, s.name, [c.code for c in s.courses], [(c.code, g) for c, g in s.grades_view.items()],
+          [c.code for c in s.waitlisted_courses])
+         for s in students.list_all()],
+        [(t.id, t.name, [c.code for c in t.courses]) for t in teachers.list_all()],
+        [(c.code, c.name, c.teacher and c.teacher.id, [s.id for s in c.students],
+          c.capacity, [(s.id, p) for s, p, _ in c.waitlist_entries])
+         for c in courses.list_all()],
+    )
+
+
+def test_snapshot_roundtrips_entities_and_relationship_order(repos, tmp_path):
+    store = BinarySnapshotStore(str(tmp_path / "state.snapshot"))
+    store.save(*repos, journal_position=1234)
+
+    loaded = InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    assert store.load(*loaded) == 1234
+    assert _state(*loaded) == _state(*repos)
+
+
+def test_relationships_are_decoded_on_first_use(repos, tmp_path):
+    store = BinarySnapshotStore(str(tmp_path / "state.snapshot"))
+    store.save(*repos, journal_position=0)
+    students, teachers, courses = (
+        InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    )
+    store.load(students, teachers, courses)
+
+    math = courses.get("C01")
+    assert isinstance(math._students, LazyMapping) and not math._students.is_loaded
+    # Sizes come from the records, so the course indexes did not load rosters.
+    assert len(math.students_view) == 2 and not math._students.is_loaded
+    assert math.teacher is teachers.get("T01")
+
+    bob = students.get("S02")
+    assert bob.get_grade(math) == 9.25
+    assert bob._grades.is_loaded and not bob._courses.is_loaded
+
+    # The loaded graph keeps working through the domain model.
+    math.drop(bob)
+    assert bob.courses == (courses.get("C02"),)
+    assert [s.id for s in math.students] == ["S01"]
+
+
+def test_snapshot_loads_into_a_columnar_grade_store(repos, tmp_path):
+    store = BinarySnapshotStore(str(tmp_path / "state.snapshot"))
+    store.save(*repos, journal_position=0)
+    grade_store = ColumnarGradeStore()
+    students = InMemoryStudentRepository(grade_store)
+    courses = InMemoryCourseRepository()
+    store.load(students, InMemoryTeacherRepository(), courses)
+
+    assert len(grade_store) == 2
+    assert students.get("S02").get_grade(courses.get("C02")) == 6.5
+
+
+def test_missing_snapshot_loads_nothing(tmp_path):
+    store = BinarySnapshotStore(str(tmp_path / "absent.snapshot"))
+    students = InMemoryStudentRepository()
+    assert store.load(students, InMemoryTeacherRepository(), InMemoryCourseRepository()) is None
+    assert students.list_all() == ()
+
+
+def test_saving_replaces_the_previous_snapshot(repos, tmp_path):
+    store = BinarySnapshotStore(str(tmp_path / "state.snapshot"))
+    store.save(*repos, journal_position=1)
+    students, _, courses = repos
+    courses.get("C03").drop(students.get("S03"))
+    students.remove("S03")
+    store.save(*repos, journal_position=2)
+
+    loaded = InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    assert store.load(*loaded) == 2
+    assert [s.id for s in loaded[0].list_all()] == ["S01", "S02"]
+    assert list(tmp_path.iterdir()) == [tmp_path / "state.snapshot"]
@@ -0,0 +1,358 @@
+# tests/integration/test_sqlite_repositories.py
+
+import sqlite3
+
+import pytest
+
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EnrollmentError,
+    EntityNotFoundError,
+)
+from domain.models.course import Course
+from domain.models.student import Student
+from infrastructure.repositories.sqlite_database import SqliteDatabase
+from infrastructure.repositories.sqlite_student_repository import SqliteStudentRepository
+from infrastructure.repositories.sqlite_teacher_repository import SqliteTeacherRepository
+from infrastructure.repositories.sqlite_course_repository import SqliteCourseRepository
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "sms.sqlite3")
+
+
+def _repositories(database):
+    return (
+        SqliteStudentRepository(database),
+        SqliteTeacherRepository(database),
+        SqliteCourseRepository(database),
+    )
+
+
+# -------------------------------------------------------------------
+# Relationships and grades survive closing and reopening the database
+# -------------------------------------------------------------------
+def test_reopening_the_database_restores_enrollments_assignments_and_grades(
+    db_path,
+    make_student,
+    make_teacher,
+    make_course
+):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        students, teachers, courses = _repositories(database)
+        alice, bob = make_student("Alice"), make_student("Bob")
+        teacher = make_teacher("Dr. Smith")
+        math, physics = make_course("Math"), make_course("Physics")
+        for entity, repo in [(alice, students), (bob, students), (teacher, teachers),
+                             (math, courses), (physics, courses)]:
+            repo.add(entity)
+
+        math.assign_teacher(teacher)
+        math.enroll(bob)
+        math.enroll(alice)
+        physics.enroll(alice)
+        courses.update(math)
+        courses.update(physics)
+        alice.assign_grade(math, 8.5)
+        students.update(alice)
+
+    # Act
+    with SqliteDatabase(db_path) as database:
+        students, teachers, courses = _repositories(database)
+        math = courses.get(math.code)
+        alice = students.get(alice.id)
+
+        # Assert
+        assert [s.name for s in math.students] == ["Bob", "Alice"]
+        assert [c.name for c in alice.courses] == ["Math", "Physics"]
+        assert alice.get_grade(math) == 8.5
+        assert math.teacher is teachers.get(teacher.id)
+        assert math in math.teacher.courses
+
+
+def test_reopening_the_database_restores_capacity_and_waitlist_order(db_path, make_student):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        course = Course("C01", "Math", capacity=1)
+        courses.add(course)
+        first, second, third = make_student("A"), make_student("B"), make_student("C")
+        for student, priority in ((first, 0.0), (second, 5.0), (third, 1.0)):
+            students.add(student)
+            course.register(student, priority)
+        courses.update(course)
+
+    # Act
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        course = courses.get("C01")
+
+        # Assert
+        assert course.capacity == 1
+        assert [s.name for s in course.waitlist] == ["C", "B"]
+        assert students.get(second.id).waitlisted_courses == (course,)
+        assert course.drop(students.get(first.id)).name == "C"
+        courses.update(course)
+        database.identity_map.clear()
+        assert [s.name for s in courses.get("C01").students] == ["C"]
+        assert [s.name for s in courses.get("C01").waitlist] == ["B"]
+
+
+def test_opening_a_database_from_before_capacities_adds_the_column(db_path):
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("CREATE TABLE courses (code TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                           "teacher_id TEXT)")
+        connection.execute("INSERT INTO courses VALUES ('C01', 'Math', NULL)")
+    connection.close()
+
+    with SqliteDatabase(db_path) as database:
+        _, _, courses = _repositories(database)
+        course = courses.get("C01")
+        assert course.capacity is None
+        course.set_capacity(30)
+        courses.update(course)
+        database.identity_map.clear()
+        assert courses.get("C01").capacity == 30
+
+
+# -------------------------------------------------------------------
+# Each row is materialized once (identity map)
+# -------------------------------------------------------------------
+def test_repositories_sharing_a_database_return_the_same_object_for_the_same_row(
+    db_path,
+    make_student,
+    make_course
+):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        student, course = make_student(), make_course()
+        students.add(student)
+        courses.add(course)
+        course.enroll(student)
+        courses.update(course)
+
+    # Act
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        reloaded = students.get(student.id)
+
+        # Assert
+        assert reloaded is students.get(student.id)
+        assert courses.get(course.code).students == (reloaded,)
+
+
+# -------------------------------------------------------------------
+# Dropping a student deletes the persisted grade with the enrollment
+# -------------------------------------------------------------------
+def test_dropping_a_student_removes_the_persisted_enrollment_and_grade(
+    db_path,
+    make_student,
+    make_course
+):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        student, course = make_student(), make_course()
+        students.add(student)
+        courses.add(course)
+        course.enroll(student)
+        courses.update(course)
+        student.assign_grade(course, 6.0)
+        students.update(student)
+
+        # Act
+        course.drop(student)
+        courses.update(course)
+
+        # Assert
+        conn = database.connection
+        assert conn.execute("SELECT COUNT(*) FROM enrollments").fetchone() == (0,)
+        assert conn.execute("SELECT COUNT(*) FROM grades").fetchone() == (0,)
+
+
+# -------------------------------------------------------------------
+# Duplicate and missing ids raise domain errors
+# -------------------------------------------------------------------
+def test_adding_a_student_with_an_existing_id_raises_duplicateentityerror(
+    db_path,
+    make_student
+):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        students, _, _ = _repositories(database)
+        student = make_student()
+        students.add(student)
+
+        # Act / Assert
+        with pytest.raises(DuplicateEntityError):
+            students.add(student)
+
+
+def test_getting_updating_or_removing_an_unknown_course_raises_entitynotfounderror(
+    db_path,
+    make_course
+):
+    # Arrange
+    with SqliteDatabase(db_path) as database:
+        _, _, courses = _repositories(database)
+
+        # Act / Assert
+        with pytest.raises(EntityNotFoundError):
+            courses.get("C99")
+        with pytest.raises(EntityNotFoundError):
+            courses.update(make_course())
+        with pytest.raises(EntityNotFoundError):
+            courses.remove("C99")
+
+
+def test_a_file_database_runs_in_wal_mode(db_path):
+    with SqliteDatabase(db_path) as database:
+        assert database.connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+# -------------------------------------------------------------------
+# Relationship collections are loaded lazily, one query each
+# -------------------------------------------------------------------
+def _seed_two_courses_sharing_a_student(db_path):
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        alice, bob = Student("S01", "Alice"), Student("S02", "Bob")
+        math, physics = Course("C01", "Math"), Course("C02", "Physics")
+        for student in (alice, bob):
+            students.add(student)
+        for course in (math, physics):
+            courses.add(course)
+        math.enroll(alice)
+        math.enroll(bob)
+        physics.enroll(alice)
+        courses.update(math)
+        courses.update(physics)
+
+
+def test_getting_a_course_reads_only_its_row_until_the_roster_is_used(db_path):
+    # Arrange
+    _seed_two_courses_sharing_a_student(db_path)
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        queries = []
+        database.connection.set_trace_callback(queries.append)
+
+        # Act
+        math = courses.get("C01")
+
+        # Assert
+        assert len(queries) == 1
+        assert len(database.identity_map) == 1
+
+        # Act: first roster access runs exactly one more query
+        roster = math.students
+
+        # Assert
+        assert [s.id for s in roster] == ["S01", "S02"]
+        assert len(queries) == 2
+        assert database.identity_map.get(Course, "C02") is None    # not loaded yet
+
+
+def test_an_entity_reached_through_several_relationships_is_loaded_once(db_path):
+    # Arrange
+    _seed_two_courses_sharing_a_student(db_path)
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+
+        # Act
+        alice_via_math = courses.get("C01").students[0]
+        alice_via_physics = courses.get("C02").students[0]
+
+        # Assert
+        assert alice_via_math is alice_via_physics is students.get("S01")
+        assert [c.code for c in alice_via_math.courses] == ["C01", "C02"]
+        assert alice_via_math.courses[1] is courses.get("C02")
+
+
+def test_clearing_the_identity_map_starts_a_new_session(db_path):
+    # Arrange
+    _seed_two_courses_sharing_a_student(db_path)
+    with SqliteDatabase(db_path) as database:
+        students, _, _ = _repositories(database)
+        first = students.get("S01")
+
+        # Act
+        database.identity_map.clear()
+
+        # Assert
+        assert students.get("S01") is not first
+        assert students.get("S01") is students.get("S01")
+
+
+# -------------------------------------------------------------------
+# Updates write only what changed since the last write
+# -------------------------------------------------------------------
+def test_updating_writes_only_the_changed_enrollments_and_grades(db_path):
+    # Arrange
+    _seed_two_courses_sharing_a_student(db_path)
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        math, physics = courses.get("C01"), courses.get("C02")
+        alice = students.get("S01")
+        alice.assign_grade(math, 6.0)
+        alice.assign_grade(physics, 7.0)
+        students.update(alice)
+        carol = Student("S03", "Carol")
+        students.add(carol)
+        queries = []
+        database.connection.set_trace_callback(queries.append)
+
+        # Act
+        math.drop(students.get("S02"))
+        math.enroll(carol)
+        courses.update(math)
+        alice.assign_grade(math, 9.0)
+        alice.remove_grade(physics)
+        students.update(alice)
+
+        # Assert: neither collection was read, one statement per change
+        assert not database.tracked_roster(math).is_loaded
+        assert not database.tracked_grades(alice).is_loaded
+        writes = [q for q in queries if q.startswith(("INSERT", "DELETE"))]
+        # dict.fromkeys: SQLite traces the cascade to grades as a repeat of its DELETE.
+        assert list(dict.fromkeys(writes)) == [
+            "DELETE FROM enrollments WHERE course_code = 'C01' AND student_id = 'S02'",
+            "INSERT OR IGNORE INTO enrollments (course_code, student_id) VALUES ('C01', 'S03')",
+            "DELETE FROM grades WHERE student_id = 'S01' AND course_code = 'C02'",
+            "INSERT INTO grades (student_id, course_code, value) VALUES ('S01', 'C01', 9.0) "
+            "ON CONFLICT (student_id, course_code) DO UPDATE SET value = excluded.value",
+        ]
+
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        math = courses.get("C01")
+        alice = students.get("S01")
+        assert [s.id for s in math.students] == ["S01", "S03"]
+        assert dict(alice.grades_view) == {math: 9.0}
+
+
+def test_enrolling_into_a_stored_course_leaves_its_roster_unloaded(db_path):
+    # Arrange
+    _seed_two_courses_sharing_a_student(db_path)
+    with SqliteDatabase(db_path) as database:
+        students, _, courses = _repositories(database)
+        carol = Student("S03", "Carol")
+        students.add(carol)
+        math = courses.get("C01")
+
+        # Act
+        math.enroll(carol)
+        courses.update(math)
+
+        # Assert
+        assert not database.tracked_roster(math).is_loaded
+        with pytest.raises(EnrollmentError):
+            math.enroll(students.get("S01"))    # already enrolled: a point query says so
+        assert not database.tracked_roster(math).is_loaded
+
+    with SqliteDatabase(db_path) as database:
+        _, _, courses = _repositories(database)
+        assert [s.id for s in courses.get("C01").students] == ["S01", "S02", "S03"]
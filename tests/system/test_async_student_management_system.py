@@ -0,0 +1,153 @@
+# tests/system/test_async_student_management_system.py
+
+import asyncio
+
+import pytest
+
+from application.services.async_student_management_system import AsyncStudentManagementSystem
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EnrollmentError,
+    EntityNotFoundError,
+)
+from domain.repositories.queries import CourseQuery
+from infrastructure.in_memory.async_adapters import (
+    AsyncCourseRepositoryAdapter,
+    AsyncStudentRepositoryAdapter,
+    AsyncTeacherRepositoryAdapter,
+    AsyncUnitOfWorkAdapter,
+)
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.in_memory.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+class SlowStudentRepository(AsyncStudentRepositoryAdapter):
+    """Simulates out-of-process storage and records overlapping lookups."""
+
+    def __init__(self, repository):
+        super().__init__(repository)
+        self.in_flight = self.max_in_flight = 0
+
+    async def get(self, key):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().get(key)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def async_sms():
+    return AsyncStudentManagementSystem(
+        student_repo=SlowStudentRepository(InMemoryStudentRepository()),
+        teacher_repo=AsyncTeacherRepositoryAdapter(InMemoryTeacherRepository()),
+        course_repo=AsyncCourseRepositoryAdapter(InMemoryCourseRepository()),
+        unit_of_work=AsyncUnitOfWorkAdapter(InMemoryUnitOfWork()),
+    )
+
+
+def test_async_use_cases_mirror_the_synchronous_service(async_sms):
+    async def scenario():
+        await async_sms.add_student("S01", "Alice")
+        await async_sms.add_teacher("T01", "Ada")
+        await async_sms.add_course("C01", "Math")
+        await async_sms.assign_teacher_to_course("T01", "C01")
+        await async_sms.enroll_student_in_course("S01", "C01")
+        await async_sms.assign_grade_to_student("S01", "C01", 9.0)
+
+        assert await async_sms.get_student_grade("S01", "C01") == 9.0
+        assert await async_sms.get_student_gpa("S01") == 9.0
+        assert (await async_sms.find_courses(CourseQuery(teacher_id="T01")))[0].code == "C01"
+        with pytest.raises(EnrollmentError):
+            await async_sms.enroll_student_in_course("S01", "C01")
+
+        await async_sms.remove_teacher("T01")
+        await async_sms.remove_course("C01")
+        student = await async_sms.get_student("S01")
+        assert student.courses == () and student.grades == {}
+        assert [s.id async for s in async_sms.stream_students(batch_size=1)] == ["S01"]
+
+    asyncio.run(scenario())
+
+
+def test_bulk_enrollment_looks_up_distinct_students_concurrently(async_sms):
+    async def scenario():
+        await async_sms.add_course("C01", "Math")
+        for i in range(5):
+            await async_sms.add_student(f"S{i}", "Student")
+
+        report = await async_sms.enroll_students_in_courses(
+            [(f"S{i}", "C01") for i in range(5)] + [("S9", "C01"), ("S0", "C01")]
+        )
+
+        assert report.success_count == 5
+        assert [type(r.error) for r in report.failed] == [EntityNotFoundError, EnrollmentError]
+        assert async_sms.student_repo.max_in_flight == 6
+
+    asyncio.run(scenario())
+
+
+def test_async_transaction_rolls_back_and_is_scoped_to_the_task(async_sms):
+    async def failing_block():
+        async with async_sms.transaction():
+            await async_sms.add_student("S02", "Bob")
+            await async_sms.enroll_student_in_course("S01", "C01")
+            await asyncio.sleep(0.02)    # let the other task run meanwhile
+            raise RuntimeError("abort")
+
+    async def independent_task():
+        await asyncio.sleep(0.005)
+        await async_sms.add_course("C02", "Art")    # not part of the failing block
+
+    async def scenario():
+        await async_sms.add_student("S01", "Alice")
+        await async_sms.add_course("C01", "Math")
+        results = await asyncio.gather(failing_block(), independent_task(), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert sorted(s.id for s in await async_sms.list_students()) == ["S01"]
+        assert (await async_sms.get_course("C01")).students == ()
+        assert (await async_sms.get_course("C02")).name == "Art"
+
+    asyncio.run(scenario())
+
+
+def test_async_bulk_imports_and_waitlist_batches_mirror_the_synchronous_service(async_sms):
+    async def scenario():
+        assert await async_sms.import_students([("S01", "Alice"), ("S02", "Bob"), ("S03", "Cy")]) == 3
+        assert await async_sms.import_teachers([("T01", "Ada")]) == 1
+        assert await async_sms.import_courses([("C01", "Math", "1"), ("C02", "Art", "")]) == 2
+        assert await async_sms.import_enrollments([("S01", "C01"), ("S01", "C02")]) == 2
+
+        report = await async_sms.register_students_in_courses(
+            [("S02", "C01", 1.0), ("S03", "C01", 0.0), ("S02", "C02", 0.0), ("S09", "C02", 0.0)]
+        )
+        assert [r.waitlisted for r in report.succeeded] == [True, True, False]
+        assert [type(r.error) for r in report.failed] == [EntityNotFoundError]
+        assert [s.id for s in (await async_sms.get_course("C01")).waitlist] == ["S03", "S02"]
+
+        assert await async_sms.clear_waitlists(["C01", "C02"]) == 2
+        assert (await async_sms.get_course("C01")).waitlist == ()
+
+        grades = await async_sms.import_grades(["S01", "S02", "S03"], ["C01", "C01", "C01"],
+                                               [8.0, 7.0, 11.0])
+        assert grades.accepted_count == 1 and grades.rejected_rows == [1, 2]
+
+    asyncio.run(scenario())
+
+
+def test_async_imports_are_all_or_nothing(async_sms):
+    async def scenario():
+        await async_sms.add_student("S02", "Bob")
+        with pytest.raises(DuplicateEntityError):
+            await async_sms.import_students([("S01", "Alice"), ("S02", "Bob")])
+        with pytest.raises(EntityNotFoundError):
+            await async_sms.import_enrollments([("S02", "C09")])
+
+        assert [s.id for s in await async_sms.list_students()] == ["S02"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+# tests/system/test_bulk_import.py
+
+import pytest
+
+from domain.exceptions.domain_exceptions import (
+    DuplicateEntityError,
+    EnrollmentError,
+    EntityNotFoundError,
+)
+
+
+@pytest.fixture
+def imported(sms):
+    sms.import_students([("S01", "Alice"), ("S02", "Bob"), ("S03", "Cara")])
+    sms.import_courses([("C01", "Math"), ("C02", "Art", "2"), ("C03", "Music", "")])
+    return sms
+
+
+def test_imported_entities_are_stored_and_listed_in_order(imported):
+    imported.import_teachers([("T01", "Smith")])
+
+    assert [s.id for s in imported.list_students()] == ["S01", "S02", "S03"]
+    assert imported.get_teacher("T01").name == "Smith"
+    assert imported.get_course("C02").capacity == 2
+    assert imported.get_course("C03").capacity is None
+
+
+def test_duplicate_rows_are_rejected_and_nothing_is_added(imported):
+    with pytest.raises(DuplicateEntityError):
+        imported.import_students([("S04", "Dan"), ("S04", "Dan again")])
+    with pytest.raises(DuplicateEntityError):
+        imported.import_students([("S05", "Eve"), ("S01", "Alice")])
+
+    assert [s.id for s in imported.list_students()] == ["S01", "S02", "S03"]
+
+
+def test_enrollments_are_grouped_by_course_on_both_sides(imported):
+    count = imported.import_enrollments([
+        ("S01", "C01"), ("S02", "C02"), ("S01", "C02"), ("S03", "C01"),
+    ])
+
+    assert count == 4
+    assert [s.id for s in imported.get_course("C01").students] == ["S01", "S03"]
+    assert [s.id for s in imported.get_course("C02").students] == ["S02", "S01"]
+    assert [c.code for c in imported.get_student("S01").courses] == ["C01", "C02"]
+
+
+def test_an_unknown_id_enrolls_nothing(imported):
+    with pytest.raises(EntityNotFoundError):
+        imported.import_enrollments([("S01", "C01"), ("S99", "C02")])
+
+    assert imported.get_course("C01").students == ()
+
+
+@pytest.mark.parametrize("pairs", [
+    [("S01", "C01"), ("S01", "C01")],                   # repeated in the batch
+    [("S01", "C02"), ("S02", "C02"), ("S03", "C02")],   # over capacity
+])
+def test_a_rule_violation_inside_a_transaction_enrolls_nothing(imported, pairs):
+    imported.import_enrollments([("S02", "C03")])
+    with pytest.raises(EnrollmentError):
+        with imported.transaction():
+            imported.import_enrollments([("S01", "C03")] + pairs)
+
+    assert [s.id for s in imported.get_course("C03").students] == ["S02"]
+    assert [c.code for c in imported.get_student("S01").courses] == []
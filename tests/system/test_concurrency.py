@@ -0,0 +1,264 @@
+# tests/system/test_concurrency.py
+
+import random
+import sys
+import threading
+
+import pytest
+
+from application.services.student_management_system import StudentManagementSystem
+from domain.events.domain_events import Enrolled, StudentAdded
+from domain.exceptions.domain_exceptions import DomainError, EntityNotFoundError
+from domain.repositories.queries import CourseQuery
+from infrastructure.in_memory.columnar_grade_store import ColumnarGradeStore
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+
+STUDENTS = [f"S{i:02d}" for i in range(30)]
+COURSES = [f"C{i:02d}" for i in range(8)]
+TEACHERS = [f"T{i}" for i in range(4)]
+
+
+@pytest.fixture(params=["dict_grades", "columnar_grades"])
+def shared_sms(request):
+    grade_store = ColumnarGradeStore() if request.param == "columnar_grades" else None
+    sms = StudentManagementSystem(
+        student_repo=InMemoryStudentRepository(grade_store),
+        teacher_repo=InMemoryTeacherRepository(),
+        course_repo=InMemoryCourseRepository(),
+        thread_safe=True,
+    )
+    for student_id in STUDENTS:
+        sms.add_student(student_id, "Student")
+    for teacher_id in TEACHERS:
+        sms.add_teacher(teacher_id, "Teacher")
+    for code in COURSES:
+        sms.add_course(code, "Course")
+    return sms
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def random_operations(sms, seed, count):
+    rng = random.Random(seed)
+    operations = [
+        lambda: sms.enroll_student_in_course(rng.choice(STUDENTS), rng.choice(COURSES)),
+        lambda: sms.drop_student_from_course(rng.choice(STUDENTS), rng.choice(COURSES)),
+        lambda: sms.assign_grade_to_student(
+            rng.choice(STUDENTS), rng.choice(COURSES), float(rng.randint(0, 10))
+        ),
+        lambda: sms.remove_grade_from_student(rng.choice(STUDENTS), rng.choice(COURSES)),
+        lambda: sms.assign_teacher_to_course(rng.choice(TEACHERS), rng.choice(COURSES)),
+        lambda: sms.unassign_teacher_from_course(rng.choice(COURSES)),
+        lambda: sms.remove_course(rng.choice(COURSES)),
+        lambda: sms.add_course(rng.choice(COURSES), "Course"),
+        lambda: sms.remove_student(rng.choice(STUDENTS)),
+        lambda: sms.add_student(rng.choice(STUDENTS), "Student"),
+        lambda: sms.remove_teacher(rng.choice(TEACHERS)),
+        lambda: sms.add_teacher(rng.choice(TEACHERS), "Teacher"),
+        lambda: sms.register_student_in_course(
+            rng.choice(STUDENTS), rng.choice(COURSES), float(rng.randint(0, 3))
+        ),
+        lambda: sms.leave_waitlist(rng.choice(STUDENTS), rng.choice(COURSES)),
+        lambda: sms.set_course_capacity(rng.choice(COURSES), rng.choice([None, 2, 4, 6])),
+    ]
+    weights = [30, 10, 20, 5, 5, 5, 2, 4, 2, 4, 1, 2, 15, 3, 3]
+    for operation in rng.choices(operations, weights, k=count):
+        try:
+            operation()
+        except DomainError:
+            pass    # expected rule violations (duplicates, not enrolled, ...)
+
+
+def assert_bidirectional_invariants(sms):
+    students = {s.id: s for s in sms.list_students()}
+    teachers = {t.id: t for t in sms.list_teachers()}
+    courses = {c.code: c for c in sms.list_courses()}
+
+    for course in courses.values():
+        for student in course.students_view:
+            assert students.get(student.id) is student
+            assert course in student.courses_view
+        if course.teacher is not None:
+            assert teachers.get(course.teacher.id) is course.teacher
+            assert course in course.teacher.courses_view
+        for student in course.waitlist:
+            assert students.get(student.id) is student
+            assert course in student.waitlisted_courses
+            assert student not in course.students_view
+        assert course.is_full or not course.waitlist
+        grades = [g for g in (s.get_grade(course) for s in course.students_view) if g is not None]
+        summary = course.grade_summary
+        assert summary.count == len(grades)
+        assert summary.mean == (pytest.approx(sum(grades) / len(grades)) if grades else None)
+
+    for student in students.values():
+        for course in student.courses_view:
+            assert courses.get(course.code) is course
+            assert student in course.students_view
+        assert set(student.grades_view) <= set(student.courses_view)
+        for course in student.waitlisted_courses:
+            assert courses.get(course.code) is course
+            assert course.is_waitlisted(student)
+
+    for teacher in teachers.values():
+        for course in teacher.courses_view:
+            assert courses.get(course.code) is course
+            assert course.teacher is teacher
+
+    for query in (CourseQuery(has_teacher=False), CourseQuery(min_students=3)):
+        assert sms.find_courses(query) == tuple(
+            c for c in sorted(courses.values(), key=lambda c: c.code) if query.matches(c)
+        )
+
+
+def test_concurrent_use_cases_keep_relationships_consistent(shared_sms):
+    errors = []
+
+    def worker(seed):
+        try:
+            random_operations(shared_sms, seed, 1500)
+        except BaseException as error:    # surfaced in the main thread below
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads), "deadlock"
+    assert errors == []
+    assert_bidirectional_invariants(shared_sms)
+
+
+def test_transactions_are_per_thread(shared_sms):
+    started, release = threading.Event(), threading.Event()
+
+    def long_transaction():
+        with shared_sms.transaction():
+            shared_sms.enroll_student_in_course("S00", "C00")
+            started.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=long_transaction)
+    thread.start()
+    started.wait(5)
+    # Not part of the other thread's open transaction: applied immediately.
+    shared_sms.enroll_student_in_course("S01", "C01")
+    with pytest.raises(KeyError):
+        with shared_sms.transaction():
+            shared_sms.enroll_student_in_course("S02", "C01")
+            raise KeyError("abort only this thread's transaction")
+    release.set()
+    thread.join(5)
+
+    assert [s.id for s in shared_sms.get_course("C00").students] == ["S00"]
+    assert [s.id for s in shared_sms.get_course("C01").students] == ["S01"]
+
+
+class _PausingJournal:
+    """Records appended events; pauses while appending StudentAdded."""
+
+    def __init__(self):
+        self.events = []
+        self.paused, self.release = threading.Event(), threading.Event()
+
+    def append(self, events):
+        if any(isinstance(event, StudentAdded) for event in events):
+            self.paused.set()
+            self.release.wait(5)
+        self.events.extend(events)
+
+
+def test_a_new_entity_is_journaled_before_any_use_case_on_it(shared_sms):
+    journal = _PausingJournal()
+    sms = StudentManagementSystem(
+        shared_sms.student_repo, shared_sms.teacher_repo, shared_sms.course_repo,
+        journal=journal, thread_safe=True,
+    )
+    adding = threading.Thread(target=sms.add_student, args=("S99", "New"))
+    adding.start()
+    journal.paused.wait(5)
+
+    # S99 is already in the repository, but enrolling it waits for its lock.
+    enrolling = threading.Thread(target=sms.enroll_student_in_course, args=("S99", "C00"))
+    enrolling.start()
+    enrolling.join(0.2)
+    journal.release.set()
+    adding.join(5)
+    enrolling.join(5)
+
+    assert journal.events == [StudentAdded("S99", "New"), Enrolled("S99", "C00")]
+
+
+def test_imported_entities_are_journaled_before_any_use_case_on_them(shared_sms):
+    journal = _PausingJournal()
+    sms = StudentManagementSystem(
+        shared_sms.student_repo, shared_sms.teacher_repo, shared_sms.course_repo,
+        journal=journal, thread_safe=True,
+    )
+    importing = threading.Thread(target=sms.import_students, args=([("S99", "New")],))
+    importing.start()
+    journal.paused.wait(5)
+
+    enrolling = threading.Thread(target=sms.enroll_student_in_course, args=("S99", "C00"))
+    enrolling.start()
+    enrolling.join(0.2)
+    journal.release.set()
+    importing.join(5)
+    enrolling.join(5)
+
+    assert journal.events == [StudentAdded("S99", "New"), Enrolled("S99", "C00")]
+
+
+def test_a_transaction_journals_its_events_before_later_use_cases_on_its_entities(shared_sms):
+    journal = _PausingJournal()
+    sms = StudentManagementSystem(
+        shared_sms.student_repo, shared_sms.teacher_repo, shared_sms.course_repo,
+        journal=journal, thread_safe=True,
+    )
+
+    def add_in_transaction():
+        with sms.transaction():
+            sms.add_student("S99", "New")
+
+    committing = threading.Thread(target=add_in_transaction)
+    committing.start()
+    journal.paused.wait(5)
+
+    # S99 was added when the use case ran, but the commit holds every lock.
+    enrolling = threading.Thread(target=sms.enroll_student_in_course, args=("S99", "C00"))
+    enrolling.start()
+    enrolling.join(0.2)
+    journal.release.set()
+    committing.join(5)
+    enrolling.join(5)
+
+    assert journal.events == [StudentAdded("S99", "New"), Enrolled("S99", "C00")]
+
+
+def test_a_batch_holds_off_removals_of_its_entities_until_it_is_saved(shared_sms):
+    removing = threading.Thread(target=shared_sms.remove_course, args=("C00",))
+
+    def pairs():
+        yield "S00", "C00"
+        removing.start()
+        removing.join(0.2)    # blocked: the batch has C00 in hand
+        yield "S01", "C00"
+
+    report = shared_sms.enroll_students_in_courses(pairs())
+    removing.join(5)
+
+    assert report.failed == ()
+    with pytest.raises(EntityNotFoundError):
+        shared_sms.get_course("C00")
+    assert shared_sms.get_student("S00").courses == ()
+    assert shared_sms.get_student("S01").courses == ()
@@ -0,0 +1,140 @@
+# tests/system/test_event_replay.py
+
+import pytest
+
+from application.services.event_replay import recover, replay_events
+from application.services.student_management_system import StudentManagementSystem
+from domain.events.domain_events import CourseAdded, CourseRemoved, Enrolled, StudentAdded
+from infrastructure.in_memory.in_memory_course_repository import InMemoryCourseRepository
+from infrastructure.in_memory.in_memory_student_repository import InMemoryStudentRepository
+from infrastructure.in_memory.in_memory_teacher_repository import InMemoryTeacherRepository
+from infrastructure.journal.binary_event_journal import BinaryEventJournal
+from infrastructure.journal.binary_snapshot_store import BinarySnapshotStore
+
+
+@pytest.fixture
+def journaled(sms, tmp_path):
+    """The sms fixture's repositories behind a journaling service."""
+    journal = BinaryEventJournal(str(tmp_path / "events.journal"))
+    yield StudentManagementSystem(
+        sms.student_repo, sms.teacher_repo, sms.course_repo,
+        unit_of_work=sms.unit_of_work, journal=journal,
+    ), journal
+    journal.close()
+
+
+def _state(student_repo, teacher_repo, course_repo):
+    return (
+        {s.id: (s.name, sorted(c.code for c in s.courses),
+                sorted((c.code, g) for c, g in s.grades_view.items()))
+         for s in student_repo.list_all()},
+        {t.id: (t.name, sorted(c.code for c in t.courses)) for t in teacher_repo.list_all()},
+        {c.code: (c.name, c.teacher.id if c.teacher else None, sorted(s.id for s in c.students),
+                  c.capacity, [s.id for s in c.waitlist])
+         for c in course_repo.list_all()},
+    )
+
+
+def _rebuild(journal):
+    repos = InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    replay_events(journal.replay(), *repos)
+    return repos
+
+
+def test_replaying_the_journal_rebuilds_the_same_state(journaled):
+    sms, journal = journaled
+    for i in range(4):
+        sms.add_student(f"S0{i}", f"Student {i}")
+    sms.add_teacher("T01", "Ada")
+    sms.add_teacher("T02", "Grace")
+    for code in ("C01", "C02", "C03"):
+        sms.add_course(code, code)
+    sms.assign_teacher_to_course("T01", "C01")
+    sms.assign_teacher_to_course("T02", "C02")
+    sms.assign_teacher_to_course("T02", "C03")
+    sms.enroll_students_in_courses([("S00", "C01"), ("S01", "C01"), ("S02", "C02"), ("S03", "C03")])
+    sms.enroll_student_in_course("S00", "C02")
+    sms.import_grades(["S00", "S01", "S09"], ["C01", "C01", "C01"], [8.0, 6.5, 5.0])
+    sms.assign_grade_to_student("S02", "C02", 9.0)
+    sms.assign_grade_to_student("S00", "C01", 9.5)
+    sms.remove_grade_from_student("S01", "C01")
+    sms.drop_student_from_course("S00", "C02")
+    sms.unassign_teacher_from_course("C01")
+    sms.remove_teacher("T02")
+    sms.remove_student("S03")
+    sms.remove_course("C02")
+    sms.add_course("C02", "Physics again")
+
+    expected = _state(sms.student_repo, sms.teacher_repo, sms.course_repo)
+    assert _state(*_rebuild(journal)) == expected
+
+
+def test_replay_reproduces_waitlists_and_the_promotions_they_led_to(journaled):
+    sms, journal = journaled
+    sms.add_course("C01", "Math", capacity=1)
+    sms.add_course("C02", "Art", capacity=0)
+    for i in range(5):
+        sms.add_student(f"S0{i}", f"Student {i}")
+        sms.register_student_in_course(f"S0{i}", "C01", priority=float(5 - i))
+        sms.register_student_in_course(f"S0{i}", "C02")
+    sms.leave_waitlist("S04", "C01")
+    sms.drop_student_from_course("S00", "C01")       # promotes S03
+    sms.set_course_capacity("C01", 3)                # promotes S02, S01
+    sms.remove_student("S02")
+    sms.clear_waitlists(["C02"])
+
+    rebuilt = _rebuild(journal)
+    assert _state(*rebuilt) == _state(sms.student_repo, sms.teacher_repo, sms.course_repo)
+    assert [s.id for s in rebuilt[2].get("C01").students] == ["S03", "S01"]
+    assert rebuilt[2].get("C01").capacity == 3
+
+
+def test_transactions_are_journaled_only_when_they_commit(journaled):
+    sms, journal = journaled
+    sms.add_student("S01", "Alice")
+    sms.add_course("C01", "Math")
+
+    with pytest.raises(RuntimeError):
+        with sms.transaction():
+            sms.enroll_student_in_course("S01", "C01")
+            raise RuntimeError("abort")
+    assert list(journal.replay()) == [StudentAdded("S01", "Alice"), CourseAdded("C01", "Math")]
+
+    with sms.transaction():
+        sms.enroll_student_in_course("S01", "C01")
+        sms.remove_course("C01")
+    assert list(journal.replay())[2:] == [Enrolled("S01", "C01"), CourseRemoved("C01")]
+
+
+def test_recovery_loads_the_checkpoint_and_replays_only_the_tail(journaled, tmp_path):
+    sms, journal = journaled
+    snapshots = BinarySnapshotStore(str(tmp_path / "state.snapshot"))
+    sms.add_teacher("T01", "Ada")
+    sms.add_course("C01", "Math")
+    sms.assign_teacher_to_course("T01", "C01")
+    for i in range(5):
+        sms.add_student(f"S0{i}", "Student")
+        sms.enroll_student_in_course(f"S0{i}", "C01")
+        sms.assign_grade_to_student(f"S0{i}", "C01", float(i))
+
+    assert not sms.checkpoint(snapshots, min_events=100)
+    assert sms.checkpoint(snapshots, min_events=10)
+    assert not sms.checkpoint(snapshots, min_events=1)
+
+    sms.remove_student("S00")
+    sms.add_course("C02", "Physics")
+    sms.enroll_student_in_course("S01", "C02")
+
+    repos = InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    assert recover(snapshots, journal, *repos) == 3
+    assert _state(*repos) == _state(sms.student_repo, sms.teacher_repo, sms.course_repo)
+    assert repos[2].get("C01").average_grade == 2.5
+
+
+def test_recovery_without_a_snapshot_replays_everything(journaled, tmp_path):
+    sms, journal = journaled
+    sms.add_student("S01", "Alice")
+    sms.add_course("C01", "Math")
+
+    repos = InMemoryStudentRepository(), InMemoryTeacherRepository(), InMemoryCourseRepository()
+    assert recover(BinarySnapshotStore(str(tmp_path / "none.snapshot")), journal, *repos) == 2
@@ -0,0 +1,70 @@
+# tests/system/test_queries.py
+
+import pytest
+
+from domain.repositories.queries import CourseQuery, StudentQuery, TeacherQuery
+
+
+def codes(courses):
+    return [course.code for course in courses]
+
+
+@pytest.fixture
+def campus(sms):
+    """Three courses: C01 (Ada, 2 students), C02 (Ada, 0), C03 (nobody, 1)."""
+    sms.add_teacher("T01", "Ada")
+    sms.add_teacher("T02", "Alan")
+    for student_id, name in [("S01", "Alice"), ("S02", "alfred"), ("S03", "Bob")]:
+        sms.add_student(student_id, name)
+    sms.add_course("C01", "Algebra")
+    sms.add_course("C02", "Algorithms")
+    sms.add_course("C03", "Biology")
+    sms.assign_teacher_to_course("T01", "C01")
+    sms.assign_teacher_to_course("T01", "C02")
+    sms.enroll_student_in_course("S01", "C01")
+    sms.enroll_student_in_course("S02", "C01")
+    sms.enroll_student_in_course("S03", "C03")
+    return sms
+
+
+def test_name_prefix_queries_are_case_insensitive_and_ordered_by_id(campus):
+    assert [s.id for s in campus.find_students(StudentQuery(name_prefix="AL"))] == ["S01", "S02"]
+    assert [t.id for t in campus.find_teachers(TeacherQuery(name_prefix="ada"))] == ["T01"]
+    assert codes(campus.find_courses(CourseQuery(name_prefix="Algo"))) == ["C02"]
+    assert codes(campus.find_courses(CourseQuery(name_prefix="x"))) == []
+
+
+def test_course_queries_by_teacher_and_enrollment_size(campus):
+    assert codes(campus.find_courses(CourseQuery(teacher_id="T01"))) == ["C01", "C02"]
+    assert codes(campus.find_courses(CourseQuery(has_teacher=False))) == ["C03"]
+    assert codes(campus.find_courses(CourseQuery(min_students=1))) == ["C01", "C03"]
+    assert codes(campus.find_courses(CourseQuery(teacher_id="T01", max_students=0))) == ["C02"]
+    assert codes(campus.find_courses(CourseQuery())) == ["C01", "C02", "C03"]
+
+
+def test_queries_follow_enroll_drop_unassign_and_removals(campus):
+    campus.drop_student_from_course("S01", "C01")
+    campus.enroll_student_in_course("S01", "C02")
+    campus.unassign_teacher_from_course("C02")
+    campus.remove_student("S02")
+
+    assert codes(campus.find_courses(CourseQuery(min_students=1, max_students=1))) == ["C02", "C03"]
+    assert codes(campus.find_courses(CourseQuery(has_teacher=False))) == ["C02", "C03"]
+
+    campus.remove_teacher("T01")
+    campus.remove_course("C03")
+
+    assert codes(campus.find_courses(CourseQuery(has_teacher=True))) == []
+    assert codes(campus.find_courses(CourseQuery(max_students=0))) == ["C01"]
+    assert [s.id for s in campus.find_students(StudentQuery(name_prefix="a"))] == ["S01"]
+
+
+def test_queries_are_unchanged_by_a_rolled_back_transaction(campus):
+    with pytest.raises(RuntimeError):
+        with campus.transaction():
+            campus.enroll_student_in_course("S03", "C02")
+            campus.remove_course("C01")
+            raise RuntimeError("abort")
+
+    assert codes(campus.find_courses(CourseQuery(min_students=1))) == ["C01", "C03"]
+    assert codes(campus.find_courses(CourseQuery(teacher_id="T01"))) == ["C01", "C02"]
@@ -1,10 +1,20 @@
 # tests/system/test_student_management_system.py
 
+from array import array
+
 import pytest
+
+from application.responses.grade_import_report import (
+    OUT_OF_RANGE,
+    UNKNOWN_STUDENT,
+    UNKNOWN_COURSE,
+    NOT_ENROLLED,
+)
 from domain.exceptions.domain_exceptions import (
     EnrollmentError,
     TeacherAssignmentError,
     GradeError,
+    EntityNotFoundError,
 )
 # 1. -------------------------------------------------------------
 # Create entities
@@ -146,3 +156,174 @@ def test_remove_teacher_cleanup(sms):
 
     assert course.teacher is None
 
+
+
+# -------------------------------------------------------------------
+# 8. Bulk enrollment applies valid pairs and reports failures per pair
+# -------------------------------------------------------------------
+
+def test_bulk_enrollment_enrolls_valid_pairs_and_reports_each_failure(sms):
+    sms.add_student("S01", "Alice")
+    sms.add_student("S02", "Bob")
+    sms.add_course("C01", "Math")
+    sms.add_course("C02", "Physics")
+
+    report = sms.enroll_students_in_courses([
+        ("S01", "C01"),
+        ("S02", "C01"),
+        ("S01", "C02"),
+        ("S01", "C01"),    # duplicate enrollment
+        ("S99", "C01"),    # unknown student
+        ("S02", "C99"),    # unknown course
+    ])
+
+    math = sms.get_course("C01")
+    assert math.students == (sms.get_student("S01"), sms.get_student("S02"))
+    assert sms.get_course("C02").students == (sms.get_student("S01"),)
+
+    assert report.success_count == 3
+    assert report.failure_count == 3
+    assert [r.succeeded for r in report.results] == [True, True, True, False, False, False]
+    assert isinstance(report.results[3].error, EnrollmentError)
+    assert isinstance(report.results[4].error, EntityNotFoundError)
+    assert isinstance(report.results[5].error, EntityNotFoundError)
+    assert (report.failed[0].student_id, report.failed[0].course_code) == ("S01", "C01")
+
+
+def test_bulk_enrollment_looks_up_each_distinct_id_only_once(sms, monkeypatch):
+    sms.add_student("S01", "Alice")
+    sms.add_course("C01", "Math")
+    sms.add_course("C02", "Physics")
+    lookups = []
+    original_get = sms.student_repo.get
+    monkeypatch.setattr(
+        sms.student_repo, "get", lambda key: lookups.append(key) or original_get(key)
+    )
+
+    report = sms.enroll_students_in_courses(
+        [("S01", "C01"), ("S01", "C02"), ("S99", "C01"), ("S99", "C02")]
+    )
+
+    assert lookups == ["S01", "S99"]
+    assert report.success_count == 2
+
+
+# -------------------------------------------------------------------
+# 9. Bulk grade import writes valid rows and reports rejected rows
+# -------------------------------------------------------------------
+
+def test_grade_import_assigns_valid_rows_and_rejects_invalid_rows_by_reason(sms):
+    sms.add_student("S01", "Alice")
+    sms.add_student("S02", "Bob")
+    sms.add_course("C01", "Math")
+    sms.enroll_students_in_courses([("S01", "C01"), ("S02", "C01")])
+
+    report = sms.import_grades(
+        ["S01", "S02", "S01", "S99", "S02", "S01"],
+        ["C01", "C01", "C01", "C01", "C99", "C02"],
+        array("d", [7.5, 11.0, 8.0, 5.0, 5.0, float("nan")]),
+    )
+
+    # Later rows overwrite earlier ones for the same (student, course)
+    assert sms.get_student_grade("S01", "C01") == 8.0
+    assert sms.get_student_grade("S02", "C01") is None
+
+    assert report.accepted_count == 2
+    assert report.rejected == {
+        OUT_OF_RANGE: [1, 5],
+        UNKNOWN_STUDENT: [3],
+        UNKNOWN_COURSE: [4],
+    }
+    assert report.rejected_rows == [1, 3, 4, 5]
+
+
+def test_grade_import_rejects_rows_for_students_not_enrolled_in_the_course(sms):
+    sms.add_student("S01", "Alice")
+    sms.add_course("C01", "Math")
+
+    report = sms.import_grades(["S01"], ["C01"], [9.0])
+
+    assert report.accepted_count == 0
+    assert report.rejected == {NOT_ENROLLED: [0]}
+    assert sms.get_student_grade("S01", "C01") is None
+
+
+def test_grade_import_with_columns_of_different_lengths_raises_valueerror(sms):
+    with pytest.raises(ValueError):
+        sms.import_grades(["S01", "S02"], ["C01"], [9.0, 8.0])
+
+
+# -------------------------------------------------------------------
+# 10. Paging and streaming return entities in id order
+# -------------------------------------------------------------------
+
+def test_paging_through_students_returns_every_student_once_in_id_order(sms):
+    for student_id in ["S05", "S01", "S04", "S02", "S03"]:
+        sms.add_student(student_id, f"Student {student_id}")
+
+    first = sms.list_students_page(limit=2)
+    second = sms.list_students_page(limit=2, after_id=first.next_after)
+    third = sms.list_students_page(limit=2, after_id=second.next_after)
+
+    assert [s.id for s in first.items] == ["S01", "S02"]
+    assert [s.id for s in second.items] == ["S03", "S04"]
+    assert [s.id for s in third.items] == ["S05"]
+    assert third.next_after is None
+
+
+def test_paging_stays_consistent_when_entities_are_added_and_removed_between_pages(sms):
+    for code in ["C01", "C02", "C03", "C04"]:
+        sms.add_course(code, "Course")
+
+    first = sms.list_courses_page(limit=2)
+    sms.remove_course("C03")
+    sms.add_course("C00", "Before the cursor")
+    sms.add_course("C05", "After the cursor")
+    rest = sms.list_courses_page(limit=10, after_code=first.next_after)
+
+    assert [c.code for c in first.items] == ["C01", "C02"]
+    assert [c.code for c in rest.items] == ["C04", "C05"]
+    assert rest.next_after is None
+
+
+def test_streaming_teachers_yields_all_teachers_lazily_in_id_order(sms):
+    for teacher_id in ["T03", "T01", "T02"]:
+        sms.add_teacher(teacher_id, "Teacher")
+
+    stream = sms.stream_teachers(batch_size=2)
+
+    assert next(stream).id == "T01"
+    assert [t.id for t in stream] == ["T02", "T03"]
+
+
+def test_requesting_a_page_with_a_non_positive_limit_raises_valueerror(sms):
+    with pytest.raises(ValueError):
+        sms.list_students_page(limit=0)
+
+
+# -------------------------------------------------------------------
+# 11. GPA and course grade summaries
+# -------------------------------------------------------------------
+
+def test_course_grade_summary_and_student_gpa_track_grade_changes(sms):
+    sms.add_student("S01", "Alice")
+    sms.add_student("S02", "Bob")
+    sms.add_course("C01", "Math")
+    sms.add_course("C02", "Art")
+    for student_id, course_code in [("S01", "C01"), ("S02", "C01"), ("S01", "C02")]:
+        sms.enroll_student_in_course(student_id, course_code)
+
+    sms.assign_grade_to_student("S01", "C01", 8.0)
+    sms.assign_grade_to_student("S02", "C01", 4.0)
+    sms.assign_grade_to_student("S01", "C02", 10.0)
+    summary = sms.get_course_grade_summary("C01")
+
+    assert (summary.count, summary.mean, summary.variance) == (2, 6.0, 4.0)
+    assert (summary.minimum, summary.maximum, summary.stddev) == (4.0, 8.0, 2.0)
+    assert sms.get_student_gpa("S01") == 9.0
+
+    sms.drop_student_from_course("S01", "C01")
+
+    assert sms.get_course_grade_summary("C01").mean == 4.0
+    assert sms.get_student_gpa("S01") == 10.0
+    assert sms.get_student_gpa("S02") == 4.0
@@ -0,0 +1,66 @@
+# tests/system/test_synthetic_dataset.py
+
+from collections import Counter
+
+import pytest
+
+from application.services.synthetic_dataset import DatasetSpec, SyntheticDataset
+
+SMALL = DatasetSpec(students=200, courses=20, seed=3)
+
+
+def test_the_same_spec_always_produces_the_same_rows():
+    first, second = SyntheticDataset(SMALL), SyntheticDataset(SMALL)
+    other = SyntheticDataset(DatasetSpec(students=200, courses=20, seed=4))
+
+    assert list(first.student_rows()) == list(second.student_rows())
+    assert list(first.grade_rows()) == list(second.grade_rows())
+    assert list(first.enrollment_rows()) != list(other.enrollment_rows())
+
+
+def test_ids_are_fixed_width_and_sort_in_creation_order():
+    dataset = SyntheticDataset(DatasetSpec(students=1_000, courses=5))
+    ids = [student_id for student_id, _ in dataset.student_rows()]
+
+    assert ids[0] == "S000" and ids[-1] == "S999"
+    assert ids == sorted(ids)
+
+
+def test_course_popularity_is_skewed_and_capacity_is_respected():
+    dataset = SyntheticDataset(DatasetSpec(students=2_000, courses=50, seed=1))
+    counts = Counter(code for _, code in dataset.enrollment_rows())
+    most, median = counts.most_common()[0][1], sorted(counts.values())[len(counts) // 2]
+    assert most > 5 * median
+
+    capped = SyntheticDataset(DatasetSpec(students=2_000, courses=50, capacity=100, seed=1))
+    capped_counts = Counter(code for _, code in capped.enrollment_rows())
+    assert max(capped_counts.values()) == 100
+
+
+def test_grades_fall_in_range_and_only_for_enrollments():
+    dataset = SyntheticDataset(SMALL)
+    enrolled = set(dataset.enrollment_rows())
+    grades = list(dataset.grade_rows())
+
+    assert all(0.0 <= value <= 10.0 and value * 2 == int(value * 2) for _, _, value in grades)
+    assert {(student_id, code) for student_id, code, _ in grades} <= enrolled
+    assert 0.6 < len(grades) / len(enrolled) < 0.95
+
+
+@pytest.mark.parametrize("field", ["students", "min_courses", "capacity"])
+def test_invalid_specs_are_rejected(field):
+    with pytest.raises(ValueError):
+        DatasetSpec(**{field: -1})
+
+
+def test_the_dataset_loads_into_every_backend(sms):
+    dataset = SyntheticDataset(SMALL)
+    dataset.load(sms)
+
+    enrollments = list(dataset.enrollment_rows())
+    assert len(sms.list_students()) == SMALL.students
+    assert sum(len(course.students) for course in sms.list_courses()) == len(enrollments)
+    student_id, code, value = next(dataset.grade_rows())
+    assert sms.get_student(student_id).get_grade(sms.get_course(code)) == value
+    teacher_id, code = next(dataset.assignment_rows())
+    assert sms.get_course(code).teacher.id == teacher_id
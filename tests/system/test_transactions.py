@@ -0,0 +1,132 @@
+# tests/system/test_transactions.py
+
+import pytest
+
+from domain.exceptions.domain_exceptions import EnrollmentError
+
+
+class _Boom(Exception):
+    pass
+
+
+def _seed(sms):
+    sms.add_student("S01", "Alice")
+    sms.add_student("S02", "Bob")
+    sms.add_teacher("T01", "Dr. Smith")
+    sms.add_course("C01", "Math")
+    sms.assign_teacher_to_course("T01", "C01")
+    sms.enroll_student_in_course("S01", "C01")
+    sms.assign_grade_to_student("S01", "C01", 7.0)
+
+
+# -------------------------------------------------------------------
+# A committed transaction applies every use case in it
+# -------------------------------------------------------------------
+def test_committing_a_transaction_applies_all_changes(sms):
+    _seed(sms)
+
+    with sms.transaction():
+        sms.enroll_student_in_course("S02", "C01")
+        sms.assign_grade_to_student("S02", "C01", 9.0)
+        sms.add_course("C02", "Physics")
+        sms.enroll_student_in_course("S01", "C02")
+
+    course = sms.get_course("C01")
+    assert [s.id for s in course.students] == ["S01", "S02"]
+    assert sms.get_student_grade("S02", "C01") == 9.0
+    assert [c.code for c in sms.get_student("S01").courses] == ["C01", "C02"]
+
+
+# -------------------------------------------------------------------
+# A failing transaction leaves the system exactly as it was
+# -------------------------------------------------------------------
+def test_an_exception_inside_a_transaction_rolls_back_every_change(sms):
+    _seed(sms)
+    alice, course = sms.get_student("S01"), sms.get_course("C01")
+
+    with pytest.raises(_Boom):
+        with sms.transaction():
+            sms.add_student("S03", "Carol")
+            sms.enroll_student_in_course("S03", "C01")
+            sms.enroll_student_in_course("S02", "C01")
+            sms.assign_grade_to_student("S01", "C01", 2.0)
+            sms.unassign_teacher_from_course("C01")
+            sms.remove_student("S01")
+            raise _Boom()
+
+    assert sorted(s.id for s in sms.list_students()) == ["S01", "S02"]
+    assert sms.get_student("S01") is alice
+    assert sms.get_course("C01").students == (alice,)
+    assert sms.get_student("S02").courses == ()
+    assert sms.get_student_grade("S01", "C01") == 7.0
+    assert course.teacher is sms.get_teacher("T01")
+    assert course in sms.get_teacher("T01").courses
+
+
+def test_a_domain_error_inside_a_transaction_rolls_back_earlier_steps(sms):
+    _seed(sms)
+
+    with pytest.raises(EnrollmentError):
+        with sms.transaction():
+            sms.enroll_student_in_course("S02", "C01")
+            sms.enroll_student_in_course("S01", "C01")    # already enrolled
+
+    assert [s.id for s in sms.get_course("C01").students] == ["S01"]
+    assert sms.get_student("S02").courses == ()
+
+
+def test_live_views_taken_before_a_rollback_show_the_restored_state(sms):
+    _seed(sms)
+    roster = sms.get_course("C01").students_view
+    courses = sms.get_student("S02").courses_view
+    taught = sms.get_teacher("T01").courses_view
+
+    with pytest.raises(_Boom):
+        with sms.transaction():
+            sms.enroll_student_in_course("S02", "C01")
+            sms.unassign_teacher_from_course("C01")
+            raise _Boom()
+
+    assert [s.id for s in roster] == ["S01"]
+    assert list(courses) == []
+    assert [c.code for c in taught] == ["C01"]
+
+
+# -------------------------------------------------------------------
+# Write-backs are batched: one update per modified entity
+# -------------------------------------------------------------------
+def test_a_transaction_writes_each_modified_course_back_once(sms, monkeypatch):
+    _seed(sms)
+    updates = []
+    original_update = sms.course_repo.update
+    monkeypatch.setattr(
+        sms.course_repo, "update", lambda course: updates.append(course.code) or original_update(course)
+    )
+
+    with sms.transaction():
+        sms.enroll_student_in_course("S02", "C01")
+        sms.drop_student_from_course("S01", "C01")
+        sms.enroll_student_in_course("S01", "C01")
+
+    assert updates == ["C01"]
+    assert [s.id for s in sms.get_course("C01").students] == ["S02", "S01"]
+
+
+# -------------------------------------------------------------------
+# remove_course is atomic even when the final repository step fails
+# -------------------------------------------------------------------
+def test_remove_course_that_fails_midway_leaves_relationships_intact(sms, monkeypatch):
+    _seed(sms)
+
+    def failing_remove(course_code):
+        raise _Boom()
+
+    monkeypatch.setattr(sms.course_repo, "remove", failing_remove)
+
+    with pytest.raises(_Boom):
+        sms.remove_course("C01")
+
+    course = sms.get_course("C01")
+    assert course.teacher is sms.get_teacher("T01")
+    assert course.students == (sms.get_student("S01"),)
+    assert sms.get_student_grade("S01", "C01") == 7.0
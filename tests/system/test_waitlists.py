@@ -0,0 +1,119 @@
+# tests/system/test_waitlists.py
+
+import pytest
+
+from domain.exceptions.domain_exceptions import EnrollmentError, EntityNotFoundError
+
+
+@pytest.fixture
+def full_course(sms):
+    """C01 with one seat, taken by S01; S02 and S03 waitlisted in that order."""
+    sms.add_course("C01", "Math", capacity=1)
+    for student_id in ("S01", "S02", "S03"):
+        sms.add_student(student_id, student_id)
+        sms.register_student_in_course(student_id, "C01")
+    return sms
+
+
+def _roster(sms, code):
+    return [student.id for student in sms.get_course(code).students]
+
+
+def _waitlist(sms, code):
+    return [student.id for student in sms.get_course(code).waitlist]
+
+
+def test_registering_beyond_capacity_waitlists_in_order(full_course):
+    assert _roster(full_course, "C01") == ["S01"]
+    assert _waitlist(full_course, "C01") == ["S02", "S03"]
+    with pytest.raises(EnrollmentError):
+        full_course.enroll_student_in_course("S02", "C01")
+
+
+def test_dropping_a_student_promotes_the_next_waitlisted_student(full_course):
+    full_course.drop_student_from_course("S01", "C01")
+
+    assert _roster(full_course, "C01") == ["S02"]
+    assert _waitlist(full_course, "C01") == ["S03"]
+    assert [c.code for c in full_course.get_student("S02").courses] == ["C01"]
+    assert full_course.get_student("S02").waitlisted_courses == ()
+
+
+def test_removing_students_promotes_into_their_seats_and_leaves_waitlists(full_course):
+    full_course.remove_student("S02")    # waitlisted
+    full_course.remove_student("S01")    # enrolled
+
+    assert _roster(full_course, "C01") == ["S03"]
+    assert _waitlist(full_course, "C01") == []
+    with pytest.raises(EntityNotFoundError):
+        full_course.get_student("S02")
+
+
+def test_raising_and_lifting_capacity_fills_seats_from_the_waitlist(full_course):
+    full_course.set_course_capacity("C01", 2)
+    assert _roster(full_course, "C01") == ["S01", "S02"]
+
+    full_course.set_course_capacity("C01", None)
+    assert _roster(full_course, "C01") == ["S01", "S02", "S03"]
+    assert full_course.get_course("C01").capacity is None
+
+
+def test_priority_orders_the_waitlist_ahead_of_arrival(sms):
+    sms.add_course("C01", "Math", capacity=0)
+    for student_id, priority in (("S01", 30.0), ("S02", 10.0), ("S03", 20.0)):
+        sms.add_student(student_id, student_id)
+        assert sms.register_student_in_course(student_id, "C01", priority) is False
+
+    sms.leave_waitlist("S03", "C01")
+    sms.set_course_capacity("C01", 1)
+
+    assert _roster(sms, "C01") == ["S02"]
+    assert _waitlist(sms, "C01") == ["S01"]
+
+
+def test_a_failed_transaction_restores_the_waitlist_and_the_dropped_seat(full_course):
+    with pytest.raises(EnrollmentError):
+        with full_course.transaction():
+            full_course.drop_student_from_course("S01", "C01")
+            full_course.enroll_student_in_course("S02", "C01")    # already promoted
+
+    assert _roster(full_course, "C01") == ["S01"]
+    assert _waitlist(full_course, "C01") == ["S02", "S03"]
+    assert full_course.get_student("S02").courses == ()
+
+
+def test_bulk_registration_reports_enrolled_waitlisted_and_failed_requests(sms):
+    sms.add_course("C01", "Math", capacity=1)
+    sms.add_course("C02", "Art", capacity=1)
+    for student_id in ("S01", "S02"):
+        sms.add_student(student_id, student_id)
+
+    report = sms.register_students_in_courses([
+        ("S01", "C01", 0.0), ("S02", "C01", 0.0), ("S01", "C02", 0.0),
+        ("S01", "C01", 0.0), ("S99", "C02", 0.0),
+    ])
+
+    assert [(r.student_id, r.course_code) for r in report.waitlisted] == [("S02", "C01")]
+    assert report.success_count == 3 and report.failure_count == 2
+    assert _roster(sms, "C01") == ["S01"] and _waitlist(sms, "C01") == ["S02"]
+
+
+def test_clearing_waitlists_empties_every_given_course_at_once(sms):
+    for code in ("C01", "C02", "C03"):
+        sms.add_course(code, code, capacity=0)
+    for student_id in ("S01", "S02"):
+        sms.add_student(student_id, student_id)
+        for code in ("C01", "C02"):
+            sms.register_student_in_course(student_id, code)
+
+    assert sms.clear_waitlists(["C01", "C02", "C03"]) == 4
+
+    assert _waitlist(sms, "C01") == [] and _waitlist(sms, "C02") == []
+    assert sms.get_student("S01").waitlisted_courses == ()
+
+
+def test_removing_a_course_clears_its_waitlist(full_course):
+    full_course.remove_course("C01")
+
+    assert full_course.get_student("S02").waitlisted_courses == ()
+    assert full_course.get_student("S01").courses == ()